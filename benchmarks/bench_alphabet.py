@@ -0,0 +1,94 @@
+# Per-guess cost of reading raw input with the alphabet tables, for the
+# English alphabet, a Swedish one and one of a few hundred letters, against
+# normalizing every guess with unicodedata.
+#
+#   python benchmarks/bench_alphabet.py [--games 20000]
+import argparse
+import random
+import time
+import unicodedata
+
+from typing import Callable
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+from wordguess import engine
+
+SWEDISH = engine.Alphabet("ABCDEFGHIJKLMNOPQRSTUVWXYZÅÄÖ")
+# Cyrillic and Greek letters then CJK ideographs, 300 letters in all
+LARGE = engine.Alphabet(
+    [chr(x) for x in range(0x0410, 0x0430)] +
+    [chr(x) for x in range(0x0391, 0x03A2)] +
+    [chr(x) for x in range(0x03A3, 0x03AA)] +
+    [chr(0x4E00 + i) for i in range(300 - 32 - 17 - 7)])
+
+
+def make_games(alphabet: engine.Alphabet,
+               count: int,
+               seed: int = 0) -> List[List[str]]:
+    # a word and the letters guessed for it, typed in lower case
+    rng = random.Random(seed)
+    letters = alphabet.letters
+    games = []
+    for _ in range(count):
+        word = "".join(rng.choices(letters, k=rng.randint(4, 12)))
+        guesses = rng.sample(letters, min(len(letters), 20))
+        games.append([word] + [x.lower() for x in guesses])
+    return games
+
+
+def run_tables(alphabet: engine.Alphabet, games: List[List[str]]) -> int:
+    guesses = 0
+    playing = engine.Status.playing
+    for word, *letters in games:
+        game = engine.GameState(word, len(alphabet) + 1, alphabet=alphabet)
+        for letter in letters:
+            game.guess(letter)
+            guesses += 1
+            if game.status != playing:
+                break
+    return guesses
+
+
+def run_normalize(alphabet: engine.Alphabet, games: List[List[str]]) -> int:
+    # the checks guess() makes, with NFKC and upper() on every guess
+    # instead of the tables
+    guesses = 0
+    playing = engine.Status.playing
+    letter_set = alphabet.letter_set
+    for word, *letters in games:
+        game = engine.GameState(word, len(alphabet) + 1, alphabet=alphabet)
+        for letter in letters:
+            guess = unicodedata.normalize("NFKC", letter).upper()
+            if guess and letter_set.issuperset(guess) and len(guess) == 1:
+                game.guess_letter(guess)
+            guesses += 1
+            if game.status != playing:
+                break
+    return guesses
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=20_000)
+    args = parser.parse_args(argv)
+
+    runs: List[Callable[[engine.Alphabet, List[List[str]]], int]] = [
+        run_tables, run_normalize]
+    for name, alphabet in [("english", engine.ENGLISH),
+                           ("swedish", SWEDISH),
+                           (f"{len(LARGE)} letters", LARGE)]:
+        games = make_games(alphabet, args.games)
+        for run in runs:
+            start = time.perf_counter()
+            guesses = run(alphabet, games)
+            elapsed = time.perf_counter() - start
+            label = "tables" if run is run_tables else "normalize"
+            print(f"{name:>12} {label:>9}: "
+                  f"{elapsed / guesses * 1e9:6.0f}ns per guess")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,115 @@
+# Games per second of --batch against the interactive play() path.
+#
+# Every game is a word from the bundled list guessed in letter frequency
+# order.  The interactive path is play() fed the same guesses, once as a
+# player gets it, clearing the screen before each board, and once with
+# the clearing left out and the pauses skipped, the best it can do.
+# Batch mode is timed in process and end to end, a script file piped
+# through wordguess --batch to /dev/null.
+#
+#   python benchmarks/bench_batch.py [--games 100000]
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+from typing import List
+from typing import Optional
+from typing import Sequence
+from unittest import mock
+
+from wordguess import batch
+from wordguess import engine
+from wordguess import timing
+from wordguess import wordguess
+
+
+def script_lines(count: int, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    words = wordguess.load_words(wordguess.DEFAULT_MIN_LENGTH,
+                                 wordguess.DEFAULT_MAX_LENGTH)
+    guesses = " ".join(engine.FREQUENCY_ORDER)
+    return [f"{rng.choice(words)} {guesses}\n" for _ in range(count)]
+
+
+def clear_screen() -> None:
+    # what clear_screen() costs, the clear command run by a shell, with
+    # its output kept off the benchmark's terminal
+    subprocess.run("clear", shell=True, stdout=subprocess.DEVNULL,
+                   stderr=subprocess.DEVNULL)
+
+
+def run_play(lines: List[str], clear: bool) -> float:
+    pause = timing.Pause(0)
+    feed = iter(())
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()) as output, \
+            mock.patch.object(wordguess, "input", create=True,
+                              new=lambda prompt: next(feed)), \
+            mock.patch.object(wordguess, "clear_screen",
+                              new=clear_screen if clear else lambda: None):
+        for line in lines:
+            word = line.split(None, 1)[0]
+            feed = iter(engine.FREQUENCY_ORDER)
+            wordguess.play(word, wordguess.DEFAULT_NUM_WRONG_GUESSES,
+                           False, True, pause=pause)
+            output.seek(0)
+            output.truncate()
+    return time.perf_counter() - start
+
+
+def run_batch(lines: List[str]) -> float:
+    start = time.perf_counter()
+    write = io.StringIO().write
+    encode = json.JSONEncoder(ensure_ascii=False).encode
+    for result in batch.play_lines(lines,
+                                   wordguess.DEFAULT_NUM_WRONG_GUESSES):
+        write(encode(result) + "\n")
+    return time.perf_counter() - start
+
+
+def run_command(lines: List[str]) -> float:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "games.txt")
+        with open(path, "w") as f:
+            f.writelines(lines)
+        code = ("import sys; from wordguess import wordguess; "
+                "sys.exit(wordguess.main(sys.argv[1:]))")
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code, "--batch", path],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                       check=True)
+        return time.perf_counter() - start
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=100_000)
+    parser.add_argument("--clear_games", type=int, default=20,
+                        help="games for play() clearing the screen")
+    args = parser.parse_args(argv)
+
+    lines = script_lines(args.games)
+    paths: List[tuple] = [
+        ("play(), screen cleared", lambda: run_play(
+            lines[:args.clear_games], True), args.clear_games),
+        ("play(), no clear or pause", lambda: run_play(
+            lines[:args.games // 10], False), args.games // 10),
+        ("batch in process", lambda: run_batch(lines), args.games),
+        ("wordguess --batch", lambda: run_command(lines), args.games),
+    ]
+    for name, run, games in paths:
+        elapsed = run()
+        print(f"{name:>26}: {games:8,} games {elapsed:7.2f}s "
+              f"{games / elapsed:10,.0f} games/s")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,75 @@
+# Per-word memory of a plain word list compared with a compact dictionary.
+#
+#   python benchmarks/bench_compact.py [--count 5000000]
+import argparse
+import os
+import random
+import string
+import tempfile
+import time
+import tracemalloc
+
+from typing import Optional
+from typing import Sequence
+
+from wordguess import compact
+
+
+def write_text(path: str, count: int, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    letters = string.ascii_uppercase
+    with open(path, "w") as f:
+        for _ in range(count):
+            f.write("".join(rng.choices(letters, k=rng.randint(4, 15))))
+            f.write("\n")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=5_000_000)
+    parser.add_argument("--choices", type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        text_path = os.path.join(tmp, "words.txt")
+        compact_path = os.path.join(tmp, "words.wgd")
+        write_text(text_path, args.count)
+        start = time.perf_counter()
+        compact.convert(text_path, compact_path)
+        convert_time = time.perf_counter() - start
+
+        tracemalloc.start()
+        with open(text_path) as f:
+            words = f.read().split()
+        random.choice(words)
+        _, list_peak = tracemalloc.get_traced_memory()
+        list_size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del words
+
+        tracemalloc.start()
+        with compact.CompactWordList(compact_path) as word_list:
+            random.choice(word_list)
+            compact_size = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            start = time.perf_counter()
+            for _ in range(args.choices):
+                random.choice(word_list)
+            choice_time = time.perf_counter() - start
+
+        text_bytes = os.path.getsize(text_path)
+        file_bytes = os.path.getsize(compact_path)
+        print(f"{args.count} words, {text_bytes / args.count:.1f} bytes "
+              f"per word in words.txt")
+        print(f"python list  heap {list_size / args.count:8.1f} bytes/word "
+              f"(peak {list_peak / args.count:.1f})")
+        print(f"compact      heap {compact_size / args.count:8.4f} bytes/word, "
+              f"file {file_bytes / args.count:.1f} bytes/word "
+              f"(mapped, paged in on demand)")
+        print(f"convert {convert_time:.2f}s, random.choice "
+              f"{choice_time / args.choices * 1e6:.2f}us")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,80 @@
+# Time to score a word list for --difficulty, serially, in parallel and
+# again after a small change, and the cost of drawing from a tier.
+#
+#   python benchmarks/bench_difficulty.py [--count 100000] [--workers 4]
+import argparse
+import os
+import random
+import string
+import tempfile
+import time
+
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+from wordguess import compact
+from wordguess import difficulty
+from wordguess import schedule
+
+
+def make_words(count: int, seed: int) -> List[str]:
+    rng = random.Random(seed)
+    letters = string.ascii_uppercase
+    return ["".join(rng.choices(letters, k=rng.randint(4, 15)))
+            for _ in range(count)]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--changed", type=float, default=0.01,
+                        help="share of words replaced for the rescore")
+    parser.add_argument("--draws", type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    words = make_words(args.count, 0)
+    with tempfile.TemporaryDirectory() as tmp:
+        index_path = os.path.join(tmp, "words.idx")
+        path = difficulty.scores_path(index_path)
+        compact.write_words(index_path, words, (1, 1))
+        with compact.CompactWordList(index_path) as word_list:
+            for workers in sorted({1, args.workers}):
+                start = time.perf_counter()
+                scores, played = difficulty.open_scores(
+                    word_list, path, word_list.stamp, workers, full=True)
+                elapsed = time.perf_counter() - start
+                print(f"full, {workers} workers  {played} words in "
+                      f"{elapsed:.2f}s, {played / elapsed:,.0f} words/s")
+
+        changed = int(args.count * args.changed)
+        words[:changed] = make_words(changed, 1)
+        compact.write_words(index_path, words, (2, 2))
+        with compact.CompactWordList(index_path) as word_list:
+            start = time.perf_counter()
+            scores, played = difficulty.open_scores(
+                word_list, path, word_list.stamp, args.workers)
+            elapsed = time.perf_counter() - start
+            print(f"rescore {args.changed:.0%} changed  {played} words in "
+                  f"{elapsed:.2f}s")
+            scores.close()
+
+            start = time.perf_counter()
+            scores = difficulty.read_scores(path)
+            tier = scores.tier(word_list, 4, 15, "hard")
+            elapsed = time.perf_counter() - start
+            print(f"open tier  {elapsed * 1e3:.2f}ms, {len(tier)} hard words")
+            bag = schedule.ShuffleBag(tier, random.Random(0))
+            start = time.perf_counter()
+            for _ in range(args.draws):
+                bag.draw()
+            elapsed = time.perf_counter() - start
+            print(f"draw from tier  {elapsed / args.draws * 1e6:.2f}us")
+            del tier, bag
+            scores.close()
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,43 @@
+# Games per second for the headless game engine.
+#
+#   python benchmarks/bench_engine.py [--games 100000]
+import argparse
+import random
+import time
+
+from typing import Optional
+from typing import Sequence
+
+from wordguess import engine
+from wordguess import wordguess
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    words = wordguess.load_words(wordguess.DEFAULT_MIN_LENGTH,
+                                 wordguess.DEFAULT_MAX_LENGTH)
+    rng = random.Random(0)
+    picks = [rng.choice(words) for _ in range(args.games)]
+    won = guesses = 0
+    start = time.perf_counter()
+    for word in picks:
+        game = engine.GameState(word, wordguess.DEFAULT_NUM_WRONG_GUESSES)
+        for letter in engine.FREQUENCY_ORDER:
+            game.guess(letter)
+            guesses += 1
+            if game.status != engine.Status.playing:
+                break
+        won += game.status == engine.Status.won
+    elapsed = time.perf_counter() - start
+    print(f"{args.games} games, {guesses} guesses in {elapsed:.2f}s")
+    print(f"{args.games / elapsed:,.0f} games/s, "
+          f"{elapsed / guesses * 1e6:.2f}us per guess, "
+          f"win rate {won / args.games:.1%}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
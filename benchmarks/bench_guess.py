@@ -0,0 +1,92 @@
+# Per-guess cost of the bit mask game state against the old list scans.
+#
+#   python benchmarks/bench_guess.py [--games 50000]
+import argparse
+import random
+import time
+
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+from wordguess import engine
+from wordguess import wordguess
+
+
+class ListGame:
+    # the list based guess loop play() used before the bit mask
+    def __init__(self, word: str, num_wrong_guesses: int) -> None:
+        self.split_word = [x for x in word]
+        self.blank_word = ["_" for _ in word]
+        self.letters = [x for x in engine.ALPHABET]
+        self.num_wrong_guesses = num_wrong_guesses
+        self.wrong_guesses = 0
+        self.done = False
+
+    def guess_letter(self, letter: str) -> None:
+        if letter not in self.letters:
+            return
+        for i, x in enumerate(self.letters):
+            if x == letter:
+                self.letters[i] = " "
+                break
+        if letter in self.split_word:
+            for i, x in enumerate(self.split_word):
+                if x == letter:
+                    self.blank_word[i] = x
+            if self.blank_word == self.split_word:
+                self.done = True
+        else:
+            self.wrong_guesses += 1
+            if self.wrong_guesses >= self.num_wrong_guesses:
+                self.done = True
+
+
+def run_list(words: List[str], num_wrong_guesses: int) -> int:
+    guesses = 0
+    for word in words:
+        game = ListGame(word, num_wrong_guesses)
+        for letter in engine.FREQUENCY_ORDER:
+            game.guess_letter(letter)
+            guesses += 1
+            if game.done:
+                break
+    return guesses
+
+
+def run_mask(words: List[str], num_wrong_guesses: int) -> int:
+    guesses = 0
+    playing = engine.Status.playing
+    for word in words:
+        game = engine.GameState(word, num_wrong_guesses)
+        for letter in engine.FREQUENCY_ORDER:
+            game.guess_letter(letter)
+            guesses += 1
+            if game.status != playing:
+                break
+    return guesses
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=50_000)
+    parser.add_argument("--wrong", type=int, default=26,
+                        help="wrong guesses allowed, 26 plays every word "
+                             "to the end")
+    args = parser.parse_args(argv)
+
+    words = wordguess.load_words(wordguess.DEFAULT_MIN_LENGTH,
+                                 wordguess.DEFAULT_MAX_LENGTH)
+    rng = random.Random(0)
+    picks = [rng.choice(words) for _ in range(args.games)]
+    for name, run in [("list scans", run_list), ("bit mask", run_mask)]:
+        start = time.perf_counter()
+        guesses = run(picks, args.wrong)
+        elapsed = time.perf_counter() - start
+        print(f"{name:>10}: {elapsed / guesses * 1e9:7.0f}ns per guess, "
+              f"{args.games / elapsed:10,.0f} games/s")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
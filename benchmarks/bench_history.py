@@ -0,0 +1,68 @@
+# Cost of recording games in the history log and of reading it back.
+#
+#   python benchmarks/bench_history.py [--games 1000000] [--batch 64]
+import argparse
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from typing import Optional
+from typing import Sequence
+
+from wordguess import history
+from wordguess import wordguess
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=1_000_000)
+    parser.add_argument("--batch", type=int,
+                        default=history.DEFAULT_BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    words = wordguess.load_words(wordguess.DEFAULT_MIN_LENGTH,
+                                 wordguess.DEFAULT_MAX_LENGTH)
+    rng = random.Random(0)
+    records = [
+        history.GameRecord(word, tuple(rng.sample("ETAOINSRHLDCUM", 9)),
+                           rng.randrange(7), 6,
+                           rng.choice(history.OUTCOMES), 1.7e9, 30.0)
+        for word in (rng.choice(words) for _ in range(10_000))
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "history.log")
+        writer = history.HistoryWriter(path, args.batch)
+        worst = 0.0
+        start = time.perf_counter()
+        for i in range(args.games):
+            before = time.perf_counter()
+            writer.record(records[i % len(records)])
+            worst = max(worst, time.perf_counter() - before)
+        writer.close()
+        elapsed = time.perf_counter() - start
+        size = os.path.getsize(path)
+        print(f"record  {args.games} games in {elapsed:.2f}s, "
+              f"{elapsed / args.games * 1e6:.2f}us per game, "
+              f"worst {worst * 1e6:.0f}us (a batch write)")
+        print(f"log     {size / 2 ** 20:.1f}MB, "
+              f"{size / args.games:.1f} bytes per game")
+
+        start = time.perf_counter()
+        totals = history.stats(history.iter_records(path))
+        elapsed = time.perf_counter() - start
+        print(f"stats   {totals.games} games in {elapsed:.2f}s, "
+              f"{totals.games / elapsed:,.0f} games/s")
+
+        tracemalloc.start()
+        history.stats(history.iter_records(path))
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"stats   peak memory {peak / 1024:.0f}KB")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,65 @@
+# Compare the length index with a full scan of the word list.
+#
+#   python benchmarks/bench_index.py [--sizes 1000 100000 1000000]
+import argparse
+import os
+import random
+import string
+import tempfile
+import timeit
+
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+from wordguess import index
+
+
+def make_words(count: int, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    return ["".join(rng.choices(string.ascii_uppercase,
+                                k=rng.randint(4, 15)))
+            for _ in range(count)]
+
+
+def scan(data: str, min_length: int, max_length: int) -> List[str]:
+    # the original load_words loop
+    words = []
+    for w in data.split():
+        if min_length <= len(w) <= max_length:
+            words.append(w)
+    return words
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=[1_000, 100_000, 1_000_000])
+    parser.add_argument("--min", type=int, default=5)
+    parser.add_argument("--max", type=int, default=7)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(f"range --min {args.min} --max {args.max}, best of {args.repeat}")
+    print(f"{'words':>10} {'scan ms':>10} {'index ms':>10} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            words = make_words(size)
+            data = "\n".join(words)
+            path = os.path.join(tmp, f"{size}.idx")
+            index.write_index(path, index.bucket_words(words), (0, 0))
+
+            scan_time = min(timeit.repeat(
+                lambda: scan(data, args.min, args.max),
+                number=1, repeat=args.repeat))
+            index_time = min(timeit.repeat(
+                lambda: index.read_range(path, args.min, args.max, (0, 0)),
+                number=1, repeat=args.repeat))
+            print(f"{size:>10} {scan_time * 1000:>10.2f} "
+                  f"{index_time * 1000:>10.2f} "
+                  f"{scan_time / index_time:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
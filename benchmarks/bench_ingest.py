@@ -0,0 +1,103 @@
+# Throughput of cleaning a raw word list with python -m wordguess.ingest.
+#
+#   python benchmarks/bench_ingest.py [--lines 10000000]
+#
+# The raw list is generated with the kinds of noise the pipeline cleans:
+# mixed case, a byte order mark, accented words, words with apostrophes
+# and repeats.  Each stage is timed on its own over --sample lines, the
+# spilled unique run keeps an eighth of them in memory, then the whole
+# list is ingested in a fresh process for its wall time and peak RSS.
+import argparse
+import collections
+import os
+import random
+import string
+import subprocess
+import sys
+import tempfile
+import time
+
+from typing import Iterable
+from typing import Optional
+from typing import Sequence
+
+from wordguess import compact
+from wordguess import ingest
+
+
+def make_raw(path: str, lines: int, seed: int) -> None:
+    rng = random.Random(seed)
+    letters = string.ascii_lowercase + string.ascii_uppercase
+    recent: collections.deque = collections.deque(maxlen=1000)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(ingest.BOM)
+        for _ in range(lines):
+            kind = rng.random()
+            if kind < 0.1 and recent:
+                word = rng.choice(recent)  # a repeat
+            else:
+                word = "".join(rng.choices(letters, k=rng.randint(4, 12)))
+                if kind < 0.11:
+                    word += "'s"
+                elif kind < 0.12:
+                    word += "é"
+                recent.append(word)
+            f.write(word + "\n")
+
+
+def drain(words: Iterable[str]) -> None:
+    for _ in words:
+        pass
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--lines", type=int, default=10_000_000)
+    parser.add_argument("--sample", type=int, default=1_000_000)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        raw = os.path.join(tmp, "raw.txt")
+        sample = os.path.join(tmp, "sample.txt")
+        make_raw(raw, args.lines, 0)
+        make_raw(sample, args.sample, 0)
+        print(f"raw list {os.path.getsize(raw) / 1e6:.0f}MB, "
+              f"{args.lines} lines")
+
+        words = list(compact.iter_file_words(sample))
+        stats = ingest.Stats()
+        stages = [
+            ("read", lambda: compact.iter_file_words(sample)),
+            ("strip", lambda: ingest.strip(words, stats)),
+            ("normalize", lambda: ingest.normalize(words, stats)),
+            ("validate", lambda: ingest.validate(words, stats)),
+            ("unique, in memory", lambda: ingest.unique(
+                words, stats, len(words), len(words), tmp)),
+            ("unique, spilled", lambda: ingest.unique(
+                words, stats, len(words), args.sample // 8, tmp)),
+        ]
+        for name, stage in stages:
+            start = time.perf_counter()
+            drain(stage())
+            elapsed = time.perf_counter() - start
+            print(f"{name:18} {len(words) / elapsed:12,.0f} words/s")
+
+        dest = os.path.join(tmp, "words.wgd")
+        code = ("import resource, sys; from wordguess import ingest; "
+                "ingest.main(sys.argv[1:]); "
+                "print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)")
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, "-c", code, raw, dest],
+                                stdout=subprocess.PIPE,
+                                universal_newlines=True, check=True)
+        elapsed = time.perf_counter() - start
+        *report, rss = result.stdout.splitlines()
+        print(report[0])
+        print(f"ingest {elapsed:.1f}s, {args.lines / elapsed:,.0f} lines/s, "
+              f"{int(rss) / 1024:.0f}MB peak RSS, "
+              f"{os.path.getsize(dest) / 1e6:.0f}MB written")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,74 @@
+# Cost of instrumenting the game loop.
+#
+#   python benchmarks/bench_instrument.py [--games 20000]
+#
+# Plays the same scripted game with no metrics, with metrics and under
+# --profile, with a no-op board and input that is already typed, so the
+# time is the game loop itself and the instrumentation is all that
+# differs.  The stage timings of the instrumented run are printed after.
+import argparse
+import contextlib
+import io
+import itertools
+import os
+import tempfile
+import time
+
+from typing import Optional
+from typing import Sequence
+from unittest import mock
+
+from wordguess import instrument
+from wordguess import timing
+from wordguess import wordguess
+
+WORD = "LETTER"
+SCRIPT = ["1", "L", "L", "Z", "Q", "T", "E", "R"]
+
+
+def show(*args: object) -> None:
+    pass
+
+
+def session(games: int,
+            metrics: Optional[instrument.Metrics] = None) -> float:
+    pause = timing.Pause(0, fast=True)
+    script = itertools.cycle(SCRIPT)
+    with mock.patch.object(wordguess, "input", create=True,
+                           side_effect=lambda prompt: next(script)):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            for _ in range(games):
+                wordguess.play(WORD, wordguess.DEFAULT_NUM_WRONG_GUESSES,
+                               False, True, show=show, pause=pause,
+                               metrics=metrics)
+            return time.perf_counter() - start
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=20_000)
+    args = parser.parse_args(argv)
+
+    plain = session(args.games)
+    metrics = instrument.Metrics()
+    instrumented = session(args.games, metrics)
+    with tempfile.TemporaryDirectory() as tmp:
+        out = io.StringIO()
+        with instrument.profile(os.path.join(tmp, "bench.prof"), out):
+            profiled = session(args.games)
+    guesses = args.games * len(SCRIPT)
+    for name, elapsed in [("no metrics", plain),
+                          ("metrics", instrumented),
+                          ("profile", profiled)]:
+        print(f"{name:10} {elapsed:7.3f}s  "
+              f"{elapsed / guesses * 1e6:6.2f}us per guess  "
+              f"{elapsed / plain - 1:+7.1%}")
+    print()
+    for line in metrics.report():
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
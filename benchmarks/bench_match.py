@@ -0,0 +1,126 @@
+# Guesses per second in matches as the number of players grows.
+#
+# Players are put into matches of --size, --threads threads each play a
+# share of the players round robin, one guess at a time, while one more
+# thread reads the standings of every match in a loop.  Each run is done
+# with the per-match locks and with one lock shared by every match, the
+# contention a single lock around all the game state would have.
+#
+#   python benchmarks/bench_match.py [--players 10 100 1000 10000]
+import argparse
+import threading
+import time
+
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from wordguess import engine
+from wordguess import matches
+from wordguess import schedule
+from wordguess import wordguess
+
+
+class SharedLockMatch(matches.Match):
+    # every match behind the same lock
+    lock = threading.Lock()
+
+    def __init__(self, *args, **kwargs) -> None:  # type: ignore
+        super().__init__(*args, **kwargs)
+        self._lock = self.lock
+
+
+def make_matches(words: Sequence[str],
+                 players: int,
+                 size: int,
+                 rounds: int,
+                 shared: bool) -> List[Tuple[matches.Match, matches.Player]]:
+    bag = schedule.ShuffleBag(words)
+    cls = SharedLockMatch if shared else matches.Match
+    lobby = matches.Lobby(size, lambda: cls(
+        [bag.draw() for _ in range(rounds)], 26))
+    seats = [lobby.join(f"player{i}") for i in range(players)]
+    for match, _ in seats:
+        match.start()
+    return seats
+
+
+def play(seats: List[Tuple[matches.Match, matches.Player]],
+         counts: List[int],
+         slot: int) -> None:
+    # a guess for each unfinished player in turn until all are finished
+    guesses = 0
+    playing = [(match, player, iter(engine.FREQUENCY_ORDER))
+               for match, player in seats]
+    while playing:
+        still_playing = []
+        for match, player, letters in playing:
+            game = player.game
+            match.guess(player, next(letters))
+            guesses += 1
+            if player.finished is None:
+                if player.game is not game:
+                    letters = iter(engine.FREQUENCY_ORDER)
+                still_playing.append((match, player, letters))
+        playing = still_playing
+    counts[slot] = guesses
+
+
+def read_standings(match_list: List[matches.Match],
+                   stop: threading.Event,
+                   reads: List[int]) -> None:
+    while not stop.is_set():
+        for match in match_list:
+            match.standings
+            reads[0] += 1
+
+
+def run(seats: List[Tuple[matches.Match, matches.Player]],
+        threads: int) -> Tuple[float, int, int]:
+    counts = [0] * threads
+    workers = [threading.Thread(target=play,
+                                args=(seats[i::threads], counts, i))
+               for i in range(threads)]
+    stop = threading.Event()
+    reads = [0]
+    reader = threading.Thread(target=read_standings, args=(
+        list({id(m): m for m, _ in seats}.values()), stop, reads))
+    start = time.perf_counter()
+    reader.start()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+    stop.set()
+    reader.join()
+    return elapsed, sum(counts), reads[0]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--players", type=int, nargs="+",
+                        default=[10, 100, 1000, 10000])
+    parser.add_argument("--size", type=int, default=4,
+                        help="players in a match")
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args(argv)
+
+    words = wordguess.load_words(wordguess.DEFAULT_MIN_LENGTH,
+                                 wordguess.DEFAULT_MAX_LENGTH)
+    for players in args.players:
+        threads = min(args.threads, players)
+        for name, shared in [("per match", False), ("one lock", True)]:
+            seats = make_matches(words, players, args.size, args.rounds,
+                                 shared)
+            elapsed, guesses, reads = run(seats, threads)
+            print(f"{players:6} players, {-(-players // args.size):5} "
+                  f"matches, {name:>9}: {guesses / elapsed:10,.0f} "
+                  f"guesses/s, {reads / elapsed:12,.0f} standings reads/s")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
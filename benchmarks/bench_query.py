@@ -0,0 +1,99 @@
+# Pattern query latency on a large dictionary, the positional index
+# against checking every word of the length.
+#
+# The dictionary is --count random words with English letter frequencies
+# in a temporary compact list.  The index is built and saved once, opened
+# again from the sidecar like a later run would, then each pattern is
+# queried --repeat times.
+#
+#   python benchmarks/bench_query.py [--count 1000000]
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+from wordguess import compact
+from wordguess import query
+
+# rough English letter frequencies, per thousand
+FREQUENCIES = {
+    "E": 127, "T": 91, "A": 82, "O": 75, "I": 70, "N": 67, "S": 63, "H": 61,
+    "R": 60, "D": 43, "L": 40, "C": 28, "U": 28, "M": 24, "W": 24, "F": 22,
+    "G": 20, "Y": 20, "P": 19, "B": 15, "V": 10, "K": 8, "J": 2, "X": 2,
+    "Q": 1, "Z": 1,
+}
+PATTERNS = [("_A__E", "RS"), ("_____", ""), ("S___", ""), ("___ING", "E"),
+            ("Q_______", ""), ("__E__E__", "AIOU"), ("_____________Z", "")]
+
+
+def random_words(count: int, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    letters = list(FREQUENCIES)
+    weights = list(FREQUENCIES.values())
+    return ["".join(rng.choices(letters, weights, k=rng.randint(4, 15)))
+            for _ in range(count)]
+
+
+def scan(words: Sequence[str], pattern: str, exclude: str) -> List[str]:
+    # every word of the length checked in turn
+    fixed = [(i, x) for i, x in enumerate(pattern) if x not in "_."]
+    excluded = set(exclude)
+    return [x for x in words.length_range(len(pattern), len(pattern))
+            if all(x[i] == c for i, c in fixed)
+            and excluded.isdisjoint(x)]
+
+
+def timed(function, repeat: int) -> List[float]:  # type: ignore
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index_path = os.path.join(tmp, "words.idx")
+        compact.write_words(index_path, random_words(args.count), (1, 1))
+        path = query.index_path(index_path)
+        with compact.CompactWordList(index_path) as words:
+            start = time.perf_counter()
+            query.open_index(words, path).close()
+            build_time = time.perf_counter() - start
+            start = time.perf_counter()
+            index = query.open_index(words, path)
+            open_time = time.perf_counter() - start
+            print(f"{len(words):,} words, index {os.path.getsize(path):,} "
+                  f"bytes, built and saved in {build_time:.1f}s, opened "
+                  f"in {open_time * 1000:.2f}ms")
+            for pattern, exclude in PATTERNS:
+                found = query.query(words, index, pattern, exclude)
+                assert found == scan(words, pattern, exclude)
+                indexed = timed(lambda: query.query(
+                    words, index, pattern, exclude), args.repeat)
+                scanned = timed(lambda: scan(words, pattern, exclude),
+                                max(1, args.repeat // 10))
+                p99 = sorted(indexed)[-1 - len(indexed) // 100]
+                print(f"{pattern:>14} -{exclude or '':5} {len(found):7,} "
+                      f"words  index p50 "
+                      f"{statistics.median(indexed) * 1000:8.3f}ms p99 "
+                      f"{p99 * 1000:8.3f}ms  scan "
+                      f"{statistics.median(scanned) * 1000:8.2f}ms")
+            index.close()
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,96 @@
+# Word selection latency of the adaptive recommender with many players.
+#
+# Each request is a random player out of --players: their profile from
+# the cache, a word drawn for it and a game result recorded, like a
+# server handing out words.  It runs with a cache that holds every player
+# and with one a tenth of the size, where most requests evict someone.
+# The word lists are the bundled list with its real difficulty scores and
+# --words random words with made up scores, to show the draw doesn't grow
+# with the list.
+#
+#   python benchmarks/bench_recommend.py [--players 100000]
+import argparse
+import array
+import random
+import statistics
+import time
+import tracemalloc
+
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+from wordguess import difficulty
+from wordguess import recommend
+from wordguess import wordguess
+
+
+def random_scores(count: int, seed: int = 0) -> difficulty.Scores:
+    # only what the recommender reads, the wrong guesses and rarity
+    rng = random.Random(seed)
+    wrong = array.array("B", (min(int(rng.expovariate(0.5)), 20)
+                              for _ in range(count)))
+    rarity = array.array("f", (rng.uniform(0.5, 5) for _ in range(count)))
+    return difficulty.Scores(array.array("Q", bytes(8 * count)), rarity,
+                             array.array("I"), array.array("I", [0]),
+                             wrong, array.array("B", bytes(count)), 0)
+
+
+def requests(recommender: recommend.Recommender,
+             names: List[str],
+             count: int) -> List[float]:
+    rng = random.Random(1)
+    times = []
+    profiles = recommender.profiles
+    for _ in range(count):
+        name = rng.choice(names)
+        start = time.perf_counter()
+        profile = profiles.get(name)
+        recommender.pick(profile)
+        profile.record(rng.random() < 0.7, rng.randrange(7), 6)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--players", type=int, default=100_000)
+    parser.add_argument("--requests", type=int, default=500_000)
+    parser.add_argument("--words", type=int, default=1_000_000)
+    args = parser.parse_args(argv)
+
+    names = [f"player{i}" for i in range(args.players)]
+    bundled = wordguess.open_word_index()
+    synthetic = [f"W{i}" for i in range(args.words)]
+    lists = [
+        ("bundled", bundled, difficulty.open_word_scores(
+            bundled, wordguess.word_index_path())),
+        ("random", synthetic, random_scores(args.words)),
+    ]
+    for list_name, words, scores in lists:
+        start = time.perf_counter()
+        recommender = recommend.Recommender(words, range(len(words)), scores)
+        print(f"{list_name} list: {len(words):,} words ranked in "
+              f"{time.perf_counter() - start:.2f}s")
+        for cache_size in (args.players, args.players // 10):
+            recommender.profiles = recommend.ProfileCache(cache_size)
+            times = requests(recommender, names, args.requests)
+            times.sort()
+            print(f"  {args.players:,} players, cache of {cache_size:7,}: "
+                  f"p50 {statistics.median(times) * 1e6:5.2f}us "
+                  f"p99 {times[len(times) * 99 // 100] * 1e6:5.2f}us")
+
+    # the memory of a full cache, without the timings
+    tracemalloc.start()
+    profiles = recommend.ProfileCache(args.players)
+    for name in names:
+        profiles.get(name).record(True, 1, 6)
+    cache_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"{len(profiles):,} profiles take {cache_bytes / 2 ** 20:.1f}MB, "
+          f"{cache_bytes / len(profiles):.0f} bytes each")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
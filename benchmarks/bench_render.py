@@ -0,0 +1,81 @@
+# Cost of drawing the board for a game, display() which clears the screen
+# with a shell command against render.Renderer which redraws in place.
+#
+#   python benchmarks/bench_render.py [--games 100]
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+from typing import Optional
+from typing import Sequence
+from unittest import mock
+
+from wordguess import engine
+from wordguess import render
+from wordguess import wordguess
+
+WORD = "INSTRUMENT"
+
+
+def frames():
+    # the boards of one game, guessing in frequency order
+    game = engine.GameState(WORD, wordguess.DEFAULT_NUM_WRONG_GUESSES)
+    result = [(game.letters, list(game.blank_word), game.wrong_guesses)]
+    for letter in engine.FREQUENCY_ORDER:
+        game.guess(letter)
+        result.append((game.letters, list(game.blank_word),
+                       game.wrong_guesses))
+        if game.status != engine.Status.playing:
+            break
+    return result
+
+
+def bench(show, games: int) -> float:
+    boards = frames()
+    start = time.perf_counter()
+    for _ in range(games):
+        for letters, blank_word, guess_num in boards:
+            show(letters, blank_word, guess_num,
+                 wordguess.DEFAULT_NUM_WRONG_GUESSES, True)
+    return (time.perf_counter() - start) / (games * len(boards))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=100)
+    args = parser.parse_args(argv)
+
+    # the clear command writes to file descriptor 1, not sys.stdout
+    sys.stdout.flush()
+    stdout_fd = os.dup(1)
+    with open(os.devnull, "w") as null, contextlib.redirect_stdout(null):
+        os.dup2(null.fileno(), 1)
+        try:
+            display_time = bench(wordguess.display, args.games)
+            renderer_time = bench(render.Renderer(null), args.games)
+        finally:
+            os.dup2(stdout_fd, 1)
+            os.close(stdout_fd)
+
+    display_out = io.StringIO()
+    with contextlib.redirect_stdout(display_out):
+        with mock.patch.object(wordguess, "clear_screen"):
+            bench(wordguess.display, 1)
+    renderer_out = io.StringIO()
+    bench(render.Renderer(renderer_out), 1)
+    boards = len(frames())
+
+    print(f"{boards} frames per game of {WORD}")
+    print(f"display():  {display_time * 1e6:9.1f}us per frame, "
+          f"{len(display_out.getvalue()) / boards:.0f} bytes per frame "
+          f"plus the clear")
+    print(f"Renderer:   {renderer_time * 1e6:9.1f}us per frame, "
+          f"{len(renderer_out.getvalue()) / boards:.0f} bytes per frame")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,88 @@
+# Games per second replaying a history log, against scripting play()
+# with a mocked input() as the tests do.
+#
+#   python benchmarks/bench_replay.py [--games 1000000] [--workers 4]
+#
+# The log is made from games a frequency strategy plays on the bundled
+# word list.
+import argparse
+import contextlib
+import io
+import os
+import random
+import tempfile
+import time
+
+from typing import List
+from typing import Optional
+from typing import Sequence
+from unittest import mock
+
+from wordguess import engine
+from wordguess import history
+from wordguess import replay
+from wordguess import simulate
+from wordguess import timing
+from wordguess import wordguess
+
+
+def make_records(count: int, seed: int) -> List[history.GameRecord]:
+    words = wordguess.load_words(4, 15)
+    strategy = simulate.FrequencyStrategy(words)
+    rng = random.Random(seed)
+    records = []
+    for _ in range(count):
+        game = engine.GameState(rng.choice(words), 6)
+        guesses = []
+        while game.status == engine.Status.playing:
+            letter = strategy.next_letter(game, rng)
+            game.guess(letter)
+            guesses.append(letter)
+        records.append(history.GameRecord(
+            game.word, tuple(guesses), game.wrong_guesses, 6, game.status,
+            0.0, 0.0))
+    return records
+
+
+def mocked_play(records: Sequence[history.GameRecord]) -> float:
+    pause = timing.Pause(0, fast=True)
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()), \
+            mock.patch.object(wordguess, "clear_screen"):
+        for record in records:
+            with mock.patch.object(wordguess, "input", create=True,
+                                   side_effect=record.guesses):
+                wordguess.play(record.word, record.num_wrong_guesses,
+                               False, True, pause=pause)
+    return time.perf_counter() - start
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--mocked_games", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    distinct = make_records(10_000, 0)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "history.log")
+        with history.HistoryWriter(path, batch_size=1024) as writer:
+            for i in range(args.games):
+                writer.record(distinct[i % len(distinct)])
+        print(f"log {os.path.getsize(path) / 1e6:.1f}MB, {args.games} games")
+        for workers in sorted({1, args.workers}):
+            start = time.perf_counter()
+            totals = replay.replay_blocks(
+                history.iter_blocks(path, replay.BLOCK_SIZE), workers)
+            elapsed = time.perf_counter() - start
+            assert totals.games == args.games and not totals.mismatches
+            print(f"replay, {workers} workers  {elapsed:6.2f}s  "
+                  f"{totals.games / elapsed:10,.0f} games/s")
+    elapsed = mocked_play(distinct[:args.mocked_games])
+    print(f"mocked input()  {args.mocked_games / elapsed:10,.0f} games/s")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
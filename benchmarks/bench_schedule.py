@@ -0,0 +1,96 @@
+# Word draws per second from a 1M word memory mapped list, random.choice
+# against a ShuffleBag against shuffling a copy of the list.
+#
+#   python benchmarks/bench_schedule.py [--count 1000000] [--draws 1000000]
+import argparse
+import os
+import random
+import string
+import tempfile
+import time
+import tracemalloc
+
+from typing import Optional
+from typing import Sequence
+
+from wordguess import compact
+from wordguess import schedule
+
+
+def make_words(count: int, seed: int = 0) -> Sequence[str]:
+    rng = random.Random(seed)
+    letters = string.ascii_uppercase
+    return ["".join(rng.choices(letters, k=rng.randint(4, 15)))
+            for _ in range(count)]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--draws", type=int, default=1_000_000)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "words.wgd")
+        compact.write_words(path, make_words(args.count))
+        with compact.CompactWordList(path) as words:
+            rng = random.Random(0)
+            start = time.perf_counter()
+            for _ in range(args.draws):
+                rng.choice(words)
+            elapsed = time.perf_counter() - start
+            print(f"random.choice  {args.draws / elapsed:12,.0f} draws/s  "
+                  f"repeats allowed")
+
+            tracemalloc.start()
+            start = time.perf_counter()
+            bag = schedule.ShuffleBag(words, random.Random(0))
+            seen = set()
+            repeats = 0
+            for _ in range(min(args.draws, len(words))):
+                word_id = bag.order[bag.position] if bag.rounds else None
+                bag.draw()
+                if word_id is not None:
+                    repeats += word_id in seen
+                    seen.add(word_id)
+            tracemalloc.stop()
+            bag = schedule.ShuffleBag(words, random.Random(0))
+            start = time.perf_counter()
+            for _ in range(args.draws):
+                bag.draw()
+            elapsed = time.perf_counter() - start
+            tracemalloc.start()
+            schedule.ShuffleBag(words, random.Random(0)).draw()
+            bag_memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"ShuffleBag     {args.draws / elapsed:12,.0f} draws/s  "
+                  f"{bag_memory / 1024:.1f}KB peak, {repeats} repeats "
+                  f"in a round")
+
+            tracemalloc.start()
+            shuffled = list(words)
+            shuffle_memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            del shuffled
+            start = time.perf_counter()
+            shuffled = list(words)
+            random.Random(0).shuffle(shuffled)
+            setup = time.perf_counter() - start
+            start = time.perf_counter()
+            position = 0
+            for _ in range(args.draws):
+                if position == len(shuffled):
+                    random.shuffle(shuffled)
+                    position = 0
+                shuffled[position]
+                position += 1
+            elapsed = time.perf_counter() - start
+            print(f"shuffled copy  {args.draws / elapsed:12,.0f} draws/s  "
+                  f"{shuffle_memory / 2 ** 20:.1f}MB peak, "
+                  f"{setup:.2f}s to copy and shuffle")
+            del shuffled
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
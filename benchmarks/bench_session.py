@@ -0,0 +1,52 @@
+# Session time for a scripted game with different message delays.
+#
+#   python benchmarks/bench_session.py [--delays 3 1 0]
+#
+# The script has an invalid input, a repeated letter, two wrong letters
+# and a win, five messages that pause.  Fast mode is what scripts, pipes
+# and tests get.  Clearing the screen is left out, see bench_render.py.
+import argparse
+import contextlib
+import io
+import time
+
+from typing import Optional
+from typing import Sequence
+from unittest import mock
+
+from wordguess import timing
+from wordguess import wordguess
+
+WORD = "LETTER"
+SCRIPT = ["1", "L", "L", "Z", "Q", "T", "E", "R"]
+
+
+def session(pause: timing.Pause) -> float:
+    start = time.perf_counter()
+    with mock.patch.object(wordguess, "input", create=True,
+                           side_effect=SCRIPT):
+        with contextlib.redirect_stdout(io.StringIO()), \
+                mock.patch.object(wordguess, "clear_screen"):
+            wordguess.play(WORD, wordguess.DEFAULT_NUM_WRONG_GUESSES,
+                           False, True, pause=pause)
+    return time.perf_counter() - start
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--delays", type=float, nargs="+",
+                        default=[wordguess.SLEEP_TIME, 1, 0])
+    args = parser.parse_args(argv)
+
+    runs = [(f"--delay {x:g}", timing.Pause(x, fast=False))
+            for x in args.delays]
+    runs.append(("fast mode", timing.Pause(wordguess.SLEEP_TIME, fast=True)))
+    for name, pause in runs:
+        elapsed = session(pause)
+        print(f"{name:12} {elapsed:8.3f}s session, {pause.count} pauses, "
+              f"{pause.total:.3f}s paused")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
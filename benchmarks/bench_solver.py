@@ -0,0 +1,71 @@
+# Latency of solver hints on a large dictionary for each solver backend.
+#
+#   python benchmarks/bench_solver.py [--words 1000000] [--games 200]
+import argparse
+import random
+import string
+import time
+
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+from wordguess import engine
+from wordguess import solver
+
+
+def make_words(count: int, seed: int = 0) -> List[str]:
+    # letters weighted roughly like English so boards narrow realistically
+    rng = random.Random(seed)
+    weights = [8, 2, 3, 4, 12, 2, 2, 6, 7, 1, 1, 4, 2, 7, 8, 2, 1, 6, 6, 9,
+               3, 1, 2, 1, 2, 1]
+    return ["".join(rng.choices(string.ascii_uppercase, weights,
+                                k=rng.randint(4, 15)))
+            for _ in range(count)]
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    values = sorted(values)
+    return values[min(int(len(values) * fraction), len(values) - 1)]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--words", type=int, default=1_000_000)
+    parser.add_argument("--games", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    words = make_words(args.words)
+    rng = random.Random(1)
+    picks = [rng.choice(words) for _ in range(args.games)]
+    backends = [x for x in solver.BACKENDS
+                if x == "python" or solver.numpy is not None]
+    for backend in backends:
+        word_solver = solver.Solver(words, backend=backend)
+        start = time.perf_counter()
+        for length in {len(w) for w in words}:
+            word_solver.table(length)
+        print(f"{backend}: {len(words)} words, tables built in "
+              f"{time.perf_counter() - start:.2f}s")
+
+        for run in ["cold cache", "warm cache"]:
+            times = []
+            for word in picks:
+                game = engine.GameState(word, 26)
+                candidates = word_solver.start(len(word))
+                while game.status == engine.Status.playing:
+                    begin = time.perf_counter()
+                    candidates = word_solver.narrow(
+                        candidates, game.blank_word, game.missed)
+                    letter = word_solver.best_letter(candidates)
+                    times.append(time.perf_counter() - begin)
+                    game.guess_letter(letter)
+            print(f"  {run}: {len(times)} hints, "
+                  f"mean {sum(times) / len(times) * 1e6:.0f}us, "
+                  f"p50 {percentile(times, 0.5) * 1e6:.0f}us, "
+                  f"p99 {percentile(times, 0.99) * 1e6:.0f}us")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
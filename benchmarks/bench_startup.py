@@ -0,0 +1,95 @@
+# Startup cost of the console script, measured in fresh interpreters.
+#
+#   python benchmarks/bench_startup.py [--runs 10] [--max-import-ms 60]
+#
+# import is the cumulative -X importtime of wordguess.wordguess, the other
+# rows are wall times of a whole process.  With --max-import-ms the script
+# exits with 1 when the median import time is over the limit, so it can
+# run in CI to catch a heavy module imported at startup again.
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+COMMANDS = {
+    "first screen": "from wordguess import wordguess; "
+                    "wordguess.open_words(4, 15)",
+    "--version": "from wordguess import wordguess; "
+                 "wordguess.main(['--version'])",
+}
+
+
+def environment() -> dict:
+    # cached bytecode, like an installed package
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return env
+
+
+def import_time(env: dict) -> int:
+    # microseconds, the last line of -X importtime is the module itself
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c",
+         "import wordguess.wordguess"],
+        env=env, stderr=subprocess.PIPE, universal_newlines=True,
+        check=True)
+    return int(result.stderr.splitlines()[-1].split("|")[1])
+
+
+def slowest_imports(env: dict, count: int) -> List[str]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c",
+         "import wordguess.wordguess"],
+        env=env, stderr=subprocess.PIPE, universal_newlines=True,
+        check=True)
+    # direct imports of wordguess.wordguess are indented by three spaces
+    rows = [line.split("|") for line in result.stderr.splitlines()[1:]]
+    rows = [x for x in rows if x[2].startswith("   ") and
+            not x[2].startswith("    ")]
+    rows.sort(key=lambda x: -int(x[1]))
+    return [f"{int(x[1]) / 1000:8.1f}ms  {x[2].strip()}"
+            for x in rows[:count]]
+
+
+def wall_time(code: str, env: dict) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], env=env,
+                   stdout=subprocess.DEVNULL, check=True)
+    return time.perf_counter() - start
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--max-import-ms", type=float, default=None)
+    args = parser.parse_args(argv)
+
+    env = environment()
+    wall_time("import wordguess.wordguess", env)  # write the bytecode
+    imports = statistics.median(import_time(env) for _ in range(args.runs))
+    print(f"{'import':14} {imports / 1000:8.1f}ms median of {args.runs}")
+    baseline = statistics.median(wall_time("pass", env)
+                                 for _ in range(args.runs))
+    print(f"{'interpreter':14} {baseline * 1000:8.1f}ms")
+    for name, code in COMMANDS.items():
+        elapsed = statistics.median(wall_time(code, env)
+                                    for _ in range(args.runs))
+        print(f"{name:14} {elapsed * 1000:8.1f}ms")
+    print("slowest imports:")
+    for line in slowest_imports(env, 5):
+        print(line)
+
+    if args.max_import_ms is not None and imports / 1000 > args.max_import_ms:
+        print(f"import time over {args.max_import_ms}ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
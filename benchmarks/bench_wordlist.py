@@ -0,0 +1,85 @@
+# Loading a large --wordlist, the first time and from the shared cache.
+#
+#   python benchmarks/bench_wordlist.py [--words 5000000]
+#
+# Each row is a fresh process that loads the 6 to 8 letter words of a
+# generated word list and picks one, with its wall time and peak RSS.
+# "read whole file" is the old way, the whole text read and split in
+# memory.  "first load" builds the index with two streaming passes and
+# "cached" maps the index another process built.
+import argparse
+import os
+import random
+import string
+import subprocess
+import sys
+import tempfile
+import time
+
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+WHOLE_FILE = """
+import random, sys
+with open(sys.argv[1], encoding="utf-8") as f:
+    words = [x for x in f.read().split() if 6 <= len(x) <= 8]
+print(random.choice(words))
+"""
+
+CACHED = """
+import random, sys
+from wordguess import wordguess
+words = wordguess.open_words(6, 8, wordlist=sys.argv[1])
+print(random.choice(words))
+"""
+
+PEAK_RSS = """
+import resource, sys
+code = sys.argv.pop(1)
+exec(code)
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, file=sys.stderr)
+"""
+
+
+def make_wordlist(path: str, count: int) -> None:
+    rng = random.Random(0)
+    letters = string.ascii_uppercase
+    with open(path, "w", encoding="utf-8") as f:
+        for _ in range(count):
+            f.write("".join(rng.choices(letters, k=rng.randint(4, 15))))
+            f.write("\n")
+
+
+def run(code: str, path: str, env: dict) -> Tuple[float, int]:
+    # seconds and peak RSS in KiB of a process running code
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-c", PEAK_RSS, code, path],
+                            env=env, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE, universal_newlines=True,
+                            check=True)
+    return time.perf_counter() - start, int(result.stderr.split()[-1])
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--words", type=int, default=5_000_000)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "words.txt")
+        make_wordlist(path, args.words)
+        env = dict(os.environ, WORDGUESS_CACHE_DIR=os.path.join(tmp, "cache"))
+        print(f"word list {os.path.getsize(path) / 1e6:.0f}MB, "
+              f"{args.words} words")
+        for name, code in [("read whole file", WHOLE_FILE),
+                           ("first load", CACHED),
+                           ("cached", CACHED),
+                           ("cached", CACHED)]:
+            elapsed, rss = run(code, path, env)
+            print(f"{name:16} {elapsed:7.2f}s  {rss / 1024:7.1f}MB peak RSS")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,98 @@
+# Load generator for wordguess serve.
+#
+# Opens --idle connections that only wait, then --sessions connections
+# that each play --games games in letter frequency order, and reports
+# sessions per second and guess round trip latency.
+#
+#   python benchmarks/loadgen_server.py [--idle 10000] [--sessions 1000]
+#
+# Without --port a server is started in this process on a free port.  Both
+# ends of every connection are then open in one process, for 10k sessions
+# start wordguess serve separately and pass --port.
+import argparse
+import asyncio
+import json
+import time
+
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+from wordguess import engine
+from wordguess import server
+from wordguess import wordguess
+
+
+async def play(host: str, port: int, games: int,
+               latencies: List[float]) -> None:
+    reader, writer = await asyncio.open_connection(host, port)
+    await reader.readline()
+    for _ in range(games):
+        for letter in engine.FREQUENCY_ORDER:
+            start = time.perf_counter()
+            writer.write(letter.encode() + b"\n")
+            msg = json.loads(await reader.readline())
+            latencies.append(time.perf_counter() - start)
+            if msg["status"] != engine.Status.playing:
+                await reader.readline()  # the next game
+                break
+    writer.write(b"quit\n")
+    writer.close()
+
+
+async def run(args: argparse.Namespace) -> None:
+    tcp_server = None
+    port = args.port
+    if port is None:
+        words = wordguess.open_words(wordguess.DEFAULT_MIN_LENGTH,
+                                     wordguess.DEFAULT_MAX_LENGTH)
+        game_server = server.GameServer(words,
+                                        wordguess.DEFAULT_NUM_WRONG_GUESSES)
+        tcp_server = await game_server.start(args.host, 0)
+        port = tcp_server.sockets[0].getsockname()[1]
+
+    idle = []
+    start = time.perf_counter()
+    for _ in range(args.idle):
+        idle.append(await asyncio.open_connection(args.host, port))
+    if args.idle:
+        elapsed = time.perf_counter() - start
+        print(f"{args.idle} idle sessions opened in {elapsed:.2f}s")
+
+    latencies: List[float] = []
+    start = time.perf_counter()
+    await asyncio.gather(*(play(args.host, port, args.games, latencies)
+                           for _ in range(args.sessions)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2]
+    p99 = latencies[int(len(latencies) * 0.99)]
+    print(f"{args.sessions} sessions, {args.games} games each, "
+          f"{len(latencies)} guesses in {elapsed:.2f}s")
+    print(f"{args.sessions / elapsed:,.0f} sessions/s, "
+          f"{len(latencies) / elapsed:,.0f} guesses/s, "
+          f"p50 {p50 * 1e3:.2f}ms, p99 {p99 * 1e3:.2f}ms")
+
+    for _, writer in idle:
+        writer.close()
+    if tcp_server is not None:
+        tcp_server.close()
+        await tcp_server.wait_closed()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default=wordguess.DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=None)
+    parser.add_argument("--idle", type=int, default=0)
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--games", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    server.raise_open_file_limit()
+    asyncio.run(run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,42 @@
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addini("benchmark_compare_fail", type="linelist",
+                  help="Slowdowns that fail a --benchmark-compare run, "
+                       "like median:20%")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    # the performance tests only time and compare when asked to, otherwise
+    # they run once each like any other test.  Before pytest-benchmark
+    # reads the options.
+    if not config.pluginmanager.hasplugin("benchmark"):
+        return
+    from pytest_benchmark.utils import parse_compare_fail
+    option = config.option
+    if not (option.benchmark_enable or option.benchmark_only or
+            option.benchmark_compare or option.benchmark_save or
+            option.benchmark_autosave):
+        option.benchmark_disable = True
+    if option.benchmark_compare and not option.benchmark_compare_fail:
+        option.benchmark_compare_fail = [
+            parse_compare_fail(x)
+            for x in config.getini("benchmark_compare_fail")]
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    # keep generated word indexes out of the user's cache directory
+    path = tmp_path / "cache"
+    monkeypatch.setenv("WORDGUESS_CACHE_DIR", str(path))
+    return path
+
+
+@pytest.fixture(autouse=True)
+def data_dir(tmp_path, monkeypatch):
+    # games played by the tests are not recorded in the user's history
+    path = tmp_path / "data"
+    monkeypatch.setenv("WORDGUESS_DATA_DIR", str(path))
+    return path
@@ -0,0 +1,84 @@
+import io
+import json
+from unittest import mock
+
+import pytest
+
+from wordguess import batch
+from wordguess import engine
+from wordguess import wordguess
+
+
+@pytest.mark.parametrize("guesses, outcome, wrong, board, results", [
+    (list("LTER"), "won", 0, "LETTER", ["hit"] * 4),
+    (["letter"], "won", 0, "LETTER", ["word correct"]),
+    (list("ABCDFG"), "lost", 6, "______", ["miss"] * 6),
+    (["E", "e", "1", "T"], "quit", 0, "_ETTE_",
+     ["hit", "already guessed", "invalid", "hit"]),
+    (["E", "quit", "T"], "quit", 0, "_E__E_", ["hit"]),
+    ([], "quit", 0, "______", []),
+])
+def test_play_script(guesses, outcome, wrong, board, results):
+    result = batch.play_script("LETTER", guesses, 6)
+    assert result == {"word": "LETTER", "outcome": outcome,
+                      "wrong_guesses": wrong, "board": board,
+                      "results": results}
+
+
+def test_play_script_over():
+    # guesses after the game is over are not played
+    result = batch.play_script("TEST", ["TEST", "A", "B"], 6)
+    assert result["results"] == ["word correct"]
+
+
+def test_play_script_no_guess_word():
+    result = batch.play_script("TEST", ["TEST", "T"], 6, guess_word=False)
+    assert result["results"] == ["invalid", "hit"]
+
+
+def test_play_lines():
+    lines = ["test t e s\n", "\n", "# comment\n", "DON'T E\n",
+             "  SMÖR s m ö r"]
+    alphabet = engine.Alphabet("ABCDEFGHIJKLMNOPQRSTUVWXYZÅÄÖ")
+    results = list(batch.play_lines(lines, 6, alphabet=alphabet))
+    assert [x.get("outcome") for x in results] == ["won", None, "won"]
+    assert results[0]["word"] == "TEST"
+    assert results[1] == {"line": 4,
+                          "error": "DON'T is not a word of the alphabet"}
+    assert results[2]["word"] == "SMÖR"
+
+
+def test_play_lines_streams():
+    # each game is played as soon as its line is read
+    def lines():
+        yield "TEST TEST"
+        raise AssertionError("read ahead")
+
+    assert next(batch.play_lines(lines(), 6))["outcome"] == "won"
+
+
+def test_main_batch_stdin(capsys, monkeypatch):
+    monkeypatch.setattr("sys.stdin", io.StringIO("TEST T E S\nFIZZ A B\n"))
+    with mock.patch.object(wordguess, "clear_screen") as clear_screen:
+        assert wordguess.main(["--batch", "-W", "2"]) == 0
+    captured = capsys.readouterr()
+    results = [json.loads(x) for x in captured.out.splitlines()]
+    assert [x["outcome"] for x in results] == ["won", "lost"]
+    assert "2 games, 0 errors" in captured.err
+    clear_screen.assert_not_called()
+
+
+def test_main_batch_file(tmp_path, capsys):
+    path = tmp_path / "games.txt"
+    path.write_text("CAFÉ C A F É\nTEST -\n", encoding="utf-8")
+    assert wordguess.main(["--batch", str(path)]) == 1
+    results = [json.loads(x) for x in capsys.readouterr().out.splitlines()]
+    assert results[0] == {"line": 1,
+                          "error": "CAFÉ is not a word of the alphabet"}
+    assert results[1]["results"] == ["invalid"]
+
+
+def test_main_batch_missing_file(tmp_path, capsys):
+    path = str(tmp_path / "missing.txt")
+    assert wordguess.main(["--batch", path]) == 1
+    assert "Error can't read" in capsys.readouterr().err
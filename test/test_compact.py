@@ -0,0 +1,144 @@
+import pytest
+
+from wordguess import compact
+
+WORDS = ["TEST", "FISHER", "PRODUCE", "INSTRUMENT", "LIGHT", "SHIELD"]
+BY_LENGTH = ["TEST", "LIGHT", "FISHER", "SHIELD", "PRODUCE", "INSTRUMENT"]
+
+
+@pytest.fixture
+def word_list(tmp_path):
+    path = str(tmp_path / "words.wgd")
+    compact.write_words(path, WORDS, (10, 20))
+    with compact.CompactWordList(path) as words:
+        yield words
+
+
+def test_compact_word_list(word_list):
+    assert len(word_list) == 6
+    assert list(word_list) == BY_LENGTH
+    assert word_list[0] == "TEST"
+    assert word_list[-1] == "INSTRUMENT"
+    assert word_list.max_length == 10
+    assert word_list.stamp == (10, 20)
+
+
+@pytest.mark.parametrize("test_index", [6, -7, 100])
+def test_compact_word_list_index_error(word_list, test_index):
+    with pytest.raises(IndexError):
+        word_list[test_index]
+
+
+def test_compact_word_list_slice(word_list):
+    view = word_list[1:4]
+    assert len(view) == 3
+    assert list(view) == ["LIGHT", "FISHER", "SHIELD"]
+    assert view[-1] == "SHIELD"
+    assert word_list[::2] == ["TEST", "FISHER", "PRODUCE"]
+
+
+@pytest.mark.parametrize("min_length, max_length, expected_result", [
+    (4, 15, BY_LENGTH),
+    (6, 6, ["FISHER", "SHIELD"]),
+    (5, 7, ["LIGHT", "FISHER", "SHIELD", "PRODUCE"]),
+    (8, 9, []),
+    (11, 15, []),
+    (10, 4, []),
+])
+def test_compact_length_range(word_list, min_length, max_length,
+                              expected_result):
+    result = word_list.length_range(min_length, max_length)
+    assert list(result) == expected_result
+    assert len(result) == len(expected_result)
+
+
+def test_compact_length_range_of_view(word_list):
+    view = word_list[3:]
+    assert list(view.length_range(4, 6)) == ["SHIELD"]
+
+
+def test_compact_empty(tmp_path):
+    path = str(tmp_path / "empty.wgd")
+    compact.write_words(path, [])
+    with compact.CompactWordList(path) as words:
+        assert len(words) == 0
+        assert list(words.length_range(4, 15)) == []
+
+
+def test_compact_not_a_dictionary(tmp_path):
+    path = tmp_path / "words.txt"
+    path.write_text("TEST\nFISHER\nPRODUCE\nINSTRUMENT\nLIGHT\nSHIELD\n")
+    with pytest.raises(ValueError):
+        compact.CompactWordList(str(path))
+
+
+@pytest.mark.parametrize("size", [200, 60, 45, -1])
+def test_compact_truncated(tmp_path, size):
+    path = tmp_path / "words.wgd"
+    compact.write_words(str(path), WORDS * 20)
+    data = path.read_bytes()
+    path.write_bytes(data[:size])
+    with pytest.raises(ValueError):
+        compact.CompactWordList(str(path))
+
+
+def test_compact_bad_tables(tmp_path):
+    # the length table and offsets must agree with the header and the data
+    path = tmp_path / "words.wgd"
+    compact.write_words(str(path), WORDS)
+    data = bytearray(path.read_bytes())
+    data[compact.HEADER.size + 4 * 5] = 200  # first word of length 5
+    path.write_bytes(data)
+    with pytest.raises(ValueError):
+        compact.CompactWordList(str(path))
+
+
+def test_convert(tmp_path):
+    source = tmp_path / "words.txt"
+    source.write_text("\n".join(["CAFÉ", "TEST", "NAÏVE"]) + "\n",
+                      encoding="utf-8")
+    dest = str(tmp_path / "words.wgd")
+    compact.convert(str(source), dest)
+    with compact.CompactWordList(dest) as words:
+        assert list(words) == ["CAFÉ", "TEST", "NAÏVE"]
+        assert words.stamp[1] == source.stat().st_size
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 1 << 20])
+@pytest.mark.parametrize("text", [
+    "TEST\nFISHER\nPRODUCE\n", "TEST FISHER  PRODUCE", "\n\nTEST\r\nFISHER"
+    "\tPRODUCE\n\n",
+])
+def test_iter_file_words_blocks(tmp_path, size, text):
+    path = tmp_path / "words.txt"
+    path.write_text(text)
+    result = list(compact.iter_file_words(str(path), size))
+    assert result == ["TEST", "FISHER", "PRODUCE"]
+
+
+@pytest.mark.parametrize("size", [1, 2, 5, 1 << 20])
+def test_iter_file_words_not_utf8(tmp_path, size):
+    path = tmp_path / "words.txt"
+    path.write_bytes("TEST CAFÉ\n".encode("utf-8") + b"CAF\xc9 SM\xf6R\n"
+                     + "SMÖR\n".encode("utf-8") + b"END\xc3")
+    errors = []
+    result = list(compact.iter_file_words(str(path), size, errors.append))
+    assert result == ["TEST", "CAFÉ", "SMÖR"]
+    assert errors == [b"CAF\xc9", b"SM\xf6R", b"END\xc3"]
+
+
+def test_is_compact(tmp_path, word_list):
+    path = tmp_path / "words.txt"
+    path.write_text("TEST\n")
+    assert not compact.is_compact(str(path))
+    assert compact.is_compact(str(tmp_path / "words.wgd"))
+
+
+def test_main(tmp_path, capsys):
+    source = tmp_path / "words.txt"
+    source.write_text("\n".join(WORDS))
+    dest = tmp_path / "words.wgd"
+    result = compact.main([str(source), str(dest)])
+    captured = capsys.readouterr().out
+    assert result == 0
+    assert f"6 words written to {dest}" in captured
@@ -0,0 +1,163 @@
+from unittest import mock
+
+import pytest
+
+from wordguess import compact
+from wordguess import dictionaries
+from wordguess import engine
+from wordguess import index
+from wordguess import wordguess
+
+WORDS = ["TEST", "FISHER", "PRODUCE", "INSTRUMENT", "LIGHT", "SHIELD"]
+
+
+@pytest.fixture
+def installed(data_dir):
+    # an animals text list and a compact colors list
+    path = data_dir / dictionaries.DICTIONARIES_DIR
+    path.mkdir(parents=True)
+    (path / "animals.txt").write_text("\n".join(["HORSE", "TIGER", "SHEEP",
+                                                 "ZEBRA", "MONKEY"]))
+    compact.write_words(str(path / "colors.wgd"), ["GREEN", "PURPLE"])
+    (path / "notes.md").write_text("not a dictionary\n")
+    return path
+
+
+def test_available(installed):
+    assert dictionaries.available() == ["animals", "colors", "english"]
+
+
+def test_available_none_installed():
+    assert dictionaries.available() == [dictionaries.DEFAULT]
+
+
+def test_find(installed):
+    assert dictionaries.find("english") is None
+    assert dictionaries.find("animals") == str(installed / "animals.txt")
+    assert dictionaries.find("colors") == str(installed / "colors.wgd")
+
+
+def test_find_missing(installed):
+    with pytest.raises(ValueError, match="animals, colors, english"):
+        dictionaries.find("planets")
+
+
+def test_index_path(installed):
+    path = str(installed / "animals.txt")
+    assert dictionaries.index_path(path) == index.source_index_path(path)
+    path = str(installed / "colors.wgd")
+    assert dictionaries.index_path(path) == path
+
+
+def test_open_word_list(installed):
+    with dictionaries.open_word_list(str(installed / "colors.wgd")) as words:
+        assert list(words) == ["GREEN", "PURPLE"]
+    with dictionaries.open_word_list(str(installed / "animals.txt")) as words:
+        assert list(words.length_range(6, 6)) == ["MONKEY"]
+
+
+def test_load_words_wordlist(tmp_path):
+    path = tmp_path / "words.txt"
+    path.write_text("\n".join(WORDS))
+    assert wordguess.load_words(6, 7, wordlist=str(path)) == [
+        "FISHER", "SHIELD", "PRODUCE"]
+    # tiers are cut per length, the only length with two words has one hard
+    assert len(wordguess.load_words(4, 15, "hard", str(path))) == 1
+
+
+def test_main_dictionary(installed, capsys):
+    wordguess.input = lambda prompt: "quit"
+    assert wordguess.main(["-s", "--delay", "0", "--dictionary", "colors",
+                           "--min", "6"]) == 0
+    assert "_ _ _ _ _ _" in capsys.readouterr().out
+
+
+def test_main_wordlist(tmp_path, capsys):
+    path = tmp_path / "words.txt"
+    path.write_text("LETTER\n")
+    wordguess.input = lambda prompt: "quit"
+    assert wordguess.main(["-s", "--delay", "0", "--wordlist",
+                           str(path)]) == 0
+    assert "_ _ _ _ _ _" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("argv, expected", [
+    (["--dictionary", "planets"], "Error no dictionary named planets"),
+    (["--wordlist", "missing.txt"], "Error no word list missing.txt"),
+])
+def test_main_unknown_word_list(capsys, argv, expected):
+    assert wordguess.main(argv) == 1
+    assert expected in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("error", [
+    OSError("Permission denied"),
+    UnicodeDecodeError("utf-8", b"\xe9", 0, 1, "invalid continuation byte"),
+])
+def test_main_unreadable_word_list(tmp_path, capsys, error):
+    path = tmp_path / "words.txt"
+    path.write_text("TEST\n")
+    with mock.patch.object(dictionaries, "open_word_list",
+                           side_effect=error):
+        assert wordguess.main(["simulate", "--wordlist", str(path)]) == 1
+    assert f"Error can't read word list {path}" in capsys.readouterr().out
+
+
+def test_main_damaged_compact_word_list(tmp_path, capsys):
+    path = tmp_path / "words.wgd"
+    path.write_bytes(compact.MAGIC + b"\x01\x00damaged")
+    assert wordguess.main(["-s", "--wordlist", str(path)]) == 1
+    assert "is not a compact dictionary" in capsys.readouterr().out
+
+
+def test_wordlist_and_dictionary_exclusive():
+    with pytest.raises(SystemExit):
+        wordguess.argument_parser(["--wordlist", "a.txt", "--dictionary",
+                                   "b"])
+
+
+def test_simulate_wordlist(tmp_path, capsys):
+    path = tmp_path / "words.txt"
+    path.write_text("\n".join(WORDS))
+    assert wordguess.main(["simulate", "-g", "5", "-j", "1", "--wordlist",
+                           str(path)]) == 0
+    assert "Strategy frequency: 5 games" in capsys.readouterr().out
+
+
+def test_open_alphabet(tmp_path):
+    path = tmp_path / "svenska.txt"
+    path.write_text("smör\nsmål\n", encoding="utf-8")
+    assert dictionaries.open_alphabet(str(path)) is engine.ENGLISH
+    (tmp_path / "svenska.alphabet").write_text(
+        "A B C D E F G H I J K L M N O P Q R S T U V W X Y Z\nÅ Ä Ö\n",
+        encoding="utf-8")
+    assert dictionaries.open_alphabet(str(path)).letters.endswith("XYZÅÄÖ")
+
+
+def test_open_alphabet_letters_together(tmp_path):
+    (tmp_path / "a.alphabet").write_text("ABCÅ\n", encoding="utf-8")
+    assert dictionaries.open_alphabet(str(tmp_path / "a.txt")).letters == \
+        "ABCÅ"
+    (tmp_path / "a.alphabet").write_text("ABCA", encoding="utf-8")
+    with pytest.raises(ValueError):
+        dictionaries.open_alphabet(str(tmp_path / "a.txt"))
+
+
+def test_open_word_list_alphabet(tmp_path):
+    # the words are cleaned for the list's alphabet, a new alphabet
+    # rebuilds the index
+    path = tmp_path / "svenska.txt"
+    path.write_text("smör\nsmål\ntest\n", encoding="utf-8")
+    assert wordguess.load_words(4, 4, wordlist=str(path)) == ["TEST"]
+    (tmp_path / "svenska.alphabet").write_text(
+        "ABCDEFGHIJKLMNOPQRSTUVWXYZÅÄÖ", encoding="utf-8")
+    assert wordguess.load_words(4, 4, wordlist=str(path)) == [
+        "SMÖR", "SMÅL", "TEST"]
+
+
+def test_main_bad_alphabet(tmp_path, capsys):
+    path = tmp_path / "words.txt"
+    path.write_text("TEST\n")
+    (tmp_path / "words.alphabet").write_text("AA")
+    assert wordguess.main(["--wordlist", str(path)]) == 1
+    assert "Error bad alphabet" in capsys.readouterr().out
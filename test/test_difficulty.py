@@ -0,0 +1,225 @@
+import math
+from unittest import mock
+
+import pytest
+
+from wordguess import compact
+from wordguess import difficulty
+from wordguess import solver
+from wordguess import wordguess
+
+WORDS = ["TEST", "TENT", "BEST", "JAZZ", "FIZZ", "LETTER", "BETTER",
+         "PYTHON", "YELLOW", "ORANGE", "FISHER", "SHIELD", "PRODUCE"]
+
+
+def test_letter_rarity():
+    rarity = difficulty.letter_rarity(["AB", "AC", "AAD", "BE"])
+    assert rarity["A"] == pytest.approx(-math.log2(3 / 4))
+    assert rarity["E"] == 2
+
+
+@pytest.mark.parametrize("word, expected", [
+    ("TEST", 1), ("TENT", 0), ("BEST", 0), ("JAZZ", 1),
+])
+def test_wrong_guesses(word, expected):
+    word_solver = solver.Solver(["TEST", "TENT", "BEST", "JAZZ"])
+    assert difficulty.wrong_guesses(word_solver, word) == expected
+
+
+def test_wrong_guesses_unfindable():
+    # the apostrophe is never guessed, every letter is tried once
+    word_solver = solver.Solver(["DON'T"])
+    assert difficulty.wrong_guesses(word_solver, "DON'T") == 22
+
+
+def test_score_wrong_guesses_parallel():
+    serial = difficulty.score_wrong_guesses(WORDS, WORDS, 1)
+    with mock.patch.object(difficulty, "PARALLEL_MIN_WORDS", 1), \
+            mock.patch.object(difficulty, "CHUNK_SIZE", 2):
+        assert difficulty.score_wrong_guesses(WORDS, WORDS, 2) == serial
+
+
+def test_build():
+    scores, played = difficulty.build(WORDS)
+    assert played == len(WORDS)
+    assert len(scores) == len(WORDS)
+    assert list(scores.distinct) == [len(set(x)) for x in WORDS]
+    assert sorted(scores.order) == list(range(len(WORDS)))
+    tiers = [list(scores.tier(WORDS, 0, 20, x)) for x in difficulty.TIERS]
+    assert [len(x) for x in tiers] == [4, 5, 4]
+    assert sorted(sum(tiers, [])) == sorted(WORDS)
+    # the tiers are cut within each length, each scored no lower than the
+    # one before
+    for length, sizes in [(4, [2, 1, 2]), (6, [2, 3, 2]), (7, [0, 1, 0])]:
+        tiers = [list(scores.tier(WORDS, length, length, x))
+                 for x in difficulty.TIERS]
+        assert [len(x) for x in tiers] == sizes
+        score = [[scores.score(WORDS.index(x)) for x in tier]
+                 for tier in tiers if tier]
+        assert all(max(a) <= min(b) for a, b in zip(score, score[1:]))
+
+
+@pytest.mark.parametrize("count, expected", [
+    (1, [1]), (2, [0, 2]), (3, [0, 1, 2]), (4, [0, 1, 1, 2]),
+    (5, [0, 0, 1, 2, 2]), (6, [0, 0, 1, 1, 2, 2]),
+])
+def test_tier_of(count, expected):
+    assert [difficulty.tier_of(x, count) for x in range(count)] == expected
+
+
+def test_score_distinct():
+    # each distinct letter to find adds a little, less than rarity
+    assert difficulty.score(1, 2.0, 5) > difficulty.score(1, 2.0, 4)
+    assert difficulty.score(1, 2.2, 4) > difficulty.score(1, 2.0, 5)
+    assert difficulty.score(2, 0.0, 1) > difficulty.score(1, 5.0, 10)
+    scores, _ = difficulty.build(WORDS)
+    i = WORDS.index("PYTHON")
+    assert scores.score(i) == difficulty.score(
+        scores.wrong[i], scores.rarity[i], 6)
+
+
+def test_build_reuses_previous():
+    previous, _ = difficulty.build(WORDS[:-2])
+    with mock.patch.object(difficulty, "wrong_guesses",
+                           return_value=9) as wrong_guesses:
+        scores, played = difficulty.build(WORDS, previous=previous)
+    assert played == 2
+    assert [x[0][1] for x in wrong_guesses.call_args_list] == WORDS[-2:]
+    assert list(scores.wrong[:-2]) == list(previous.wrong)
+    assert list(scores.wrong[-2:]) == [9, 9]
+
+
+def test_build_empty():
+    scores, played = difficulty.build([])
+    assert played == 0
+    assert len(scores.tier([], 4, 15, "easy")) == 0
+
+
+def test_tier_length_range():
+    scores, _ = difficulty.build(WORDS)
+    for tier in difficulty.TIERS:
+        words = scores.tier(WORDS, 6, 6, tier)
+        assert all(len(x) == 6 for x in words)
+    assert sum(len(scores.tier(WORDS, 6, 6, x))
+               for x in difficulty.TIERS) == 7
+
+
+def test_ranges_and_score():
+    scores, _ = difficulty.build(WORDS)
+    ranges = scores.ranges(4, 6, difficulty.TIERS)
+    ids = [scores.order[i] for start, stop in ranges
+           for i in range(start, stop)]
+    assert sorted(ids) == [i for i, x in enumerate(WORDS) if len(x) <= 6]
+    assert [WORDS[scores.order[i]]
+            for start, stop in scores.ranges(4, 15, ["hard"])
+            for i in range(start, stop)] == \
+        list(scores.tier(WORDS, 4, 15, "hard"))
+    easy = scores.tier(WORDS, 6, 6, "easy")
+    hard = scores.tier(WORDS, 6, 6, "hard")
+    assert max(scores.score(WORDS.index(x)) for x in easy) <= \
+        min(scores.score(WORDS.index(x)) for x in hard)
+
+
+def test_tier_words_indexing():
+    words = difficulty.TierWords(WORDS, list(range(len(WORDS))),
+                                 [(0, 2), (5, 5), (7, 9)])
+    assert len(words) == 4
+    assert list(words) == ["TEST", "TENT", "PYTHON", "YELLOW"]
+    assert words[-1] == "YELLOW"
+    assert words[1:3] == ["TENT", "PYTHON"]
+    with pytest.raises(IndexError):
+        words[4]
+    with pytest.raises(IndexError):
+        words[-5]
+
+
+def test_write_read_scores(tmp_path):
+    path = str(tmp_path / "words.idx.scores")
+    scores, _ = difficulty.build(WORDS, (123, 456))
+    difficulty.write_scores(path, scores)
+    read = difficulty.read_scores(path)
+    assert read.stamp == (123, 456)
+    assert read.max_length == scores.max_length
+    for name in ("hashes", "order", "starts", "wrong", "distinct"):
+        assert list(getattr(read, name)) == list(getattr(scores, name))
+    assert list(read.rarity) == pytest.approx(list(scores.rarity))
+    assert list(read.tier(WORDS, 4, 15, "hard")) == \
+        list(scores.tier(WORDS, 4, 15, "hard"))
+    read.close()
+
+
+@pytest.mark.parametrize("data", [b"", b"WGDS", b"x" * 100])
+def test_read_scores_invalid(tmp_path, data):
+    path = tmp_path / "bad.scores"
+    path.write_bytes(data)
+    with pytest.raises(ValueError):
+        difficulty.read_scores(str(path))
+
+
+def test_open_scores(tmp_path):
+    index_path = str(tmp_path / "words.idx")
+    compact.write_words(index_path, WORDS[:-2], (1, 1))
+    path = difficulty.scores_path(index_path)
+    with compact.CompactWordList(index_path) as words:
+        _, played = difficulty.open_scores(words, path, words.stamp)
+        assert played == len(WORDS) - 2
+        scores, played = difficulty.open_scores(words, path, words.stamp)
+        assert played == 0
+        scores.close()
+        _, played = difficulty.open_scores(words, path, words.stamp,
+                                           full=True)
+        assert played == len(WORDS) - 2
+    # the list changed, only the new words are played
+    compact.write_words(index_path, WORDS, (2, 2))
+    with compact.CompactWordList(index_path) as words:
+        scores, played = difficulty.open_scores(words, path, words.stamp)
+        assert played == 2
+        assert difficulty.read_scores(path).stamp == (2, 2)
+
+
+def test_open_words_tiers():
+    all_words = wordguess.open_words(4, 15)
+    tiers = [wordguess.open_words(4, 15, x) for x in difficulty.TIERS]
+    assert sorted(sum((list(x) for x in tiers), [])) == sorted(all_words)
+    assert len(tiers[0]) == len(tiers[2])
+    assert all(4 <= len(x) <= 6 for x in wordguess.open_words(4, 6, "hard"))
+
+
+@pytest.mark.parametrize("min_length, max_length", [(9, 9), (12, 15)])
+def test_open_words_tiers_long_words(min_length, max_length):
+    # every tier has words of the longer lengths too
+    words = wordguess.open_words(min_length, max_length)
+    tiers = [wordguess.open_words(min_length, max_length, x)
+             for x in difficulty.TIERS]
+    assert all(len(x) >= len(words) // 3 for x in tiers)
+
+
+def test_open_words_tiers_read_only_cache():
+    with mock.patch.object(wordguess.index, "write_index",
+                           side_effect=OSError):
+        words = wordguess.open_words(4, 6, "easy")
+    assert words
+    assert all(4 <= len(x) <= 6 for x in words)
+
+
+def test_argument_parser_difficulty():
+    assert wordguess.argument_parser([]).difficulty is None
+    args = wordguess.argument_parser(["--difficulty", "hard"])
+    assert args.difficulty == "hard"
+    args = wordguess.argument_parser(["simulate", "--difficulty", "easy"])
+    assert args.difficulty == "easy"
+
+
+def test_main_difficulty_empty(capsys):
+    with mock.patch.object(wordguess, "open_words", return_value=[]):
+        assert wordguess.main(["--difficulty", "hard", "--min", "15"]) == 1
+    assert "Error no hard words between 15 and 15 letters" in \
+        capsys.readouterr().out
+
+
+def test_difficulty_main(capsys):
+    assert difficulty.main(["-j", "1"]) == 0
+    output = capsys.readouterr().out
+    assert "scored" in output
+    assert difficulty.main(["-j", "1"]) == 0
+    assert ", 0 scored" in capsys.readouterr().out
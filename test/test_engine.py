@@ -0,0 +1,179 @@
+import pickle
+
+import pytest
+
+from wordguess import engine
+
+
+def play_guesses(game, guesses):
+    return [game.guess(x) for x in guesses]
+
+
+def test_game_state_start():
+    game = engine.GameState("LETTER", 6)
+    assert game.masked_word == "______"
+    assert game.letters == list(engine.ALPHABET)
+    assert game.wrong_guesses == 0
+    assert game.status == engine.Status.playing
+
+
+def test_game_state_slots():
+    game = engine.GameState("LETTER", 6)
+    with pytest.raises(AttributeError):
+        game.other = 1
+
+
+def test_game_state_win():
+    game = engine.GameState("LETTER", 6)
+    result = play_guesses(game, ["l", "T", "E", "R"])
+    assert result == [engine.Result.hit] * 4
+    assert game.masked_word == "LETTER"
+    assert game.status == engine.Status.won
+
+
+def test_game_state_hit_and_miss():
+    game = engine.GameState("LETTER", 6)
+    assert game.guess("T") == engine.Result.hit
+    assert game.guess("W") == engine.Result.miss
+    assert game.masked_word == "__TT__"
+    assert game.wrong_guesses == 1
+    assert game.letters[engine.ALPHABET.index("T")] == " "
+    assert game.letters[engine.ALPHABET.index("W")] == " "
+
+
+def test_game_state_lose():
+    game = engine.GameState("LETTER", 3)
+    result = play_guesses(game, ["K", "I", "Z"])
+    assert result == [engine.Result.miss] * 3
+    assert game.status == engine.Status.lost
+    with pytest.raises(ValueError):
+        game.guess("L")
+
+
+def test_game_state_already_guessed():
+    game = engine.GameState("LETTER", 6)
+    assert play_guesses(game, ["T", "T", "W", "W"]) == [
+        engine.Result.hit, engine.Result.already_guessed,
+        engine.Result.miss, engine.Result.already_guessed,
+    ]
+    assert game.wrong_guesses == 1
+
+
+@pytest.mark.parametrize("test_input", [
+    "1", "90909", "t23est", "3R", "?", "#", " ", "R9", "test test", "",
+])
+def test_game_state_invalid(test_input):
+    game = engine.GameState("LETTER", 6)
+    assert game.guess(test_input) == engine.Result.invalid
+    assert game.wrong_guesses == 0
+
+
+def test_game_state_guess_word():
+    game = engine.GameState("LETTER", 6)
+    assert game.guess("testing") == engine.Result.word_wrong
+    assert game.wrong_guesses == 1
+    assert game.guess("letter") == engine.Result.word_correct
+    assert game.masked_word == "LETTER"
+    assert game.status == engine.Status.won
+
+
+def test_game_state_guess_word_not_allowed():
+    game = engine.GameState("LETTER", 6, guess_word=False)
+    assert game.guess("LETTER") == engine.Result.invalid
+    assert game.status == engine.Status.playing
+
+
+def test_letter_positions():
+    result = engine.letter_positions("LETTER")
+    assert result == {"L": (0,), "E": (1, 4), "T": (2, 3), "R": (5,)}
+
+
+def test_game_state_guessed_mask():
+    game = engine.GameState("LETTER", 6)
+    play_guesses(game, ["A", "E", "Z"])
+    assert game.guessed == (1 << 0) | (1 << 4) | (1 << 25)
+    assert game.hidden == 4
+    assert game.letters[:6] == [" ", "B", "C", "D", " ", "F"]
+    assert game.letters[25] == " "
+
+
+def test_game_state_non_ascii_letter():
+    game = engine.GameState("LETTER", 6)
+    assert game.guess("é") == engine.Result.already_guessed
+    assert game.guessed == 0
+
+
+def test_game_state_not_alpha():
+    game = engine.GameState("LETTER", 6)
+    assert play_guesses(game, ["", "1", "L1", " L", "_"]) == \
+        [engine.Result.invalid] * 5
+    assert game.guessed == 0
+
+
+def test_game_state_missed():
+    game = engine.GameState("LETTER", 6)
+    play_guesses(game, ["Z", "E", "A", "T"])
+    assert game.missed == "AZ"
+
+
+SWEDISH = engine.Alphabet("ABCDEFGHIJKLMNOPQRSTUVWXYZÅÄÖ")
+GREEK = engine.Alphabet("ΑΒΓΔΕΖΗΘΙΚΛΜΝΞΟΠΡΣΤΥΦΧΨΩ")
+
+
+def test_alphabet_tables():
+    assert len(SWEDISH) == 29
+    assert SWEDISH.bits["Ö"] == 1 << 28
+    assert SWEDISH.index["Å"] == 26
+    assert list(SWEDISH) == list(SWEDISH.letters)
+    assert engine.LETTER_BITS == engine.ENGLISH.bits
+
+
+@pytest.mark.parametrize("letters", ["", "AA", ["AB"], "A B", "A_"])
+def test_alphabet_bad_letters(letters):
+    with pytest.raises(ValueError):
+        engine.Alphabet(letters)
+
+
+def test_alphabet_combining_letters_normalized():
+    # Å written as A and a combining ring above
+    assert engine.Alphabet(["A\u030a", "B"]).letters == "ÅB"
+
+
+@pytest.mark.parametrize("alphabet, text, expected", [
+    (engine.ENGLISH, "letter", "LETTER"),
+    (engine.ENGLISH, "é", None),
+    (engine.ENGLISH, "", None),
+    (SWEDISH, "å", "Å"),
+    (SWEDISH, "o\u0308", "Ö"),
+    (SWEDISH, "smörgås", "SMÖRGÅS"),
+    (GREEK, "σ", "Σ"),
+    (GREEK, "ς", "Σ"),
+    (GREEK, "λόγος", None),
+])
+def test_alphabet_parse(alphabet, text, expected):
+    assert alphabet.parse(text) == expected
+
+
+def test_alphabet_pickle():
+    assert pickle.loads(pickle.dumps(SWEDISH)) == SWEDISH
+
+
+def test_alphabet_large():
+    # a few hundred letters, guesses are still a table lookup
+    alphabet = engine.Alphabet(chr(0x4E00 + i) for i in range(300))
+    word = alphabet.letters[299] + alphabet.letters[0]
+    game = engine.GameState(word, 6, alphabet=alphabet)
+    assert game.guess(alphabet.letters[150]) == engine.Result.miss
+    assert game.guess(alphabet.letters[299]) == engine.Result.hit
+    assert game.guess(word) == engine.Result.word_correct
+    assert game.missed == alphabet.letters[150]
+
+
+def test_game_state_alphabet():
+    game = engine.GameState("SMÖR", 6, alphabet=SWEDISH)
+    assert len(game.letters) == 29
+    assert play_guesses(game, ["ö", "Å", "s"]) == [
+        engine.Result.hit, engine.Result.miss, engine.Result.hit]
+    assert game.masked_word == "S_Ö_"
+    assert game.missed == "Å"
+    assert game.letters[SWEDISH.index["Ö"]] == " "
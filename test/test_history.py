@@ -0,0 +1,224 @@
+import os
+from unittest import mock
+
+import pytest
+
+from wordguess import engine
+from wordguess import history
+from wordguess import wordguess
+
+RECORDS = [
+    history.GameRecord("LETTER", ("E", "T", "L", "R"), 0, 6, "won",
+                       1700000000.0, 12.5),
+    history.GameRecord("PYTHON", ("E", "A", "PYTHOM", "I", "U", "S", "R"),
+                       6, 6, "lost", 1700000100.0, 30.0),
+    history.GameRecord("FISH", (), 0, 6, "quit", 1700000200.0, 1.0),
+    history.GameRecord("CAFÉ", ("C",), 0, 6, "quit", 1700000300.0, 2.0),
+]
+
+
+def test_data_dir(monkeypatch):
+    monkeypatch.setenv("WORDGUESS_DATA_DIR", "/tmp/wordguess-data")
+    assert history.history_path() == os.path.join("/tmp/wordguess-data",
+                                                  history.HISTORY_FILE)
+
+
+def test_data_dir_default(monkeypatch):
+    monkeypatch.delenv("WORDGUESS_DATA_DIR")
+    monkeypatch.setenv("XDG_DATA_HOME", "/tmp/xdg")
+    monkeypatch.setattr(history.sys, "platform", "linux")
+    assert history.data_dir() == os.path.join("/tmp/xdg", "wordguess")
+
+
+@pytest.mark.parametrize("record", RECORDS)
+def test_pack_unpack(record):
+    data = history.pack(record)
+    assert history.SIZE.unpack_from(data)[0] == len(data) - 4
+    assert history.unpack(data[4:]) == record
+
+
+@pytest.mark.parametrize("record", [
+    RECORDS[1]._replace(wrong_guesses=300, num_wrong_guesses=300),
+    RECORDS[1]._replace(guesses=("PYTHOM",) * 10000),
+    RECORDS[1]._replace(word="PYTHON" * 11000),
+])
+def test_pack_too_big(tmp_path, record):
+    # never logged wrong, and the writer leaves it out
+    with pytest.raises(ValueError):
+        history.pack(record)
+    path = str(tmp_path / "history.log")
+    with history.HistoryWriter(path) as writer:
+        writer.record(record)
+        writer.record(RECORDS[0])
+    assert list(history.iter_records(path)) == RECORDS[:1]
+
+
+def test_pack_largest():
+    record = RECORDS[1]._replace(wrong_guesses=255, num_wrong_guesses=255,
+                                 guesses=("A" * 65535,))
+    assert history.unpack(history.pack(record)[4:]) == record
+
+
+def test_writer_batches(tmp_path):
+    path = str(tmp_path / "history.log")
+    writer = history.HistoryWriter(path, batch_size=2)
+    writer.record(RECORDS[0])
+    assert not os.path.exists(path)
+    writer.record(RECORDS[1])
+    assert list(history.iter_records(path)) == RECORDS[:2]
+    writer.record(RECORDS[2])
+    assert writer.pending == 1
+    writer.close()
+    assert list(history.iter_records(path)) == RECORDS[:3]
+
+
+def test_writer_appends(tmp_path):
+    path = str(tmp_path / "logs" / "history.log")
+    with history.HistoryWriter(path) as writer:
+        writer.record(RECORDS[0])
+    with history.HistoryWriter(path) as writer:
+        writer.record(RECORDS[1])
+    with open(path, "rb") as f:
+        assert f.read().count(history.MAGIC) == 1
+    assert list(history.iter_records(path)) == RECORDS[:2]
+
+
+def test_writer_unwritable(tmp_path):
+    path = str(tmp_path / "history.log")
+    os.mkdir(path)  # a directory can't be opened for appending
+    writer = history.HistoryWriter(path, batch_size=1)
+    writer.record(RECORDS[0])
+    assert writer.pending == 0
+
+
+def test_record_game(tmp_path):
+    path = str(tmp_path / "history.log")
+    game = engine.GameState("LETTER", 6)
+    for letter in "ZLETR":
+        game.guess(letter)
+    with history.HistoryWriter(path) as writer:
+        writer.record_game(game, "ZLETR", game.status, 10.0, 2.0)
+    assert list(history.iter_records(path)) == [
+        history.GameRecord("LETTER", ("Z", "L", "E", "T", "R"), 1, 6, "won",
+                           10.0, 2.0)
+    ]
+
+
+def test_iter_records_missing(tmp_path):
+    assert list(history.iter_records(str(tmp_path / "missing.log"))) == []
+
+
+def test_iter_records_not_a_log(tmp_path):
+    path = tmp_path / "words.txt"
+    path.write_text("LETTER\nPYTHON\n")
+    with pytest.raises(ValueError):
+        list(history.iter_records(str(path)))
+
+
+@pytest.mark.parametrize("cut", [1, 5, 20])
+def test_iter_records_cut_short(tmp_path, cut):
+    path = str(tmp_path / "history.log")
+    with history.HistoryWriter(path) as writer:
+        for record in RECORDS[:2]:
+            writer.record(record)
+    with open(path, "r+b") as f:
+        f.truncate(os.path.getsize(path) - cut)
+    assert list(history.iter_records(path)) == RECORDS[:1]
+
+
+@pytest.mark.parametrize("size", [1, 30, 1 << 16])
+def test_iter_blocks(tmp_path, size):
+    path = str(tmp_path / "history.log")
+    with history.HistoryWriter(path) as writer:
+        for record in RECORDS * 3:
+            writer.record(record)
+    blocks = list(history.iter_blocks(path, size))
+    assert len(blocks) == (1 if size > 1000 else 12)
+    records = [x for block in blocks
+               for x in history.iter_block_records(block)]
+    assert records == RECORDS * 3
+
+
+def test_iter_blocks_bad_size(tmp_path):
+    path = str(tmp_path / "history.log")
+    with history.HistoryWriter(path) as writer:
+        writer.record(RECORDS[0])
+    with open(path, "ab") as f:
+        f.write(history.SIZE.pack(3) + b"abc")
+        f.write(history.pack(RECORDS[1]))
+    assert list(history.iter_records(path)) == RECORDS[:1]
+
+
+def test_stats():
+    result = history.stats(RECORDS)
+    assert result.games == 4
+    assert result.outcomes == {"won": 1, "lost": 1, "quit": 2}
+    assert result.by_length == {4: [2, 0], 6: [2, 1]}
+    assert result.report() == [
+        "Games 4: 1 won, 1 lost, 2 quit",
+        "Win rate 25.0%",
+        "Average wrong guesses 1.50",
+        "Average guesses 3.00",
+        "Average game time 11.4s",
+        "Word length  games  win rate",
+        "          4      2      0.0%",
+        "          6      2     50.0%",
+    ]
+
+
+def test_stats_empty():
+    assert history.stats([]).report() == ["No games recorded"]
+
+
+@pytest.mark.parametrize("inputs, expected", [
+    (["1", "Z", "L", "L", "T", "E", "R"],
+     (("Z", "L", "T", "E", "R"), 1, "won")),
+    (["LETTER"], (("LETTER",), 0, "won")),
+    (["A", "quit"], (("A",), 1, "quit")),
+    (["A", "B", "C"], (("A", "B", "C"), 3, "lost")),
+])
+def test_play_records_game(capsys, inputs, expected):
+    writer = history.HistoryWriter("unused")
+    with mock.patch.object(writer, "record") as record:
+        wordguess.input = mock.Mock(side_effect=inputs)
+        wordguess.play("LETTER", 3, False, True, history_log=writer)
+    record.assert_called_once()
+    game = record.call_args[0][0]
+    assert game.word == "LETTER"
+    assert (game.guesses, game.wrong_guesses, game.outcome) == expected
+    assert game.duration >= 0
+
+
+def test_main_records_and_stats(capsys, data_dir):
+    with mock.patch.object(wordguess, "open_words", return_value=["LETTER"]):
+        wordguess.input = mock.Mock(side_effect=["L", "T", "E", "R", "Y",
+                                                 "A", "quit", "N"])
+        wordguess.main([])
+    records = list(history.iter_records(history.history_path()))
+    assert [x.outcome for x in records] == ["won", "quit"]
+    capsys.readouterr()
+    assert wordguess.main(["stats"]) == 0
+    captured = capsys.readouterr().out
+    assert "Games 2: 1 won, 0 lost, 1 quit" in captured
+
+
+def test_main_no_history(data_dir):
+    with mock.patch.object(wordguess, "open_words", return_value=["LETTER"]):
+        wordguess.input = mock.Mock(side_effect=["quit"])
+        wordguess.main(["-s", "--no_history"])
+    assert not os.path.exists(history.history_path())
+
+
+def test_main_stats_log(capsys, tmp_path):
+    path = str(tmp_path / "other.log")
+    with history.HistoryWriter(path) as writer:
+        writer.record(RECORDS[0])
+    assert wordguess.main(["stats", "--log", path]) == 0
+    assert "Games 1: 1 won" in capsys.readouterr().out
+
+
+def test_main_stats_not_a_log(capsys, tmp_path):
+    path = tmp_path / "words.txt"
+    path.write_text("LETTER\n")
+    assert wordguess.main(["stats", "--log", str(path)]) == 1
+    assert "is not a game history log" in capsys.readouterr().out
@@ -0,0 +1,142 @@
+import os
+from unittest import mock
+
+import pytest
+
+from wordguess import index
+
+WORDS = ["TEST", "FISHER", "PRODUCE", "INSTRUMENT", "LIGHT", "SHIELD"]
+
+
+def test_cache_dir_env(monkeypatch, tmp_path):
+    monkeypatch.setenv("WORDGUESS_CACHE_DIR", str(tmp_path))
+    assert index.cache_dir() == str(tmp_path)
+    assert index.index_path("words.txt") == str(tmp_path / "words.txt.idx")
+
+
+def test_bucket_words():
+    result = index.bucket_words(WORDS)
+    assert result == {4: ["TEST"], 5: ["LIGHT"], 6: ["FISHER", "SHIELD"],
+                      7: ["PRODUCE"], 10: ["INSTRUMENT"]}
+
+
+@pytest.mark.parametrize("min_length, max_length, expected_result", [
+    (4, 15, ["TEST", "LIGHT", "FISHER", "SHIELD", "PRODUCE", "INSTRUMENT"]),
+    (6, 6, ["FISHER", "SHIELD"]),
+    (5, 7, ["LIGHT", "FISHER", "SHIELD", "PRODUCE"]),
+    (8, 9, []),
+    (11, 15, []),
+])
+def test_select_and_read_range(tmp_path, min_length, max_length,
+                               expected_result):
+    buckets = index.bucket_words(WORDS)
+    path = str(tmp_path / "words.idx")
+    index.write_index(path, buckets, (1, 2))
+    assert index.select(buckets, min_length, max_length) == expected_result
+    result = index.read_range(path, min_length, max_length, (1, 2))
+    assert result == expected_result
+
+
+def test_read_range_missing(tmp_path):
+    path = str(tmp_path / "missing.idx")
+    assert index.read_range(path, 4, 15, (1, 2)) is None
+
+
+def test_read_range_stale(tmp_path):
+    path = str(tmp_path / "words.idx")
+    index.write_index(path, index.bucket_words(WORDS), (1, 2))
+    assert index.read_range(path, 4, 15, (1, 3)) is None
+    assert index.read_range(path, 4, 15, (5, 2)) is None
+
+
+def test_read_range_corrupt(tmp_path):
+    path = tmp_path / "words.idx"
+    path.write_bytes(b"not an index\n")
+    assert index.read_range(str(path), 4, 15, (1, 2)) is None
+
+
+def test_source_stamp(tmp_path):
+    path = tmp_path / "words.txt"
+    path.write_text("TEST\n")
+    mtime_ns, size = index.source_stamp(str(path))
+    assert size == 5
+    assert mtime_ns > 0
+
+
+def test_source_index_path(tmp_path, cache_dir):
+    first = index.source_index_path(str(tmp_path / "a" / "words.txt"))
+    second = index.source_index_path(str(tmp_path / "b" / "words.txt"))
+    assert first != second
+    assert os.path.dirname(first) == str(cache_dir)
+    assert os.path.basename(first).startswith("words.txt-")
+    assert first.endswith(index.INDEX_SUFFIX)
+
+
+def test_open_source(tmp_path):
+    source = tmp_path / "words.txt"
+    source.write_text("\n".join(WORDS))
+    with mock.patch.object(index.compact, "convert",
+                           wraps=index.compact.convert) as convert:
+        with index.open_source(str(source)) as words:
+            assert list(words.length_range(6, 6)) == ["FISHER", "SHIELD"]
+        with index.open_source(str(source)) as words:
+            assert len(words) == 6
+        assert convert.call_count == 1
+        source.write_text("TEST\n")
+        with index.open_source(str(source)) as words:
+            assert list(words) == ["TEST"]
+        assert convert.call_count == 2
+
+
+def test_open_source_truncated_index(tmp_path):
+    # a damaged cache is built again, not an error on every load
+    source = tmp_path / "words.txt"
+    source.write_text("\n".join(WORDS))
+    with index.open_source(str(source)) as words:
+        assert len(words) == 6
+    path = index.source_index_path(str(source))
+    with open(path, "r+b") as f:
+        f.truncate(50)
+    with index.open_source(str(source)) as words:
+        assert sorted(words) == sorted(WORDS)
+
+
+def test_open_source_read_only_cache(tmp_path):
+    source = tmp_path / "words.txt"
+    source.write_text("\n".join(WORDS))
+    with mock.patch.object(index.compact, "convert", side_effect=OSError):
+        words = index.open_source(str(source))
+    assert words == ["TEST", "LIGHT", "FISHER", "SHIELD", "PRODUCE",
+                     "INSTRUMENT"]
+
+
+def cache_file(path, size, mtime):
+    path.write_bytes(b"x" * size)
+    os.utime(str(path), (mtime, mtime))
+
+
+def test_evict(tmp_path):
+    cache_file(tmp_path / "a.idx", 100, 1)
+    cache_file(tmp_path / "a.idx.scores", 50, 9)
+    cache_file(tmp_path / "b.idx", 100, 2)
+    cache_file(tmp_path / "c.idx", 100, 3)
+    cache_file(tmp_path / "d.idx", 100, 0)
+    cache_file(tmp_path / "c.idx.123.tmp", 500, 0)
+    cache_file(tmp_path / "notes.txt", 500, 0)
+    removed = index.evict(str(tmp_path / "d.idx"), 250)
+    assert removed == [str(tmp_path / "a.idx"), str(tmp_path / "b.idx")]
+    assert sorted(os.listdir(str(tmp_path))) == [
+        "c.idx", "c.idx.123.tmp", "d.idx", "notes.txt"]
+
+
+def test_evict_under_size(tmp_path):
+    cache_file(tmp_path / "a.idx", 100, 1)
+    assert index.evict(str(tmp_path / "b.idx"), 100) == []
+    assert index.evict(str(tmp_path / "missing" / "b.idx"), 0) == []
+
+
+def test_touch(tmp_path):
+    cache_file(tmp_path / "a.idx", 1, 1)
+    index.touch(str(tmp_path / "a.idx"))
+    assert (tmp_path / "a.idx").stat().st_mtime > 1
+    index.touch(str(tmp_path / "missing.idx"))
@@ -0,0 +1,145 @@
+import pytest
+
+from wordguess import compact
+from wordguess import engine
+from wordguess import ingest
+from wordguess import wordguess
+
+RAW = "﻿that\nWith\nDON'T\ncafé\nﬁsh\nTHAT\n﻿\nlight\nwith\n"
+
+
+def run(stage, words, *args):
+    stats = ingest.Stats()
+    return list(stage(words, stats, *args)), stats
+
+
+def test_strip():
+    words, stats = run(ingest.strip, ["﻿THAT", "WI﻿TH", "﻿",
+                                      "FISH"])
+    assert words == ["THAT", "WITH", "FISH"]
+    assert stats.boms == 3
+
+
+@pytest.mark.parametrize("fold, expected", [
+    (False, ["THAT", "WITH", "CAFÉ", "FISH", "NAÏVE", "STRASSE"]),
+    (True, ["THAT", "WITH", "CAFE", "FISH", "NAIVE", "STRASSE"]),
+])
+def test_normalize(fold, expected):
+    # é as e and a combining accent, ﬁ as one ligature character
+    words, stats = run(ingest.normalize,
+                       ["THAT", "with", "café", "ﬁsh", "NAÏVE",
+                        "straße"], fold)
+    assert words == expected
+    assert stats.normalized == 4 + fold
+
+
+def test_validate():
+    words, stats = run(ingest.validate,
+                       ["THAT", "DON'T", "CAFÉ", "A" * 65, "A" * 64, "X2"])
+    assert words == ["THAT", "A" * 64]
+    assert stats.rejected == {"not in the alphabet": 3, "too long": 1}
+
+
+def test_validate_alphabet():
+    words, _ = run(ingest.validate, ["ÅR", "AR", "BR"],
+                   engine.Alphabet("ÅAR"))
+    assert words == ["ÅR", "AR"]
+
+
+@pytest.mark.parametrize("fold, expected", [
+    (False, ["ÅR", "SOL", "CAFÉ", "ÆBLE"]),
+    (True, ["ÅR", "SOL", "CAFE", "ÆBLE"]),
+])
+def test_normalize_alphabet(fold, expected):
+    # Å is a letter of its own, É is only folded to E when asked
+    alphabet = engine.Alphabet("ABCDEFGHIJKLMNOPQRSTUVWXYZÆØÅ")
+    words, _ = run(ingest.normalize, ["år", "Sol", "café", "Æble"], fold,
+                   alphabet)
+    assert words == expected
+
+
+def test_normalize_lower_case_alphabet():
+    alphabet = engine.Alphabet("абвгдежзийклмнопрстуфхцчшщъыьэюя")
+    words, stats = run(ingest.normalize, ["МИР", "дом"], False, alphabet)
+    assert words == ["мир", "дом"]
+    assert stats.normalized == 1
+
+
+@pytest.mark.parametrize("exact_limit", [1, 2, 3, 100])
+def test_unique(tmp_path, exact_limit):
+    words = ["THAT", "WITH", "THAT", "FISH", "WITH", "LIGHT", "FISH",
+             "LIGHT", "TREE"]
+    result, stats = run(ingest.unique, words, 4, exact_limit,
+                        str(tmp_path))
+    # in file order until the set is full
+    assert result[:exact_limit] == ["THAT", "WITH", "FISH", "LIGHT",
+                                    "TREE"][:exact_limit]
+    assert sorted(result) == ["FISH", "LIGHT", "THAT", "TREE", "WITH"]
+    assert stats.duplicates == 4
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_unique_order_is_stable(tmp_path):
+    words = [f"W{i % 50}" for i in range(200)]
+    first, _ = run(ingest.unique, words, 100, 10)
+    second, _ = run(ingest.unique, words, 100, 10)
+    assert first == second
+    assert len(first) == 50
+
+
+def test_clean():
+    stats = ingest.Stats()
+    words = list(ingest.clean(RAW.split(), stats))
+    assert words == ["THAT", "WITH", "FISH", "LIGHT"]
+    assert (stats.written, stats.duplicates, stats.boms) == (4, 2, 2)
+    assert stats.rejected == {"not in the alphabet": 2}
+    assert "4 written, 2 duplicates, 2 rejected" in stats.report()
+
+
+def test_ingest(tmp_path):
+    source = tmp_path / "raw.txt"
+    source.write_text(RAW, encoding="utf-8")
+    dest = str(tmp_path / "words.wgd")
+    stats = ingest.ingest(str(source), dest, fold_accents=True)
+    assert stats.read == 9
+    with compact.CompactWordList(dest) as words:
+        assert list(words) == ["THAT", "WITH", "CAFE", "FISH", "LIGHT"]
+        assert words.stamp[1] == source.stat().st_size
+    assert sorted(x.name for x in tmp_path.iterdir()) == ["raw.txt",
+                                                         "words.wgd"]
+
+
+def test_main(tmp_path, capsys):
+    source = tmp_path / "raw.txt"
+    source.write_text(RAW, encoding="utf-8")
+    dest = tmp_path / "words.wgd"
+    assert ingest.main([str(source), str(dest)]) == 0
+    captured = capsys.readouterr().out
+    assert "9 read, 4 written" in captured
+    assert "words/s" in captured
+
+
+def test_main_not_utf8(tmp_path, capsys):
+    # a word in another encoding is rejected, the rest of the list is kept
+    source = tmp_path / "latin1.txt"
+    source.write_bytes("that\ncafé\nfish smör\n".encode("latin-1"))
+    dest = tmp_path / "words.wgd"
+    assert ingest.main([str(source), str(dest)]) == 0
+    assert "4 read, 2 written, 0 duplicates, 2 rejected (2 not UTF-8)" in \
+        capsys.readouterr().out
+    with compact.CompactWordList(str(dest)) as words:
+        assert list(words) == ["THAT", "FISH"]
+
+
+def test_wordlist_is_cleaned(tmp_path):
+    path = tmp_path / "raw.txt"
+    path.write_text(RAW, encoding="utf-8")
+    assert wordguess.load_words(4, 15, wordlist=str(path)) == [
+        "THAT", "WITH", "FISH", "LIGHT"]
+
+
+def test_bundled_words_are_clean():
+    words = wordguess.load_words(1, 64)
+    assert "THAT" in words
+    assert all(x.isalpha() and x.isascii() and x.isupper() for x in words)
+    assert len(set(words)) == len(words)
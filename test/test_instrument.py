@@ -0,0 +1,148 @@
+import json
+import pstats
+import tracemalloc
+from unittest import mock
+
+import pytest
+
+from wordguess import instrument
+from wordguess import timing
+from wordguess import wordguess
+
+
+def mock_input(*args):
+    input_values = list(args)
+
+    def mock_input2(s):
+        print(s, end="")
+        return input_values.pop(0)
+
+    return mock_input2
+
+
+def test_timer():
+    timer = instrument.Timer()
+    assert timer.as_dict()["mean"] == 0
+    timer.add(0.5)
+    timer.add(0.25)
+    assert timer.as_dict() == {"count": 2, "total": 0.75, "mean": 0.375,
+                               "max": 0.5}
+
+
+def test_count():
+    metrics = instrument.Metrics()
+    metrics.count("games")
+    metrics.count("guesses", 3)
+    metrics.count("guesses")
+    assert metrics.counters == {"games": 1, "guesses": 4}
+
+
+def test_timed():
+    metrics = instrument.Metrics()
+    double = metrics.timed("double", lambda x: x * 2)
+    assert double(2) == 4
+    assert double(3) == 6
+    assert metrics.timers["double"].count == 2
+
+
+def test_timed_exception():
+    metrics = instrument.Metrics()
+
+    def fail():
+        raise ValueError
+
+    with pytest.raises(ValueError):
+        metrics.timed("fail", fail)()
+    assert metrics.timers["fail"].count == 1
+
+
+def test_measure():
+    metrics = instrument.Metrics()
+    with metrics.measure("block"):
+        pass
+    assert metrics.timers["block"].count == 1
+    assert metrics.timers["block"].total >= 0
+
+
+def test_flush_memory_sink():
+    sink = instrument.MemorySink()
+    metrics = instrument.Metrics(sink)
+    metrics.count("games")
+    metrics.flush()
+    metrics.count("games")
+    metrics.close()
+    assert [x["counters"]["games"] for x in sink.snapshots] == [1, 2]
+
+
+def test_flush_without_sink():
+    metrics = instrument.Metrics()
+    metrics.count("games")
+    metrics.close()
+
+
+def test_json_lines_sink(tmp_path):
+    path = tmp_path / "metrics.jsonl"
+    metrics = instrument.Metrics(instrument.JsonLinesSink(str(path)))
+    metrics.timed("noop", lambda: None)()
+    metrics.flush()
+    metrics.flush()
+    lines = path.read_text().splitlines()
+    assert len(lines) == 2
+    snapshot = json.loads(lines[0])
+    assert snapshot["timers"]["noop"]["count"] == 1
+
+
+def test_report():
+    metrics = instrument.Metrics()
+    metrics.count("games")
+    metrics.timed("display", lambda: None)()
+    lines = metrics.report()
+    assert lines[0] == "games 1"
+    assert lines[2].startswith("display")
+
+
+def test_play_counts():
+    sink = instrument.MemorySink()
+    metrics = instrument.Metrics(sink)
+    wordguess.input = mock_input("L", "L", "1", "Z", "T", "E", "R")
+    wordguess.play("LETTER", 6, False, True, show=mock.Mock(),
+                   pause=timing.Pause(0), metrics=metrics)
+    assert metrics.counters == {"games": 1, "guesses": 5,
+                                "repeated_guesses": 1, "invalid_inputs": 1,
+                                "won": 1}
+    assert metrics.timers["input"].count == 7
+    assert metrics.timers["guess"].count == 7
+    assert metrics.timers["display"].count == 8
+
+
+def test_play_quit_counted():
+    metrics = instrument.Metrics()
+    wordguess.input = mock_input("quit")
+    wordguess.play("LETTER", 6, False, True, show=mock.Mock(),
+                   pause=timing.Pause(0), metrics=metrics)
+    assert metrics.counters == {"games": 1, "quit": 1}
+
+
+def test_main_metrics(tmp_path, capsys):
+    path = tmp_path / "metrics.jsonl"
+    with mock.patch.object(wordguess, "open_words", return_value=["LETTER"]):
+        wordguess.input = mock_input("L", "T", "E", "R", "quit")
+        wordguess.main(["-a", "--delay", "0", "--metrics", str(path)])
+    snapshot = json.loads(path.read_text())
+    assert snapshot["counters"]["games"] == 2
+    assert snapshot["counters"]["won"] == 1
+    assert snapshot["timers"]["load_words"]["count"] == 1
+    assert "stage" not in capsys.readouterr().err
+
+
+def test_main_profile(tmp_path, capsys):
+    path = tmp_path / "session.prof"
+    with mock.patch.object(wordguess, "open_words", return_value=["LETTER"]):
+        wordguess.input = mock_input("quit")
+        wordguess.main(["-s", "--delay", "0", "--profile", str(path)])
+    assert not tracemalloc.is_tracing()
+    assert pstats.Stats(str(path)).total_calls > 0
+    tracemalloc.Snapshot.load(str(path) + instrument.TRACEMALLOC_SUFFIX)
+    err = capsys.readouterr().err
+    assert "KiB peak" in err
+    assert "quit 1" in err
@@ -0,0 +1,151 @@
+import threading
+
+import pytest
+
+from wordguess import engine
+from wordguess import matches
+
+
+class Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def new_match(words=("LETTER", "SHIELD"), time_limit=None, clock=None):
+    return matches.Match(list(words), 6, time_limit=time_limit,
+                         clock=clock or Clock())
+
+
+def play(match, player, guesses):
+    return [match.guess(player, x)[0] for x in guesses]
+
+
+def test_match_join_and_start():
+    match = new_match()
+    alice = match.join("alice")
+    match.join("bob")
+    assert alice.game is None
+    assert not match.over
+    with pytest.raises(ValueError):
+        match.join("alice")
+    match.start()
+    assert alice.game.word == "LETTER"
+    assert [x.name for x in match.standings] == ["alice", "bob"]
+    with pytest.raises(ValueError):
+        match.join("carol")
+
+
+def test_match_guess_before_start():
+    match = new_match()
+    alice = match.join("alice")
+    with pytest.raises(ValueError):
+        match.guess(alice, "E")
+
+
+def test_match_rounds():
+    clock = Clock()
+    match = new_match(clock=clock)
+    alice = match.join("alice")
+    match.start()
+    result, game = match.guess(alice, "LETTER")
+    assert result == engine.Result.word_correct
+    assert game.word == "LETTER"
+    assert alice.game.word == "SHIELD"
+    assert alice.round == 1
+    clock.now += 5
+    assert play(match, alice, "ABCFGJ") == [engine.Result.miss] * 6
+    assert alice.round == 2
+    assert alice.finished == 5
+    assert match.over
+    with pytest.raises(ValueError):
+        match.guess(alice, "E")
+    assert match.standings == (matches.Standing("alice", 1, 6, 5),)
+
+
+def test_match_rankings():
+    clock = Clock()
+    match = new_match(["TEST"], clock=clock)
+    players = [match.join(x) for x in ["slow", "fast", "loser", "quitter"]]
+    slow, fast, loser, quitter = players
+    match.start()
+    clock.now += 1
+    play(match, fast, "TES")
+    play(match, loser, "ABCDFG")
+    clock.now += 1
+    play(match, slow, "AETS")
+    match.finish(quitter)
+    assert match.over
+    assert [x.name for x in match.standings] == [
+        "fast", "slow", "loser", "quitter"]
+    assert match.standings[1] == matches.Standing("slow", 1, 1, 2)
+
+
+def test_match_time_limit():
+    clock = Clock()
+    match = new_match(time_limit=30, clock=clock)
+    alice = match.join("alice")
+    bob = match.join("bob")
+    match.start()
+    assert match.remaining() == 30
+    match.guess(alice, "LETTER")
+    clock.now += 31
+    assert match.remaining() == 0
+    assert match.over
+    result, game = match.guess(alice, "E")
+    assert result == matches.TIME_UP
+    assert game.word == "SHIELD"
+    match.finish(bob)
+    assert match.standings == (matches.Standing("alice", 1, 0, 30),
+                               matches.Standing("bob", 0, 0, 30))
+
+
+def test_match_threads():
+    # players of many matches guessing from many threads at once
+    match_list = [new_match(["LETTER", "SHIELD", "PYTHON"])
+                  for _ in range(20)]
+    players = [[match.join(f"p{i}") for i in range(5)]
+               for match in match_list]
+    for match in match_list:
+        match.start()
+
+    def run(match, player):
+        while player.finished is None:
+            for letter in engine.FREQUENCY_ORDER:
+                if player.finished is not None:
+                    break
+                match.guess(player, letter)
+
+    threads = [threading.Thread(target=run, args=(match, player))
+               for match, group in zip(match_list, players)
+               for player in group]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for match in match_list:
+        assert match.over
+        # the same guesses give every player the same result
+        assert len({(x.won, x.wrong_guesses) for x in match.standings}) == 1
+        assert all(x.finished is not None for x in match.standings)
+
+
+def test_lobby():
+    made = []
+
+    def make():
+        made.append(new_match())
+        return made[-1]
+
+    lobby = matches.Lobby(2, make)
+    first, alice = lobby.join("alice")
+    assert first.started is None
+    second, bob = lobby.join("bob")
+    assert second is first
+    assert first.started is not None
+    third, _ = lobby.join("carol")
+    assert third is not first
+    assert lobby.matches == 2
+    assert alice.game is not None and bob.game is not None
@@ -0,0 +1,65 @@
+import random
+from unittest import mock
+
+import pytest
+
+from wordguess import engine
+from wordguess import timing
+from wordguess import wordguess
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.fixture(scope="module")
+def word_list():
+    return random.Random(0).sample(wordguess.load_words(4, 15), 200)
+
+
+def play_words(words, guess):
+    # each word played with the letters in frequency order until it ends
+    for word in words:
+        game = engine.GameState(word, 6)
+        for letter in engine.FREQUENCY_ORDER:
+            guess(game, letter)
+            if game.status != engine.Status.playing:
+                break
+
+
+def test_load_words(benchmark):
+    wordguess.load_words(4, 15)  # the index is built once per cache
+    words = benchmark(wordguess.load_words, 4, 15)
+    assert words
+
+
+def test_setup_word(benchmark):
+    split_word, blank_word = benchmark(wordguess.setup_word, "PRODUCTION")
+    assert len(split_word) == len(blank_word) == 10
+
+
+def test_guess_letter(benchmark):
+    # one guess on a new game, the board update without the game setup
+    def setup():
+        return (engine.GameState("PRODUCTION", 6), "O"), {}
+
+    result = benchmark.pedantic(engine.GameState.guess, setup=setup,
+                                rounds=10000)
+    assert result == engine.Result.hit
+
+
+def test_guess_games(benchmark, word_list):
+    benchmark(play_words, word_list, engine.GameState.guess)
+
+
+def test_play_games(benchmark, word_list):
+    # whole games through play(), no pauses and the board not drawn
+    def run():
+        for word in word_list:
+            feed = iter(engine.FREQUENCY_ORDER)
+            with mock.patch.object(wordguess, "input", create=True,
+                                   new=lambda prompt: next(feed)):
+                wordguess.play(word, 6, False, True,
+                               show=lambda *args: None,
+                               pause=timing.Pause(0))
+
+    with mock.patch("builtins.print"):
+        benchmark(run)
@@ -0,0 +1,187 @@
+import string
+from unittest import mock
+
+import pytest
+
+from wordguess import engine
+from wordguess import history
+from wordguess import matches
+from wordguess import query
+from wordguess import replay
+from wordguess import solver
+from wordguess import timing
+from wordguess import wordguess
+
+hypothesis = pytest.importorskip("hypothesis")
+st = pytest.importorskip("hypothesis.strategies")
+
+# a few common letters as well, for words that repeat letters
+words = st.one_of(st.text(engine.ALPHABET, min_size=1, max_size=12),
+                  st.text("AEIRST", min_size=1, max_size=8))
+letters = st.sampled_from(engine.ALPHABET + string.ascii_lowercase)
+junk = st.sampled_from(["", "1", "?", "A B", "-", "QU1T"])
+inputs = st.lists(st.one_of(letters, letters, letters, words,
+                            words.map(str.lower), junk), max_size=40)
+
+
+def guesses_for(word):
+    # mostly letters of the word so games are won as well as lost
+    return st.lists(st.one_of(
+        st.sampled_from(word), st.sampled_from(word), st.sampled_from(word),
+        st.sampled_from(word.lower()), letters, words, st.just(word), junk),
+        max_size=40)
+
+
+games = words.flatmap(lambda x: st.tuples(st.just(x), guesses_for(x)))
+
+
+class ReferenceGame:
+    # the list scans play() used before the game state was a bit mask
+    def __init__(self, word, num_wrong_guesses, guess_word):
+        self.split_word, self.blank_word = wordguess.setup_word(word)
+        self.letters = [x for x in engine.ALPHABET]
+        self.num_wrong_guesses = num_wrong_guesses
+        self.guess_word = guess_word
+        self.wrong_guesses = 0
+        self.status = engine.Status.playing
+
+    def guess(self, user_input):
+        guess = user_input.upper()
+        if not guess.isalpha():
+            return engine.Result.invalid
+        if len(guess) > 1:
+            if not self.guess_word:
+                return engine.Result.invalid
+            if guess == "".join(self.split_word):
+                self.blank_word = list(self.split_word)
+                self.status = engine.Status.won
+                return engine.Result.word_correct
+            self.wrong()
+            return engine.Result.word_wrong
+        if guess not in self.letters:
+            return engine.Result.already_guessed
+        self.letters[self.letters.index(guess)] = " "
+        if guess not in self.split_word:
+            self.wrong()
+            return engine.Result.miss
+        for i, x in enumerate(self.split_word):
+            if x == guess:
+                self.blank_word[i] = x
+        if self.blank_word == self.split_word:
+            self.status = engine.Status.won
+        return engine.Result.hit
+
+    def wrong(self):
+        self.wrong_guesses += 1
+        if self.wrong_guesses >= self.num_wrong_guesses:
+            self.status = engine.Status.lost
+
+
+def board(game):
+    return (game.status, game.wrong_guesses, list(game.blank_word),
+            list(game.letters))
+
+
+@hypothesis.given(games, st.integers(1, 26), st.booleans())
+def test_game_state_matches_reference(game_inputs, num_wrong, guess_word):
+    word, guesses = game_inputs
+    game = engine.GameState(word, num_wrong, guess_word)
+    reference = ReferenceGame(word, num_wrong, guess_word)
+    for user_input in guesses:
+        if reference.status != engine.Status.playing:
+            with pytest.raises(ValueError):
+                game.guess(user_input)
+            break
+        assert game.guess(user_input) == reference.guess(user_input)
+        assert board(game) == board(reference)
+
+
+@hypothesis.settings(deadline=None)
+@hypothesis.given(games, st.integers(1, 26))
+def test_play_replays_the_same(tmp_path_factory, game_inputs, num_wrong):
+    # the game play() records plays out the same on the game state alone
+    word, guesses = game_inputs
+    path = str(tmp_path_factory.mktemp("play") / "history.log")
+    feed = iter(guesses + ["quit"])
+    log = history.HistoryWriter(path)
+    with mock.patch.object(wordguess, "input", create=True,
+                           new=lambda prompt: next(feed)), \
+            mock.patch("builtins.print"):
+        wordguess.play(word, num_wrong, False, True,
+                       show=lambda *args: None, pause=timing.Pause(0),
+                       history_log=log)
+    log.close()
+    [record] = history.iter_records(path)
+    assert replay.check(record) is None
+    game = ReferenceGame(word, num_wrong, True)
+    played = []
+    for user_input in guesses:
+        if game.status != engine.Status.playing:
+            break
+        result = game.guess(user_input)
+        if result not in (engine.Result.invalid,
+                          engine.Result.already_guessed):
+            played.append(user_input.upper())
+    assert record.guesses == tuple(played)
+    assert record.wrong_guesses == game.wrong_guesses
+    outcome = history.QUIT if game.status == engine.Status.playing \
+        else game.status
+    assert record.outcome == outcome
+
+
+@hypothesis.given(st.lists(words, min_size=1, max_size=5), inputs, st.data())
+def test_match_matches_game_state(match_words, guesses, data):
+    match = matches.Match(match_words, 6, clock=lambda: 0.0)
+    player = match.join("alice")
+    match.start()
+    states = [engine.GameState(x, 6) for x in match_words]
+    for user_input in guesses:
+        if player.finished is not None:
+            break
+        game = states[player.round]
+        if data.draw(st.booleans()):
+            user_input = data.draw(st.sampled_from(game.word))
+        result, match_game = match.guess(player, user_input)
+        assert result == game.guess(user_input)
+        assert board(match_game) == board(game)
+    assert player.won == sum(x.status == engine.Status.won
+                             for x in states[:player.round])
+
+
+short_words = st.text("ABCDEFT", min_size=3, max_size=3)
+
+
+@hypothesis.given(st.lists(short_words, min_size=1, max_size=30, unique=True),
+                  st.data())
+def test_solver_candidates(word_list, data):
+    # the candidates of the bit tables, and the arrays when numpy is
+    # installed, are the words that fit the board
+    secret = data.draw(st.sampled_from(word_list))
+    game = engine.GameState(secret, 26)
+    for letter in data.draw(st.lists(st.sampled_from("ABCDEFT"),
+                                     max_size=7)):
+        if game.status == engine.Status.playing:
+            game.guess(letter)
+    missed = set(game.missed)
+    expected = [x for x in word_list
+                if all(b in ("_", c) for b, c in zip(game.blank_word, x))
+                and not missed & set(x)
+                and not set(game.blank_word) & {c for b, c in
+                                                zip(game.blank_word, x)
+                                                if b == "_"}]
+    backends = ["python"] if solver.numpy is None else solver.BACKENDS
+    for backend in backends:
+        word_solver = solver.Solver(word_list, backend=backend)
+        candidates = word_solver.candidates(game.blank_word, game.missed)
+        assert word_solver.select(candidates) == expected
+
+
+@hypothesis.given(st.lists(words, max_size=40),
+                  st.text(engine.ALPHABET + "_", min_size=1, max_size=12),
+                  st.text(engine.ALPHABET, max_size=3))
+def test_query_matches_scan(word_list, pattern, exclude):
+    index = query.build(word_list)
+    expected = [x for x in word_list if len(x) == len(pattern)
+                and all(p in ("_", c) for p, c in zip(pattern, x))
+                and not set(exclude) & set(x)]
+    assert query.query(word_list, index, pattern, exclude) == expected
@@ -0,0 +1,136 @@
+from unittest import mock
+
+import pytest
+
+from wordguess import compact
+from wordguess import engine
+from wordguess import query
+from wordguess import wordguess
+
+WORDS = ["TEST", "TENT", "BEST", "JAZZ", "FIZZ", "LATTE", "BASTE", "PASTE",
+         "CARVE", "RAISE", "WAFER", "LETTER", "BETTER", "PYTHON"]
+
+
+def scan(pattern, exclude=""):
+    # what the index should find, by checking every word
+    return [x for x in WORDS if len(x) == len(pattern)
+            and all(p in "_." or p == c for p, c in zip(pattern, x))
+            and not set(exclude) & set(x)]
+
+
+@pytest.mark.parametrize("pattern, exclude", [
+    ("_A__E", ""), ("_A__E", "RS"), ("_A__E", "RST"), ("TE__", ""),
+    ("____", ""), ("____", "Z"), ("_ETTER", "L"), ("Q___", ""),
+    ("_______", ""), ("", ""), ("_.S_E", ""), ("_EST", "T"),
+])
+def test_match(pattern, exclude):
+    index = query.build(WORDS)
+    assert [WORDS[i] for i in index.match(pattern, exclude)] == \
+        scan(pattern, exclude)
+
+
+def test_match_puzzle():
+    index = query.build(WORDS)
+    words = query.query(WORDS, index, "_a__e", "rs")
+    assert words == ["LATTE"]
+
+
+def test_count():
+    index = query.build(WORDS)
+    assert index.count(4) == 5
+    assert index.count(9) == 0
+
+
+@pytest.mark.parametrize("first, second", [
+    ([], [1, 2]), ([1, 2], []), ([1, 5, 9], [1, 2, 3, 9, 10]),
+    ([4, 6], [1, 2, 3]), ([3], [3]),
+])
+def test_intersect_difference(first, second):
+    assert query.intersect(first, second) == \
+        [x for x in first if x in second]
+    assert query.difference(first, second) == \
+        [x for x in first if x not in second]
+
+
+def test_query_alphabet():
+    words = ["ÅRET", "ÅREN", "ÄREN", "ARET"]
+    alphabet = engine.Alphabet("ABCDEFGHIJKLMNOPQRSTUVWXYZÅÄÖ")
+    index = query.build(words)
+    assert query.query(words, index, "år__", "n", alphabet) == ["ÅRET"]
+    assert query.query(words, index, "__E_", "å", alphabet) == \
+        ["ÄREN", "ARET"]
+
+
+def test_write_read_index(tmp_path):
+    path = str(tmp_path / "words.idx.pattern")
+    built = query.build(WORDS, (123, 456))
+    query.write_index(path, built)
+    index = query.read_index(path)
+    assert index.stamp == (123, 456)
+    for name in ("keys", "starts", "ids"):
+        assert list(getattr(index, name)) == list(getattr(built, name))
+    assert index.match("_A__E", "RS") == built.match("_A__E", "RS")
+    index.close()
+
+
+@pytest.mark.parametrize("data", [b"", b"WGDP", b"x" * 100])
+def test_read_index_invalid(tmp_path, data):
+    path = tmp_path / "bad.pattern"
+    path.write_bytes(data)
+    with pytest.raises(ValueError):
+        query.read_index(str(path))
+
+
+def test_open_index(tmp_path):
+    index_path = str(tmp_path / "words.idx")
+    compact.write_words(index_path, WORDS[:-2], (1, 1))
+    path = query.index_path(index_path)
+    with compact.CompactWordList(index_path) as words:
+        with mock.patch.object(query, "build",
+                               wraps=query.build) as build:
+            query.open_index(words, path).close()
+            index = query.open_index(words, path)
+        assert build.call_count == 1
+        assert index.stamp == (1, 1)
+        assert [words[i] for i in index.match("____")] == \
+            [x for x in words if len(x) == 4]
+        index.close()
+    # the list changed, the index is built again
+    compact.write_words(index_path, WORDS, (2, 2))
+    with compact.CompactWordList(index_path) as words:
+        index = query.open_index(words, path)
+        assert [words[i] for i in index.match("_ETTER")] == \
+            ["LETTER", "BETTER"]
+        index.close()
+    assert query.read_index(path).stamp == (2, 2)
+
+
+def test_open_index_read_only_cache(tmp_path):
+    index_path = str(tmp_path / "words.idx")
+    compact.write_words(index_path, WORDS, (1, 1))
+    with compact.CompactWordList(index_path) as words, \
+            mock.patch.object(query, "write_index", side_effect=OSError):
+        index = query.open_index(words, query.index_path(index_path))
+        assert len(index.match("_____")) == 6
+
+
+def test_main_query(capsys):
+    assert wordguess.main(["query", "_A__E", "--exclude", "rs"]) == 0
+    words = capsys.readouterr().out.split()
+    assert words
+    assert all(len(x) == 5 and x[1] == "A" and x[4] == "E"
+               and "R" not in x and "S" not in x for x in words)
+    assert wordguess.main(["query", "_A__E", "-x", "rs", "--count"]) == 0
+    assert capsys.readouterr().out.split() == [str(len(words))]
+    assert wordguess.main(["query", "_A__E", "--limit", "2"]) == 0
+    output = capsys.readouterr().out.splitlines()
+    assert len(output) == 3
+    assert output[-1].endswith("more")
+
+
+def test_main_query_wordlist(tmp_path, capsys):
+    path = tmp_path / "words.txt"
+    path.write_text("\n".join(WORDS))
+    assert wordguess.main(["--wordlist", str(path), "query", "_A__E",
+                           "-x", "rs"]) == 0
+    assert capsys.readouterr().out.split() == ["LATTE"]
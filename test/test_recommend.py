@@ -0,0 +1,216 @@
+import random
+from unittest import mock
+
+import pytest
+
+from wordguess import difficulty
+from wordguess import engine
+from wordguess import history
+from wordguess import recommend
+from wordguess import wordguess
+
+WORDS = ["TEST", "TENT", "BEST", "JAZZ", "FIZZ", "LETTER", "BETTER",
+         "PYTHON", "YELLOW", "ORANGE", "FISHER", "SHIELD", "PRODUCE"]
+
+
+class Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(scope="module")
+def scores():
+    return difficulty.build(WORDS)[0]
+
+
+def new_recommender(scores, ids=None, **kwargs):
+    ids = range(len(WORDS)) if ids is None else ids
+    return recommend.Recommender(WORDS, ids, scores, random.Random(0),
+                                 **kwargs)
+
+
+def test_profile_target():
+    profile = recommend.Profile()
+    assert profile.target() == pytest.approx(0.5)
+    strong = recommend.Profile()
+    weak = recommend.Profile()
+    for _ in range(30):
+        strong.record(True, 0, 6)
+        weak.record(False, 6, 6)
+    assert strong.target() == 1
+    assert weak.target() == 0
+    assert strong.win_rate > 0.9 and weak.win_rate < 0.1
+    # winning with fewer wrong guesses is a higher target
+    close = recommend.Profile()
+    easy = recommend.Profile()
+    for _ in range(5):
+        close.record(True, 5, 6)
+        easy.record(True, 1, 6)
+    assert 0.5 < close.target() < easy.target()
+
+
+def test_profile_recent_games_count_most():
+    profile = recommend.Profile()
+    for _ in range(100):
+        profile.record(False, 6, 6)
+    for _ in range(recommend.RECENT_GAMES):
+        profile.record(True, 0, 6)
+    assert profile.target() > 0.5
+
+
+def test_profile_record_game():
+    profile = recommend.Profile()
+    game = engine.GameState("TEST", 1)
+    game.guess("A")
+    profile.record_game(game)
+    assert profile.games == 1
+    assert profile.win_rate < recommend.GOAL_WIN_RATE
+    assert profile.wrong_rate > recommend.GOAL_WRONG_RATE
+
+
+def test_profile_record_game_quit():
+    # a quit game leaves the profile as it was
+    profile = recommend.Profile()
+    game = engine.GameState("TEST", 6)
+    game.guess("A")
+    profile.record_game(game)
+    assert profile.games == 0
+    assert profile.target() == recommend.Profile().target()
+
+
+def test_read_profile(tmp_path):
+    path = str(tmp_path / "history.log")
+    assert recommend.read_profile(path).games == 0
+    with history.HistoryWriter(path) as log:
+        for outcome in ["won", "quit", "won", "lost", "quit"]:
+            log.record(history.GameRecord("TEST", ("A",), 1, 6, outcome,
+                                          0.0, 1.0))
+    profile = recommend.read_profile(path)
+    expected = recommend.Profile()
+    for won in [True, True, False]:
+        expected.record(won, 1, 6)
+    assert profile.games == 3
+    assert profile.win_rate == pytest.approx(expected.win_rate)
+    assert profile.wrong_rate == pytest.approx(expected.wrong_rate)
+
+
+def test_profile_cache_lru():
+    cache = recommend.ProfileCache(max_size=2, clock=Clock())
+    alice = cache.get("alice")
+    cache.get("bob")
+    assert cache.get("alice") is alice
+    cache.get("carol")
+    assert len(cache) == 2
+    assert "bob" not in cache
+    assert "alice" in cache and "carol" in cache
+
+
+def test_profile_cache_ttl():
+    clock = Clock()
+    cache = recommend.ProfileCache(ttl=10, clock=clock)
+    alice = cache.get("alice")
+    alice.record(True, 0, 6)
+    clock.now += 5
+    cache.get("bob")
+    clock.now += 6
+    assert "alice" not in cache
+    assert "bob" in cache
+    assert cache.get("alice") is not alice
+    clock.now += 20
+    cache.get("carol")
+    assert len(cache) == 1
+
+
+def test_profile_cache_put():
+    cache = recommend.ProfileCache(max_size=1, clock=Clock())
+    profile = recommend.Profile()
+    cache.put("alice", profile)
+    assert cache.get("alice") is profile
+    cache.put("bob", recommend.Profile())
+    assert len(cache) == 1 and "bob" in cache
+
+
+def test_recommender_ranked(scores):
+    recommender = new_recommender(scores)
+    assert len(recommender) == len(WORDS)
+    assert list(recommender.scores) == sorted(recommender.scores)
+    assert sorted(recommender.ids) == list(range(len(WORDS)))
+    assert list(recommender.scores) == \
+        [scores.score(i) for i in recommender.ids]
+
+
+def test_recommender_window(scores):
+    recommender = new_recommender(scores, spread=0, min_choices=3)
+    assert recommender.window(0) == (0, 3)
+    assert recommender.window(1) == (len(WORDS) - 3, len(WORDS))
+    lo, hi = recommender.window(0.5)
+    assert hi - lo >= 3
+    # every word scored within the spread of the target is in the window
+    recommender = new_recommender(scores, spread=1, min_choices=1)
+    lo, hi = recommender.window(0.5)
+    target = recommender.scores[len(WORDS) // 2]
+    assert [x for x in recommender.scores if abs(x - target) <= 1] == \
+        list(recommender.scores[lo:hi])
+
+
+def test_recommender_draw(scores):
+    recommender = new_recommender(scores, ids=[0, 1, 2, 3, 4])
+    assert recommender.draw("alice") in WORDS[:5]
+    assert "alice" in recommender.profiles
+    with pytest.raises(IndexError):
+        new_recommender(scores, ids=[]).draw("alice")
+
+
+def test_recommender_adapts(scores):
+    # a player who keeps winning gets harder words than one who loses
+    recommender = new_recommender(scores, spread=0, min_choices=3)
+    for _ in range(30):
+        recommender.profiles.get("strong").record(True, 0, 6)
+        game = engine.GameState("TEST", 1)
+        game.guess("A")
+        recommender.record("weak", game)
+    strong = [scores.score(WORDS.index(recommender.draw("strong")))
+              for _ in range(20)]
+    weak = [scores.score(WORDS.index(recommender.draw("weak")))
+            for _ in range(20)]
+    assert min(strong) > max(weak)
+
+
+def test_open_recommender():
+    recommender = recommend.open_recommender(4, 6, "easy")
+    words = wordguess.open_words(4, 6, "easy")
+    assert sorted(recommender.words[i] for i in recommender.ids) == \
+        sorted(words)
+    recommender = recommend.open_recommender(5, 5)
+    assert len(recommender) == len(wordguess.open_words(5, 5))
+
+
+def test_main_adaptive(capsys):
+    with mock.patch.object(recommend, "read_profile",
+                           wraps=recommend.read_profile) as read_profile, \
+            mock.patch.object(recommend.Recommender, "pick",
+                              return_value="LETTER") as pick:
+        wordguess.input = lambda prompt: next(guesses)
+        guesses = iter("LTER")
+        assert wordguess.main(["-s", "--adaptive", "--no_color"]) == 0
+    assert "You Won!" in capsys.readouterr().out
+    read_profile.assert_called_once()
+    profile = pick.call_args[0][0]
+    assert profile.games == 1
+    assert profile.win_rate > recommend.GOAL_WIN_RATE
+
+
+def test_play_quit_not_in_profile():
+    profile = recommend.Profile()
+    wordguess.input = lambda prompt: next(guesses)
+    guesses = iter(["L", "A", "quit"])
+    with mock.patch.object(wordguess, "clear_screen"):
+        assert wordguess.play("LETTER", 6, False, True,
+                              pause=wordguess.timing.Pause(0),
+                              profile=profile) == -1
+    assert profile.games == 0
+    assert profile.win_rate == recommend.GOAL_WIN_RATE
+    assert profile.wrong_rate == recommend.GOAL_WRONG_RATE
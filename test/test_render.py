@@ -0,0 +1,108 @@
+import io
+from unittest import mock
+
+import pytest
+
+from wordguess import render
+from wordguess import wordguess
+
+LETTERS = [x for x in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"]
+
+
+class Stream(io.StringIO):
+    # counts the writes, a frame must be a single one
+    writes = 0
+
+    def write(self, s):
+        self.writes += 1
+        return super().write(s)
+
+
+def frame(renderer, letters, blank_word, guess_num, color=False):
+    renderer.stream.seek(0)
+    renderer.stream.truncate()
+    renderer.stream.writes = 0
+    renderer(letters, blank_word, guess_num, 6, color)
+    assert renderer.stream.writes == 1
+    return renderer.stream.getvalue()
+
+
+@pytest.mark.parametrize("color, title", [
+    (False, "Word Guess"),
+    (True, "\033[1;37;40mWord Guess\033[m"),
+])
+def test_first_frame(color, title):
+    renderer = render.Renderer(Stream())
+    output = frame(renderer, LETTERS, ["_"] * 6, 0, color)
+    assert output == (
+        "\033[H\033[2J"
+        f"\033[1;1H{title}"
+        "\033[3;1HA B C D E F G H I J K L M N O P Q R S T U V W X Y Z"
+        "\033[5;1H_ _ _ _ _ _"
+        "\033[7;1HWrong Guesses 0 out of 6"
+        "\033[9;1H\033[J"
+    )
+
+
+def test_hit_redraws_changed_cells():
+    renderer = render.Renderer(Stream())
+    frame(renderer, LETTERS, ["_"] * 6, 0)
+    letters = [" " if x == "E" else x for x in LETTERS]
+    output = frame(renderer, letters, list("_E__E_"), 0)
+    assert output == "\033[3;9H \033[5;3HE\033[5;9HE\033[9;1H\033[J"
+
+
+def test_miss_redraws_counter():
+    renderer = render.Renderer(Stream())
+    frame(renderer, LETTERS, ["_"] * 6, 0)
+    letters = [" " if x == "Z" else x for x in LETTERS]
+    output = frame(renderer, letters, ["_"] * 6, 1)
+    assert output == ("\033[3;51H "
+                      "\033[7;1HWrong Guesses 1 out of 6\033[K"
+                      "\033[9;1H\033[J")
+
+
+def test_unchanged_frame_only_clears_messages():
+    renderer = render.Renderer(Stream())
+    frame(renderer, LETTERS, ["_"] * 6, 0)
+    assert frame(renderer, LETTERS, ["_"] * 6, 0) == "\033[9;1H\033[J"
+
+
+def test_new_length_redraws_everything():
+    renderer = render.Renderer(Stream())
+    frame(renderer, LETTERS, ["_"] * 6, 0)
+    output = frame(renderer, LETTERS, ["_"] * 4, 0)
+    assert output.startswith("\033[H\033[2J")
+    assert "\033[5;1H_ _ _ _" in output
+
+
+def test_reset():
+    renderer = render.Renderer(Stream())
+    frame(renderer, LETTERS, ["_"] * 6, 0)
+    renderer.reset()
+    assert frame(renderer, LETTERS, ["_"] * 6, 0).startswith("\033[H\033[2J")
+
+
+def test_play_with_renderer(capsys):
+    stream = Stream()
+    renderer = render.Renderer(stream)
+    with mock.patch.object(wordguess, "SLEEP_TIME", 0):
+        with mock.patch.object(wordguess, "clear_screen") as clear_screen:
+            wordguess.input = mock.Mock(side_effect=["L", "T", "E", "R"])
+            wordguess.play("LETTER", 6, False, True, show=renderer)
+    clear_screen.assert_not_called()
+    assert stream.getvalue().count("\033[2J") == 1
+    assert renderer.blank_word == list("LETTER")
+    assert "You Won! You got the word" in capsys.readouterr().out
+
+
+def test_main_uses_renderer_on_a_terminal(capsys):
+    with mock.patch.object(wordguess, "SLEEP_TIME", 0):
+        with mock.patch.object(wordguess, "open_words",
+                               return_value=["LETTER"]):
+            with mock.patch.object(wordguess.sys.stdout, "isatty",
+                                   return_value=True):
+                with mock.patch.object(wordguess, "play",
+                                       return_value=0) as play:
+                    wordguess.main(["-s"])
+    assert isinstance(play.call_args[0][5], render.Renderer)
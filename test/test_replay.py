@@ -0,0 +1,121 @@
+import pytest
+
+from wordguess import engine
+from wordguess import history
+from wordguess import replay
+from wordguess import wordguess
+
+GAMES = [("LETTER", "ZLETR"), ("PYTHON", "EAISUZ"), ("FISH", "FI"),
+         ("HOUSE", "E")]
+
+
+def record(word, guesses, num_wrong_guesses=6):
+    # what play() records for a game with these guesses
+    game = engine.GameState(word, num_wrong_guesses)
+    for x in guesses:
+        game.guess(x)
+    outcome = history.QUIT if game.status == engine.Status.playing \
+        else game.status
+    return history.GameRecord(word, tuple(guesses), game.wrong_guesses,
+                              num_wrong_guesses, outcome, 0.0, 1.0)
+
+
+RECORDS = [record(word, guesses) for word, guesses in GAMES]
+
+
+def write_log(path, records):
+    with history.HistoryWriter(str(path)) as writer:
+        for x in records:
+            writer.record(x)
+    return str(path)
+
+
+def test_record_outcomes():
+    assert [x.outcome for x in RECORDS] == ["won", "lost", "quit", "quit"]
+
+
+def test_check_word_guess():
+    assert replay.check(record("LETTER", ["E", "LETTER"])) is None
+    assert replay.check(record("LETTER", ["BETTER"], 1)) is None
+
+
+@pytest.mark.parametrize("changes, expected", [
+    ({"outcome": "won"}, "quit, recorded won"),
+    ({"wrong_guesses": 2}, "0 wrong guesses, recorded 2"),
+    ({"guesses": ("F", "F")}, "guess 2 'F' was already guessed"),
+    ({"guesses": ("F", "1")}, "guess 2 '1' was invalid"),
+    ({"num_wrong_guesses": 1, "guesses": ("Z", "F")},
+     "game over after 1 of 2 guesses"),
+])
+def test_check_mismatch(changes, expected):
+    assert replay.check(RECORDS[2]._replace(**changes)) == expected
+
+
+def test_replay():
+    bad = RECORDS[0]._replace(outcome="lost")
+    totals = replay.replay(RECORDS + [bad])
+    assert totals.games == 5
+    assert totals.guesses == 19
+    assert totals.mismatches == 1
+    assert totals.examples == ("LETTER Z L E T R: won, recorded lost",)
+
+
+def test_combine_keeps_a_few_examples():
+    parts = [replay.Totals(1, 2, 1, (f"game {i}",)) for i in range(20)]
+    totals = replay.combine(parts)
+    assert totals[:3] == (20, 40, 20)
+    assert len(totals.examples) == replay.MAX_EXAMPLES
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_replay_blocks(tmp_path, workers):
+    path = write_log(tmp_path / "history.log", RECORDS * 50)
+    totals = replay.replay_blocks(history.iter_blocks(path, 100), workers)
+    assert totals == replay.Totals(200, 700, 0, ())
+
+
+def args(*argv):
+    return wordguess.argument_parser(["replay", "-j", "1", *argv])
+
+
+def test_run(tmp_path, capsys):
+    first = write_log(tmp_path / "a.log", RECORDS)
+    second = write_log(tmp_path / "b.log", RECORDS[:1])
+    assert replay.run(args(first, second)) == 0
+    captured = capsys.readouterr().out
+    assert "Replayed 5 games, 19 guesses" in captured
+    assert "games per second" in captured
+
+
+def test_run_player_log(capsys):
+    write_log(history.history_path(), RECORDS)
+    assert wordguess.main(["replay", "-j", "1"]) == 0
+    assert "Replayed 4 games" in capsys.readouterr().out
+
+
+def test_run_mismatch(tmp_path, capsys):
+    path = write_log(tmp_path / "history.log",
+                     [RECORDS[0]._replace(wrong_guesses=0)])
+    assert replay.run(args(path)) == 1
+    captured = capsys.readouterr().out
+    assert "1 games did not play out as recorded" in captured
+    assert "LETTER Z L E T R: 1 wrong guesses, recorded 0" in captured
+
+
+def test_run_min_rate(tmp_path, capsys):
+    path = write_log(tmp_path / "history.log", RECORDS)
+    assert replay.run(args(path, "--min_rate", "1e12")) == 1
+    assert "Slower than" in capsys.readouterr().out
+
+
+def test_run_not_a_log(tmp_path, capsys):
+    path = tmp_path / "words.txt"
+    path.write_text("LETTER\n")
+    assert replay.run(args(str(path))) == 1
+    assert "is not a game history log" in capsys.readouterr().out
+
+
+def test_argument_parser_replay():
+    parsed = wordguess.argument_parser(["replay", "a.log", "b.log"])
+    assert parsed.logs == ["a.log", "b.log"]
+    assert parsed.min_rate is None
@@ -0,0 +1,95 @@
+import random
+from unittest import mock
+
+import pytest
+
+from wordguess import compact
+from wordguess import schedule
+from wordguess import wordguess
+
+WORDS = ["TEST", "LIGHT", "FISHER", "SHIELD", "PRODUCE", "INSTRUMENT",
+         "LETTER", "PYTHON", "YELLOW", "ORANGE"]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 4, 5, 17, 64, 100, 1000])
+@pytest.mark.parametrize("key", [0, 1, 2 ** 127 + 12345])
+def test_permutation(size, key):
+    permutation = schedule.Permutation(size, key)
+    assert len(permutation) == size
+    assert sorted(permutation) == list(range(size))
+
+
+def test_permutation_key():
+    orders = {tuple(schedule.Permutation(100, key)) for key in range(10)}
+    assert len(orders) == 10
+    assert list(schedule.Permutation(100, 7)) == \
+        list(schedule.Permutation(100, 7))
+
+
+@pytest.mark.parametrize("index", [-1, 10, 11])
+def test_permutation_index_error(index):
+    with pytest.raises(IndexError):
+        schedule.Permutation(10, 1)[index]
+
+
+def test_shuffle_bag_rounds():
+    bag = schedule.ShuffleBag(WORDS, random.Random(1))
+    first = [bag.draw() for _ in WORDS]
+    assert sorted(first) == sorted(WORDS)
+    assert bag.rounds == 1
+    assert bag.remaining() == 0
+    second = [bag.draw() for _ in WORDS]
+    assert sorted(second) == sorted(WORDS)
+    assert bag.rounds == 2
+    assert first != second
+
+
+def test_shuffle_bag_seed():
+    first = schedule.ShuffleBag(WORDS, random.Random(3))
+    second = schedule.ShuffleBag(WORDS, random.Random(3))
+    assert [first.draw() for _ in range(25)] == \
+        [second.draw() for _ in range(25)]
+
+
+def test_shuffle_bag_iter():
+    bag = schedule.ShuffleBag(WORDS, random.Random(2))
+    drawn = [bag.draw() for _ in range(4)]
+    rest = list(bag)
+    assert len(rest) == len(WORDS) - 4
+    assert sorted(drawn + rest) == sorted(WORDS)
+    assert sorted(bag) == sorted(WORDS)  # the next round
+
+
+def test_shuffle_bag_compact(tmp_path):
+    path = str(tmp_path / "words.wgd")
+    compact.write_words(path, WORDS)
+    with compact.CompactWordList(path) as words:
+        bag = schedule.ShuffleBag(words.length_range(6, 6), random.Random(4))
+        assert sorted(bag) == ["FISHER", "LETTER", "ORANGE", "PYTHON",
+                               "SHIELD", "YELLOW"]
+
+
+def test_shuffle_bag_empty():
+    with pytest.raises(IndexError):
+        schedule.ShuffleBag([]).draw()
+
+
+def test_argument_parser_seed():
+    assert wordguess.argument_parser([]).seed is None
+    assert wordguess.argument_parser(["--seed", "42"]).seed == 42
+
+
+def played_words(argv):
+    with mock.patch.object(wordguess, "open_words", return_value=WORDS):
+        with mock.patch.object(wordguess, "play",
+                               side_effect=[0] * 19 + [-1]) as play:
+            wordguess.main(argv)
+    return [x[0][0] for x in play.call_args_list]
+
+
+def test_main_seed():
+    words = played_words(["-a", "--seed", "42"])
+    assert words == played_words(["-a", "--seed", "42"])
+    assert words != played_words(["-a", "--seed", "43"])
+    assert sorted(words[:10]) == sorted(WORDS)
+    assert sorted(words[10:]) == sorted(WORDS)
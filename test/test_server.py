@@ -0,0 +1,254 @@
+import asyncio
+import json
+from unittest import mock
+
+import pytest
+
+from wordguess import engine
+from wordguess import server
+from wordguess import wordguess
+
+
+async def start(**kwargs):
+    game_server = server.GameServer(["LETTER"], 6, **kwargs)
+    tcp_server = await game_server.start("127.0.0.1", 0)
+    port = tcp_server.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    return game_server, tcp_server, reader, writer
+
+
+async def guess(reader, writer, text):
+    writer.write(text.encode() + b"\n")
+    await writer.drain()
+    return json.loads(await reader.readline())
+
+
+def run_session(guesses, **kwargs):
+    async def session():
+        game_server, tcp_server, reader, writer = await start(**kwargs)
+        replies = [json.loads(await reader.readline())]
+        for text in guesses:
+            replies.append(await guess(reader, writer, text))
+            if replies[-1]["status"] != engine.Status.playing:
+                replies.append(json.loads(await reader.readline()))
+        writer.close()
+        tcp_server.close()
+        await tcp_server.wait_closed()
+        return game_server, replies
+
+    return asyncio.run(session())
+
+
+def test_message():
+    game = engine.GameState("LETTER", 6)
+    game.guess("E")
+    assert server.message("hit", game) == {
+        "result": "hit", "board": "_E__E_", "wrong_guesses": 0,
+        "num_wrong_guesses": 6, "status": "playing",
+    }
+    game.guess("LETTER")
+    assert server.message("word correct", game)["word"] == "LETTER"
+
+
+def test_server_win():
+    game_server, replies = run_session(["e", "T", "L", "R"])
+    assert replies[0]["result"] == "new game"
+    assert replies[0]["board"] == "______"
+    assert [x["result"] for x in replies[1:5]] == ["hit"] * 4
+    assert replies[4]["status"] == "won"
+    assert replies[4]["word"] == "LETTER"
+    assert replies[5]["result"] == "new game"
+    assert game_server.games == 2
+
+
+def test_server_lose():
+    _, replies = run_session(["A", "B", "C", "D", "F", "G"])
+    assert replies[6]["status"] == "lost"
+    assert replies[6]["wrong_guesses"] == 6
+    assert replies[7]["result"] == "new game"
+
+
+@pytest.mark.parametrize("test_input, expected_result", [
+    ("1", "invalid"), ("", "invalid"), ("TESTING", "word wrong"),
+    ("W", "miss"),
+])
+def test_server_results(test_input, expected_result):
+    _, replies = run_session([test_input])
+    assert replies[1]["result"] == expected_result
+
+
+def test_server_no_guess_word():
+    _, replies = run_session(["LETTER"], guess_word=False)
+    assert replies[1]["result"] == "invalid"
+
+
+def test_server_quit():
+    async def session():
+        game_server, tcp_server, reader, writer = await start()
+        await reader.readline()
+        assert game_server.sessions == 1
+        writer.write(b"quit\n")
+        await writer.drain()
+        assert await reader.readline() == b""
+        tcp_server.close()
+        await tcp_server.wait_closed()
+        return game_server
+
+    assert asyncio.run(session()).sessions == 0
+
+
+def test_server_delay_does_not_block_other_sessions():
+    async def session():
+        game_server, tcp_server, reader, writer = await start(delay=0.5)
+        port = tcp_server.sockets[0].getsockname()[1]
+        await reader.readline()
+        writer.write(b"W\n")  # a miss, this session pauses
+        await writer.drain()
+        reader2, writer2 = await asyncio.open_connection("127.0.0.1", port)
+        await reader2.readline()
+        reply = await asyncio.wait_for(guess(reader2, writer2, "E"), 0.25)
+        slow_reply = json.loads(await reader.readline())
+        for w in (writer, writer2):
+            w.close()
+        tcp_server.close()
+        await tcp_server.wait_closed()
+        return reply, slow_reply
+
+    reply, slow_reply = asyncio.run(session())
+    assert reply["result"] == "hit"
+    assert slow_reply["result"] == "miss"
+
+
+def test_argument_parser_serve():
+    result = wordguess.argument_parser(["serve", "--port", "0",
+                                        "--delay", "0.5", "-W", "3"])
+    assert result.command == "serve"
+    assert result.host == wordguess.DEFAULT_HOST
+    assert result.port == 0
+    assert result.delay == 0.5
+    assert result.num_wrong_guesses == 3
+
+
+def boards_dealt(game_server, sessions):
+    # the first board of each session, one session after another
+    async def deal():
+        tcp_server = await game_server.start("127.0.0.1", 0)
+        port = tcp_server.sockets[0].getsockname()[1]
+        boards = []
+        for _ in range(sessions):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            boards.append(json.loads(await reader.readline())["board"])
+            writer.close()
+        tcp_server.close()
+        await tcp_server.wait_closed()
+        return boards
+
+    return asyncio.run(deal())
+
+
+@pytest.mark.parametrize("argv", [
+    ["--seed", "5", "serve"], ["serve", "--seed", "5"],
+])
+def test_new_server_seed(argv):
+    # the same seed deals the same words, told apart by their lengths
+    words = ["TEST", "FIZZY", "LETTER", "PRODUCE", "SHIELDED", "SHORTENED"]
+    args = wordguess.argument_parser(argv)
+    assert args.seed == 5
+    first = boards_dealt(server.new_server(args, words), 8)
+    assert boards_dealt(server.new_server(args, words), 8) == first
+    assert len(set(first)) > 1
+
+
+def test_main_serve_no_words(tmp_path, capsys):
+    path = tmp_path / "words.txt"
+    path.write_text("TEST\n")
+    with mock.patch.object(server.asyncio, "run") as run:
+        assert wordguess.main(["--wordlist", str(path), "serve",
+                               "--min", "5"]) == 1
+    assert "Error no words between 5 and" in capsys.readouterr().out
+    run.assert_not_called()
+
+
+@pytest.mark.parametrize("argv, delay", [
+    (["-W", "3", "--max", "9", "--delay", "1", "serve"], 1),
+    (["serve", "-W", "3", "--max", "9", "--delay", "1"], 1),
+    (["-W", "5", "--delay", "2", "serve", "-W", "3", "--max", "9"], 2),
+    (["-W", "3", "--max", "9", "serve"], 0),
+])
+def test_argument_parser_serve_options_placement(argv, delay):
+    # the game options count before or after the command, after wins
+    result = wordguess.argument_parser(argv)
+    assert result.num_wrong_guesses == 3
+    assert result.max == 9
+    assert result.delay == delay
+
+
+@pytest.mark.parametrize("test_values, expected_results", [
+    ("0", 0), ("0.5", 0.5), ("3", 3),
+])
+def test_non_negative_float(test_values, expected_results):
+    assert wordguess.non_negative_float(test_values) == expected_results
+
+
+@pytest.mark.parametrize("test_values", [
+    "-1", "-0.1", "a", "", "nan", "inf",
+])
+def test_non_negative_float_error(test_values):
+    with pytest.raises(wordguess.argparse.ArgumentTypeError):
+        wordguess.non_negative_float(test_values)
+
+
+def test_server_match():
+    async def session():
+        game_server = server.GameServer(["LETTER"], 6, match_size=2,
+                                        rounds=2)
+        tcp_server = await game_server.start("127.0.0.1", 0)
+        port = tcp_server.sockets[0].getsockname()[1]
+        first = await asyncio.open_connection("127.0.0.1", port)
+        waiting = json.loads(await first[0].readline())
+        second = await asyncio.open_connection("127.0.0.1", port)
+        starts = [json.loads(await x[0].readline()) for x in (first, second)]
+        replies = [await guess(*first, "LETTER"),
+                   json.loads(await first[0].readline()),
+                   await guess(*first, "LETTER")]
+        second[1].write(b"quit\n")
+        over = [json.loads(await x[0].readline()) for x in (first, second)]
+        for _, writer in (first, second):
+            writer.close()
+        tcp_server.close()
+        await tcp_server.wait_closed()
+        return game_server, waiting, starts, replies, over
+
+    game_server, waiting, starts, replies, over = asyncio.run(session())
+    assert waiting == {"result": "waiting", "player": "player1",
+                       "players": 1, "match_size": 2}
+    assert [x["result"] for x in starts] == ["new game"] * 2
+    assert starts[0]["rounds"] == 2
+    assert [x["result"] for x in replies] == [
+        "word correct", "new game", "word correct"]
+    assert [x["rounds_played"] for x in replies] == [1, 1, 2]
+    assert over[0] == {**over[1], "player": "player1"}
+    assert over[0]["result"] == "match over"
+    assert [(x["name"], x["won"]) for x in over[0]["rankings"]] == [
+        ("player1", 2), ("player2", 0)]
+    assert game_server.games == 3
+    assert game_server.sessions == 0
+
+
+def test_server_match_time_limit():
+    async def session():
+        game_server = server.GameServer(["LETTER"], 6, match_size=1,
+                                        time_limit=0.1)
+        tcp_server = await game_server.start("127.0.0.1", 0)
+        port = tcp_server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        replies = [json.loads(await reader.readline()) for _ in range(3)]
+        writer.close()
+        tcp_server.close()
+        await tcp_server.wait_closed()
+        return replies
+
+    replies = asyncio.run(session())
+    assert [x["result"] for x in replies] == ["new game", "time up",
+                                              "match over"]
+    assert replies[2]["rankings"][0]["finished"] == 0.1
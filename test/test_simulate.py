@@ -0,0 +1,180 @@
+import random
+from unittest import mock
+
+import pytest
+
+from wordguess import engine
+from wordguess import simulate
+from wordguess import wordguess
+
+WORDS = ["LETTER", "BETTER", "SETTER", "PYTHON", "FISHER", "SHIELD"]
+
+
+def test_frequency_strategy():
+    strategy = simulate.FrequencyStrategy(WORDS)
+    game = engine.GameState("LETTER", 6)
+    assert strategy.order[:3] == ["E", "R", "T"]
+    assert strategy.next_letter(game, random.Random(0)) == "E"
+    game.guess("E")
+    assert strategy.next_letter(game, random.Random(0)) == "R"
+
+
+def test_random_strategy():
+    strategy = simulate.RandomStrategy(WORDS)
+    game = engine.GameState("LETTER", 26)
+    rng = random.Random(0)
+    guesses = []
+    while game.status == engine.Status.playing:
+        letter = strategy.next_letter(game, rng)
+        assert letter not in guesses
+        guesses.append(letter)
+        game.guess_letter(letter)
+    assert game.status == engine.Status.won
+
+
+def test_entropy_strategy():
+    strategy = simulate.EntropyStrategy(WORDS)
+    game = engine.GameState("SETTER", 6)
+    strategy.start(game)
+    rng = random.Random(0)
+    while game.status == engine.Status.playing:
+        game.guess_letter(strategy.next_letter(game, rng))
+    assert strategy.candidates == ["SETTER"]
+    assert game.status == engine.Status.won
+
+
+def test_solver_strategy():
+    strategy = simulate.SolverStrategy(WORDS)
+    game = engine.GameState("SHIELD", 6)
+    strategy.start(game)
+    rng = random.Random(0)
+    while game.status == engine.Status.playing:
+        game.guess_letter(strategy.next_letter(game, rng))
+    assert game.status == engine.Status.won
+    assert game.wrong_guesses == 0
+
+
+@pytest.mark.parametrize("argv, backend", [
+    ([], "python"),
+    (["--solver_backend", "numpy"], "numpy"),
+    (["--solver_backend", "python", "simulate", "--solver_backend",
+      "numpy"], "numpy"),
+    (["simulate", "--solver_backend", "numpy"], "numpy"),
+])
+def test_simulate_solver_backend(argv, backend):
+    if "simulate" not in argv:
+        argv = [*argv, "simulate"]
+    args = wordguess.argument_parser([*argv, "-g", "3", "-j", "1",
+                                      "--strategy", "solver"])
+    assert args.solver_backend == backend
+    assert simulate.simulate(args).games == 3
+    assert simulate._worker_strategy.solver.backend == backend
+
+
+@pytest.mark.parametrize("name", ["frequency", "random", "entropy",
+                                  "solver"])
+def test_play_games(name):
+    strategy = simulate.STRATEGIES[name](WORDS)
+    result = simulate.play_games(WORDS, strategy, 6, 20, 1)
+    assert result.games == 20
+    assert 0 <= result.wins <= 20
+    assert result.guesses >= result.wrong_guesses
+    assert result == simulate.play_games(WORDS, strategy, 6, 20, 1)
+
+
+def test_combine():
+    result = simulate.combine([simulate.Totals(2, 1, 3, 9),
+                               simulate.Totals(3, 2, 4, 11)])
+    assert result == simulate.Totals(5, 3, 7, 20)
+    assert simulate.combine([]) == simulate.Totals()
+
+
+@pytest.mark.parametrize("workers", ["1", "2"])
+def test_simulate(workers):
+    args = wordguess.argument_parser(["simulate", "-g", "30", "--seed", "3",
+                                      "-j", workers, "--chunk_size", "7"])
+    result = simulate.simulate(args)
+    assert result.games == 30
+    assert result == simulate.simulate(args)
+
+
+def test_main_simulate(capsys):
+    result = wordguess.main(["simulate", "-g", "10", "-j", "1",
+                             "--strategy", "random", "-W", "8"])
+    captured = capsys.readouterr().out
+    assert result == 0
+    assert "Strategy random: 10 games, 8 wrong guesses allowed" in captured
+    assert "Win rate" in captured
+    assert "Average wrong guesses" in captured
+    assert "games per second" in captured
+
+
+@pytest.mark.parametrize("test_input", [
+    ["simulate", "-g", "0"], ["simulate", "--strategy", "best"],
+    ["simulate", "-j", "-1"], ["simulate", "--chunk_size", "a"],
+])
+def test_argument_parser_simulate_error(test_input):
+    with pytest.raises(SystemExit):
+        wordguess.argument_parser(test_input)
+
+
+def test_argument_parser_simulate_defaults():
+    result = wordguess.argument_parser(["simulate"])
+    assert result.command == "simulate"
+    assert result.games == wordguess.DEFAULT_NUM_GAMES
+    assert result.strategy == "frequency"
+    assert result.num_wrong_guesses == wordguess.DEFAULT_NUM_WRONG_GUESSES
+    assert result.seed is None
+
+
+@pytest.mark.parametrize("argv", [
+    ["--min", "8", "--seed", "5", "-W", "3", "--difficulty", "easy",
+     "simulate"],
+    ["simulate", "--min", "8", "--seed", "5", "-W", "3", "--difficulty",
+     "easy"],
+    ["--min", "5", "--seed", "1", "-W", "9", "simulate", "--min", "8",
+     "--seed", "5", "-W", "3", "--difficulty", "easy"],
+])
+def test_argument_parser_simulate_options_placement(argv):
+    # the game options count before or after the command, after wins
+    result = wordguess.argument_parser(argv)
+    assert result.min == 8
+    assert result.max == wordguess.DEFAULT_MAX_LENGTH
+    assert result.seed == 5
+    assert result.num_wrong_guesses == 3
+    assert result.difficulty == "easy"
+
+
+@pytest.mark.parametrize("workers", ["1", "2"])
+def test_main_simulate_loads_words_once(capsys, workers):
+    # the workers get the words, a tier isn't opened again in each one
+    with mock.patch.object(wordguess, "load_words",
+                           wraps=wordguess.load_words) as load_words:
+        assert wordguess.main(["simulate", "-g", "6", "-j", workers,
+                               "--difficulty", "easy"]) == 0
+    load_words.assert_called_once()
+    assert "easy words" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("argv", [
+    ["--min", "5", "simulate", "-j", "1"],
+    ["simulate", "-j", "2", "--min", "5"],
+    ["simulate", "-j", "2", "--difficulty", "hard"],
+])
+def test_main_simulate_no_words(tmp_path, capsys, argv):
+    # refused before any games are played or workers started
+    path = tmp_path / "words.txt"
+    path.write_text("TEST\n")
+    with mock.patch.object(simulate, "simulate") as simulate_games:
+        assert wordguess.main(["--wordlist", str(path), *argv]) == 1
+    assert "Error no " in capsys.readouterr().out
+    simulate_games.assert_not_called()
+
+
+@pytest.mark.parametrize("before", [True, False])
+def test_main_simulate_missing_wordlist(tmp_path, capsys, before):
+    wordlist = ["--wordlist", str(tmp_path / "missing.txt")]
+    argv = ["simulate", "-g", "5", "-j", "1"]
+    argv = wordlist + argv if before else argv + wordlist
+    assert wordguess.main(argv) == 1
+    assert "Error no word list" in capsys.readouterr().out
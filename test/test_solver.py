@@ -0,0 +1,187 @@
+from unittest import mock
+
+import pytest
+
+from wordguess import engine
+from wordguess import solver
+
+WORDS = ["LETTER", "BETTER", "SETTER", "PYTHON", "FISHER", "SHIELD",
+         "TEST", "LIGHT"]
+
+
+@pytest.fixture(params=solver.BACKENDS)
+def word_solver(request):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    return solver.Solver(WORDS, backend=request.param)
+
+
+def test_start(word_solver):
+    candidates = word_solver.start(6)
+    assert candidates.pattern == "______"
+    assert candidates.wrong == ""
+    assert word_solver.select(candidates) == WORDS[:6]
+
+
+@pytest.mark.parametrize("blank_word, wrong, expected_result", [
+    ("______", "", ["LETTER", "BETTER", "SETTER", "PYTHON", "FISHER",
+                    "SHIELD"]),
+    ("_ETTE_", "", ["LETTER", "BETTER", "SETTER"]),
+    ("_ETTE_", "B", ["LETTER", "SETTER"]),
+    ("______", "E", ["PYTHON"]),
+    ("S_____", "", ["SETTER", "SHIELD"]),
+    ("_____R", "", ["LETTER", "BETTER", "SETTER", "FISHER"]),
+    ("___T__", "", []),
+    ("______", "T", ["FISHER", "SHIELD"]),
+])
+def test_candidates(word_solver, blank_word, wrong, expected_result):
+    candidates = word_solver.candidates(list(blank_word), wrong)
+    assert word_solver.select(candidates) == expected_result
+
+
+def test_candidates_hidden_letter_excluded(word_solver):
+    # E shown only at position 1 rules out words with another E
+    candidates = word_solver.candidates("_E____", "")
+    assert word_solver.select(candidates) == []
+
+
+def test_narrow_incremental(word_solver):
+    candidates = word_solver.start(6)
+    candidates = word_solver.narrow(candidates, "____E_", "")
+    assert word_solver.select(candidates) == ["FISHER"]
+    candidates = word_solver.start(6)
+    candidates = word_solver.narrow(candidates, "_E__E_", "")
+    candidates = word_solver.narrow(candidates, "_ETTE_", "A")
+    candidates = word_solver.narrow(candidates, "_ETTE_", "AB")
+    assert candidates.wrong == "AB"
+    assert word_solver.select(candidates) == ["LETTER", "SETTER"]
+    result = word_solver.candidates("_ETTE_", "BA")
+    assert result.pattern == candidates.pattern
+    assert result.wrong == candidates.wrong
+    assert word_solver.select(result) == ["LETTER", "SETTER"]
+
+
+def test_narrow_new_length(word_solver):
+    candidates = word_solver.narrow(word_solver.start(6), "T__T", "")
+    assert word_solver.select(candidates) == ["TEST"]
+
+
+def test_letter_counts(word_solver):
+    candidates = word_solver.candidates("_ETTE_", "")
+    counts = word_solver.letter_counts(candidates)
+    assert "E" not in counts and "T" not in counts
+    assert counts["R"] == 3
+    assert counts["L"] == 1
+    assert counts["Z"] == 0
+    assert word_solver.letter_counts(candidates) is counts
+
+
+def test_letter_counts_cache_size():
+    word_solver = solver.Solver(WORDS, cache_size=2, backend="python")
+    for pattern in ["L_____", "B_____", "S_____"]:
+        word_solver.letter_counts(word_solver.candidates(pattern, ""))
+    assert list(word_solver._counts) == [("B_____", ""), ("S_____", "")]
+
+
+@pytest.mark.parametrize("blank_word, wrong, expected_result", [
+    ("______", "", "E"),
+    ("_ETTE_", "", "R"),
+    ("_ETTER", "BS", "L"),
+    ("____", "", "E"),
+    ("ZZZZZ", "", "G"),
+])
+def test_suggest(word_solver, blank_word, wrong, expected_result):
+    assert word_solver.suggest(blank_word, wrong) == expected_result
+
+
+def test_best_letter_no_letters_left():
+    word_solver = solver.Solver(["AB"], backend="python")
+    with pytest.raises(ValueError):
+        word_solver.suggest("AB", "CDEFGHIJKLMNOPQRSTUVWXYZ")
+
+
+def test_popcount():
+    assert solver.popcount(0) == 0
+    assert solver.popcount(0b1011) == 3
+    assert solver.popcount((1 << 1000) - 1) == 1000
+
+
+def test_count(word_solver):
+    assert word_solver.count(word_solver.start(6)) == 6
+    assert word_solver.count(word_solver.candidates("_ETTE_", "L")) == 2
+    assert word_solver.count(word_solver.start(9)) == 0
+
+
+def test_position_counts(word_solver):
+    result = word_solver.position_counts(word_solver.candidates("_ETTE_", ""))
+    assert len(result) == 6
+    assert result[0]["L"] == result[0]["B"] == result[0]["S"] == 1
+    assert result[1]["E"] == 3
+    assert result[5]["R"] == 3
+    assert sum(result[0].values()) == 3
+
+
+def test_non_ascii_words(word_solver):
+    word_solver = solver.Solver(["CAFÉ", "CAFE"], backend=word_solver.backend)
+    candidates = word_solver.candidates("CAF_", "")
+    assert word_solver.select(candidates) == ["CAFÉ", "CAFE"]
+    candidates = word_solver.narrow(candidates, "CAF_", "E")
+    assert word_solver.select(candidates) == ["CAFÉ"]
+
+
+def test_backend_error():
+    with pytest.raises(ValueError):
+        solver.Solver(WORDS, backend="fortran")
+
+
+def test_backend_default():
+    assert solver.Solver(WORDS).backend == "python"
+
+
+def test_backend_numpy_fallback():
+    with mock.patch.object(solver, "numpy", None):
+        word_solver = solver.Solver(WORDS, backend="numpy")
+    assert word_solver.backend == "python"
+    assert word_solver.suggest("_ETTE_", "") == "R"
+
+
+def test_backends_agree():
+    pytest.importorskip("numpy")
+    words = WORDS + ["LETTERS", "BOTTLE", "BATTLE", "RATTLE", "TATTLE"]
+    python_solver = solver.Solver(words, backend="python")
+    numpy_solver = solver.Solver(words, backend="numpy")
+    for blank_word, wrong in [("______", ""), ("_ATTLE", ""),
+                              ("__TT__", "AO"), ("_____E", "R")]:
+        python_candidates = python_solver.candidates(blank_word, wrong)
+        numpy_candidates = numpy_solver.candidates(blank_word, wrong)
+        assert (python_solver.select(python_candidates) ==
+                numpy_solver.select(numpy_candidates))
+        assert (python_solver.letter_counts(python_candidates) ==
+                numpy_solver.letter_counts(numpy_candidates))
+        assert (python_solver.position_counts(python_candidates) ==
+                numpy_solver.position_counts(numpy_candidates))
+
+
+@pytest.mark.parametrize("backend", solver.BACKENDS)
+def test_alphabet(backend):
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+    alphabet = engine.Alphabet("ABCDEFGHIJKLMNOPQRSTUVWXYZÅÄÖ")
+    words = ["SMÖR", "SMÅL", "SÄLJ", "HÖNA"]
+    word_solver = solver.Solver(words, backend=backend, alphabet=alphabet)
+    candidates = word_solver.candidates("S___", "")
+    assert word_solver.select(candidates) == ["SMÖR", "SMÅL", "SÄLJ"]
+    assert word_solver.letter_counts(candidates)["Ö"] == 1
+    assert word_solver.position_counts(candidates)[2]["Å"] == 1
+    assert word_solver.select(word_solver.candidates("SM__", "Ö")) == [
+        "SMÅL"]
+    assert word_solver.suggest("SM__", "Ö") in "ÅL"
+
+
+def test_alphabet_numpy_too_many_letters():
+    pytest.importorskip("numpy")
+    alphabet = engine.Alphabet(chr(0x4E00 + i) for i in range(300))
+    word_solver = solver.Solver([alphabet.letters[:4]], backend="numpy",
+                                alphabet=alphabet)
+    assert word_solver.backend == "python"
+    assert word_solver.suggest("_" * 4, "") in alphabet.letters[:4]
@@ -0,0 +1,113 @@
+import io
+import os
+import time
+from unittest import mock
+
+import pytest
+
+from wordguess import timing
+from wordguess import wordguess
+
+needs_termios = pytest.mark.skipif(timing.termios is None,
+                                   reason="needs a POSIX terminal")
+
+
+@pytest.fixture
+def terminal():
+    # the player's side of a pseudo terminal and the keyboard end
+    master, slave = os.openpty()
+    stdin = os.fdopen(slave, "r")
+    yield stdin, master
+    stdin.close()
+    os.close(master)
+
+
+@pytest.mark.parametrize("stdin_tty, stdout_tty, expected", [
+    (True, True, False), (False, True, True), (True, False, True),
+    (False, False, True),
+])
+def test_fast_mode(stdin_tty, stdout_tty, expected):
+    with mock.patch.object(timing.sys.stdin, "isatty",
+                           return_value=stdin_tty):
+        with mock.patch.object(timing.sys.stdout, "isatty",
+                               return_value=stdout_tty):
+            assert timing.fast_mode() == expected
+
+
+def test_fast_mode_under_pytest():
+    # captured output is not a terminal
+    assert timing.fast_mode()
+
+
+@pytest.mark.parametrize("delay, fast", [(5, True), (0, False), (5, None)])
+def test_pause_skipped(delay, fast):
+    pause = timing.Pause(delay, fast, io.StringIO())
+    start = time.perf_counter()
+    pause()
+    pause()
+    assert time.perf_counter() - start < 1
+    assert pause.count == 2
+    assert pause.total == 0
+
+
+def test_pause_sleeps_without_terminal():
+    pause = timing.Pause(0.05, False, io.StringIO())
+    pause()
+    assert pause.count == 1
+    assert pause.skipped == 0
+    assert pause.total >= 0.05
+
+
+@needs_termios
+def test_wait_for_key_times_out(terminal):
+    stdin, _ = terminal
+    start = time.perf_counter()
+    assert not timing.wait_for_key(0.05, stdin)
+    assert time.perf_counter() - start >= 0.05
+
+
+@needs_termios
+def test_wait_for_key_pressed(terminal):
+    stdin, master = terminal
+    os.write(master, b"x")
+    start = time.perf_counter()
+    assert timing.wait_for_key(5, stdin)
+    assert time.perf_counter() - start < 1
+    # the key is not left over for the next guess, line mode is back
+    os.write(master, b"E\n")
+    assert stdin.readline() == "E\n"
+
+
+@needs_termios
+def test_pause_key_press(terminal):
+    stdin, master = terminal
+    os.write(master, b" ")
+    pause = timing.Pause(5, False, stdin)
+    pause()
+    assert pause.skipped == 1
+    assert pause.total < 1
+
+
+def test_play_uses_pause(capsys):
+    pause = mock.Mock()
+    wordguess.input = mock.Mock(side_effect=["1", "Z", "L", "T", "E", "R"])
+    wordguess.play("LETTER", 6, False, True, pause=pause)
+    # invalid input, a miss and the win
+    assert pause.call_count == 3
+
+
+@pytest.mark.parametrize("argv, expected", [
+    ([], wordguess.SLEEP_TIME), (["--delay", "0"], 0),
+    (["--delay", "1.5"], 1.5),
+])
+def test_argument_parser_delay(argv, expected):
+    assert wordguess.argument_parser(argv).delay == expected
+
+
+def test_main_delay():
+    with mock.patch.object(wordguess, "open_words", return_value=["LETTER"]):
+        with mock.patch.object(wordguess, "play", return_value=0) as play:
+            wordguess.main(["-s", "--delay", "0.5"])
+    pause = play.call_args[0][6]
+    assert isinstance(pause, timing.Pause)
+    assert pause.delay == 0.5
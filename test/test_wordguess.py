@@ -1,7 +1,11 @@
+import subprocess
+import sys
 from unittest import mock
 
 import pytest
 
+from wordguess import engine
+from wordguess import solver
 from wordguess import wordguess
 
 
@@ -22,12 +26,12 @@ def test_load_words():
                            return_value=test_word_str):
         result = wordguess.load_words(4, 15)
 
-    assert result == test_words
+    assert result == ["PYTHON", "FINISH", "YELLOW", "ORANGE", "TESTING"]
 
 
 @pytest.mark.parametrize("test_length, expected_result", [
-    (10, ["TEST", "FISHER", "PRODUCE", "INSTRUMENT", "LIGHT", "SHIELD"]),
-    (8, ["TEST", "FISHER", "PRODUCE", "LIGHT", "SHIELD"]),
+    (10, ["TEST", "LIGHT", "FISHER", "SHIELD", "PRODUCE", "INSTRUMENT"]),
+    (8, ["TEST", "LIGHT", "FISHER", "SHIELD", "PRODUCE"]),
 ])
 def test_load_words_max_length(test_length, expected_result):
     test_words = ["TEST", "FISHER", "PRODUCE", "INSTRUMENT", "TEMPERATURE",
@@ -67,6 +71,17 @@ def test_load_words_min_max_length():
     assert result == ["INSTRUMENT"]
 
 
+def test_load_words_uses_index(cache_dir):
+    test_words_str = "\n".join(["TEST", "FISHER", "PRODUCE"])
+    with mock.patch.object(wordguess.importlib.resources, "read_text",
+                           return_value=test_words_str) as read_text:
+        wordguess.load_words(4, 15)
+        result = wordguess.load_words(5, 6)
+    assert result == ["FISHER"]
+    assert read_text.call_count == 1
+    assert (cache_dir / "words.txt.idx").exists()
+
+
 # def test_random_word():
 #     with mock.patch.object(wordguess.random, "choice", return_value="COMMIT"):
 #         result = wordguess.random_word(["CHOICE", "ENTERPRISE", "COMMIT"])
@@ -138,9 +153,68 @@ def test_play_win_color(capsys):
         assert "\033[1;32mYou Won! You got the word\033[m" in captured
 
 
+def test_play_alphabet(capsys):
+    alphabet = engine.Alphabet("ABCDEFGHIJKLMNOPQRSTUVWXYZÅÄÖ")
+    with mock.patch.object(wordguess, "SLEEP_TIME", 0):
+        wordguess.input = mock_input("s", "å", "m", "o\u0308", "r")
+        wordguess.play("SMÖR", 6, False, True, alphabet=alphabet)
+    captured = capsys.readouterr().out
+    assert "Letter Å not in the word" in captured
+    assert "Ä Ö" in captured
+    assert "You Won! You got the word" in captured
+
+
+@pytest.mark.parametrize("color_mode, expected", [
+    (False, "Hint: try the letter R"),
+    (True, "\033[1;32mHint: try the letter R\033[m"),
+])
+def test_play_hint(capsys, color_mode, expected):
+    hints = solver.Solver(["LETTER", "BETTER", "SHIELD"])
+    with mock.patch.object(wordguess, "SLEEP_TIME", 0):
+        wordguess.input = mock_input("E", "?", "quit")
+        wordguess.play("LETTER", 6, color_mode, True, hints)
+        captured = capsys.readouterr().out
+        assert "Enter a letter, '?' for a hint or 'quit' to quit: " in captured
+        assert expected in captured
+
+
+def test_play_hint_disabled(capsys):
+    with mock.patch.object(wordguess, "SLEEP_TIME", 0):
+        wordguess.input = mock_input("?", "quit")
+        wordguess.play("LETTER", 6, False, True)
+        captured = capsys.readouterr().out
+        assert "Invalid input please try again" in captured
+        assert "Hint" not in captured
+
+
+def test_main_hints(capsys):
+    with mock.patch.object(wordguess, "SLEEP_TIME", 0):
+        with mock.patch.object(wordguess, "open_words",
+                               return_value=["LETTER", "BETTER"]):
+            with mock.patch.object(wordguess.schedule.ShuffleBag, "draw",
+                                   return_value="LETTER"):
+                wordguess.input = mock_input("?", "quit")
+                wordguess.main(["-s", "--no_color", "--hints"])
+                captured = capsys.readouterr().out
+                assert "Hint: try the letter E" in captured
+
+
+@pytest.mark.parametrize("argv, backend", [
+    ([], "python"), (["--solver_backend", "numpy"], "numpy"),
+])
+def test_main_hints_solver_backend(argv, backend):
+    with mock.patch.object(wordguess, "open_words",
+                           return_value=["LETTER", "BETTER"]), \
+            mock.patch.object(solver, "Solver",
+                              wraps=solver.Solver) as new_solver:
+        wordguess.input = mock_input("quit")
+        wordguess.main(["-s", "--delay", "0", "--hints", *argv])
+    assert new_solver.call_args[1]["backend"] == backend
+
+
 def test_main_play_again(capsys):
     with mock.patch.object(wordguess, "SLEEP_TIME", 0):
-        with mock.patch.object(wordguess, "load_words", return_value=["LETTER"]):
+        with mock.patch.object(wordguess, "open_words", return_value=["LETTER"]):
             wordguess.input = mock_input("L", "T", "E", "R", "N")
             wordguess.main()
             captured = capsys.readouterr().out
@@ -150,7 +224,7 @@ def test_main_play_again(capsys):
 
 def test_main_single_play(capsys):
     with mock.patch.object(wordguess, "SLEEP_TIME", 0):
-        with mock.patch.object(wordguess, "load_words", return_value=["LETTER"]):
+        with mock.patch.object(wordguess, "open_words", return_value=["LETTER"]):
             wordguess.input = mock_input("L", "T", "E", "R", "N")
             wordguess.main(["-s"])
             captured = capsys.readouterr().out
@@ -160,7 +234,7 @@ def test_main_single_play(capsys):
 
 def test_main_auto_play(capsys):
     with mock.patch.object(wordguess, "SLEEP_TIME", 0):
-        with mock.patch.object(wordguess, "load_words", return_value=["LETTER"]):
+        with mock.patch.object(wordguess, "open_words", return_value=["LETTER"]):
             wordguess.input = mock_input("L", "T", "E", "R", "L", "quit")
             wordguess.main(["-a"])
             captured = capsys.readouterr().out
@@ -242,12 +316,20 @@ def test_play_guess_whole_word_false(test_input, capsys):
 @pytest.mark.parametrize("test_value, expected_result", [
     ([], wordguess.DEFAULT_NUM_WRONG_GUESSES),
     (["-W", "10"], 10),
+    (["-W", "255"], 255),
 ])
 def test_argument_parser_num_wrong_guess(test_value, expected_result):
     result = wordguess.argument_parser(test_value)
     assert result.num_wrong_guesses == expected_result
 
 
+@pytest.mark.parametrize("test_value", ["0", "256", "300", "a"])
+def test_argument_parser_num_wrong_guess_error(test_value):
+    # more than the history log can record
+    with pytest.raises(SystemExit):
+        wordguess.argument_parser(["-W", test_value])
+
+
 @pytest.mark.parametrize("test_length, expected_result", [
     ("10", 10), ("15", 15), ("4", 4), ("8", 8)
 ])
@@ -306,6 +388,20 @@ def test_argument_parsing_auto_play(test_input, expected_result):
     assert result.auto_play == expected_result
 
 
+@pytest.mark.parametrize("test_input, expected_result", [
+    ([], False), (["--hints"], True)
+])
+def test_argument_parsing_hints(test_input, expected_result):
+    result = wordguess.argument_parser(test_input)
+    assert result.hints == expected_result
+
+
+def test_argument_parsing_solver_backend():
+    assert wordguess.argument_parser([]).solver_backend == "python"
+    with pytest.raises(SystemExit):
+        wordguess.argument_parser(["--solver_backend", "fortran"])
+
+
 @pytest.mark.parametrize("test_input, expected_result", [
     ([], True), (["-n"], False)
 ])
@@ -321,6 +417,35 @@ def test_display_version(capsys):
     assert f"{wordguess.version}\n" == captured
 
 
+def test_version_looked_up_only_for_version_option():
+    wordguess.get_version.cache_clear()
+    wordguess.argument_parser(["-s"])
+    assert wordguess.get_version.cache_info().misses == 0
+    assert wordguess.version == wordguess.get_version()
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        wordguess.not_an_attribute
+
+
+def test_import_is_lazy():
+    # modules only some commands need are not imported at startup
+    code = ("import sys, wordguess.wordguess; "
+            "print(' '.join(sorted(sys.modules)))")
+    result = subprocess.run([sys.executable, "-c", code],
+                            stdout=subprocess.PIPE, universal_newlines=True,
+                            check=True)
+    modules = result.stdout.split()
+    for name in ["numpy", "wordguess.solver", "wordguess.simulate",
+                 "wordguess.server", "wordguess.instrument",
+                 "wordguess.replay", "wordguess.matches", "wordguess.query",
+                 "wordguess.batch", "wordguess.recommend",
+                 "importlib.metadata",
+                 "importlib.resources", "asyncio", "concurrent.futures"]:
+        assert name not in modules
+
+
 def test_main_min_max_invalid(capsys):
     result = wordguess.main(["--min", "8", "--max", "6"])
     captured = capsys.readouterr().out
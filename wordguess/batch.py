@@ -0,0 +1,110 @@
+# Scripted games without a player at the terminal.
+#
+# Each line of a script is a word followed by the guesses to play on it,
+# separated by spaces:
+#
+#   LETTER E T A R L
+#
+# and each game is written to stdout as one JSON line as soon as it ends:
+#
+#   {"word": "LETTER", "outcome": "won", "wrong_guesses": 1,
+#    "board": "LETTER", "results": ["hit", "hit", "miss", "hit", "hit"]}
+#
+# Guesses after the game is over are not played, "quit" ends the game like
+# it does in play().  A line that can't be played is written as
+# {"line": 3, "error": "..."} and the rest of the script still runs.
+# Blank lines and lines starting with # are skipped.  Lines are read and
+# results written one at a time so a script of any length streams through
+# in constant memory.
+import argparse
+import json
+import os
+import sys
+import time
+
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import Sequence
+
+from wordguess import engine
+from wordguess import history
+
+
+def play_script(word: str,
+                guesses: Sequence[str],
+                num_wrong_guesses: int,
+                guess_word: bool = True,
+                alphabet: engine.Alphabet = engine.ENGLISH
+                ) -> Dict[str, Any]:
+    # the result of one game played with guesses until it is over
+    game = engine.GameState(word, num_wrong_guesses, guess_word, alphabet)
+    guess = game.guess
+    results = []
+    for user_input in guesses:
+        if game.status != engine.Status.playing or \
+                user_input.upper() == "QUIT":
+            break
+        results.append(guess(user_input))
+    outcome = history.QUIT if game.status == engine.Status.playing \
+        else game.status
+    return {"word": word, "outcome": outcome,
+            "wrong_guesses": game.wrong_guesses, "board": game.masked_word,
+            "results": results}
+
+
+def play_lines(lines: Iterable[str],
+               num_wrong_guesses: int,
+               guess_word: bool = True,
+               alphabet: engine.Alphabet = engine.ENGLISH
+               ) -> Iterator[Dict[str, Any]]:
+    # a result, or an error, for each game line of a script
+    for line_number, line in enumerate(lines, 1):
+        fields = line.split()
+        if not fields or fields[0].startswith("#"):
+            continue
+        word = alphabet.parse(fields[0])
+        if word is None:
+            yield {"line": line_number,
+                   "error": f"{fields[0]} is not a word of the alphabet"}
+            continue
+        yield play_script(word, fields[1:], num_wrong_guesses, guess_word,
+                          alphabet)
+
+
+def run(args: argparse.Namespace) -> int:
+    from wordguess import wordguess
+    alphabet = wordguess.open_alphabet(args.wordlist)
+    try:
+        script = sys.stdin if args.batch == "-" else \
+            open(args.batch, encoding="utf-8")
+    except OSError as e:
+        print(f"Error can't read {args.batch}: {e.strerror}",
+              file=sys.stderr)
+        return 1
+    games = errors = 0
+    start = time.perf_counter()
+    encode = json.JSONEncoder(ensure_ascii=False).encode
+    write = sys.stdout.write
+    try:
+        for result in play_lines(script, args.num_wrong_guesses,
+                                 args.guess_word, alphabet):
+            if "error" in result:
+                errors += 1
+            else:
+                games += 1
+            write(encode(result) + "\n")
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # the reader went away, like head, nothing more to write
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 1
+    finally:
+        if script is not sys.stdin:
+            script.close()
+    elapsed = time.perf_counter() - start
+    print(f"{games} games, {errors} errors in {elapsed:.2f}s, "
+          f"{games / max(elapsed, 1e-9):,.0f} games/s", file=sys.stderr)
+    return 1 if errors else 0
@@ -0,0 +1,302 @@
+# Compact binary dictionary read through mmap.
+#
+# Words are stored sorted by length (file order within a length) so any
+# min/max range is a contiguous slice of the word ids.  Layout, little
+# endian:
+#
+#   header       magic, version, offset width, max length, word count,
+#                source mtime_ns, source size
+#   length table (max length + 2) u32, id of the first word of each length
+#   offsets      (word count + 1) u32 or u64, byte offset of each word
+#   data         UTF-8 bytes of every word with no separators
+import argparse
+import array
+import codecs
+import mmap
+import os
+import re
+import struct
+import sys
+
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+from typing import overload
+
+MAGIC = b"WGDC"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIIqq")
+LENGTH_TYPE = "I"
+NO_STAMP = (0, 0)
+READ_SIZE = 1 << 20
+# bytes that are not UTF-8 as decoded by surrogateescape
+ESCAPED = re.compile("[\udc80-\udcff]")
+
+Stamp = Tuple[int, int]
+
+
+def iter_file_words(path: str,
+                    size: int = READ_SIZE,
+                    on_error: Optional[Callable[[bytes], None]] = None
+                    ) -> Iterator[str]:
+    # stream whitespace separated words a block at a time, so neither the
+    # file nor a very long line has to fit in memory.  A word that is not
+    # UTF-8 is left out and given to on_error as bytes.
+    decoder = codecs.getincrementaldecoder("utf-8")("surrogateescape")
+    with open(path, "rb") as f:
+        rest = ""
+        done = False
+        while not done:
+            raw = f.read(size)
+            done = not raw
+            block = decoder.decode(raw, final=done)
+            if not block:
+                continue
+            text = rest + block
+            words = text.split()
+            # the last word may go on in the next block
+            rest = words.pop() if words and not block[-1].isspace() else ""
+            if text.isascii() or not ESCAPED.search(text):
+                yield from words  # no bytes that failed to decode
+            else:
+                yield from _decoded(words, on_error)
+        if rest:
+            yield from _decoded([rest], on_error)
+
+
+def _decoded(words: Iterable[str],
+             on_error: Optional[Callable[[bytes], None]]) -> Iterator[str]:
+    # the words without bytes escaped by the surrogateescape decoding
+    for word in words:
+        try:
+            word.encode("utf-8")
+        except UnicodeEncodeError:
+            if on_error is not None:
+                on_error(word.encode("utf-8", "surrogateescape"))
+            continue
+        yield word
+
+
+def is_compact(path: str) -> bool:
+    # True if the file starts like a compact dictionary
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def _table(mm: mmap.mmap,
+           start: int,
+           count: int,
+           typecode: str) -> Sequence[int]:
+    size = array.array(typecode).itemsize
+    view = memoryview(mm)[start:start + count * size]
+    if sys.byteorder == "little":
+        return view.cast(typecode)
+    table = array.array(typecode, view)
+    table.byteswap()
+    return table
+
+
+def _write(path: str,
+           words: Callable[[], Iterable[str]],
+           stamp: Stamp) -> None:
+    # first pass sizes each length bucket, second pass fills them in place
+    counts = [0]
+    nbytes = [0]
+    for word in words():
+        length = len(word)
+        if length >= len(counts):
+            counts.extend([0] * (length + 1 - len(counts)))
+            nbytes.extend([0] * (length + 1 - len(nbytes)))
+        counts[length] += 1
+        nbytes[length] += len(word.encode("utf-8"))
+    max_length = max(len(counts) - 1, 0)
+    total = sum(counts)
+    data_size = sum(nbytes)
+    offset_type = "I" if data_size < 2 ** 32 else "Q"
+    offset_size = array.array(offset_type).itemsize
+
+    starts = [0] * (max_length + 2)
+    byte_starts = [0] * (max_length + 1)
+    for length in range(max_length + 1):
+        starts[length + 1] = starts[length] + counts[length]
+        if length:
+            byte_starts[length] = byte_starts[length - 1] + nbytes[length - 1]
+    lengths = array.array(LENGTH_TYPE, starts)
+    offsets = array.array(offset_type, bytes(offset_size * (total + 1)))
+    offsets[total] = data_size
+    data_pos = (HEADER.size + len(lengths) * lengths.itemsize
+                + len(offsets) * offset_size)
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    # write to a temporary name first so readers never see a partial file
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w+b") as f:
+        f.truncate(data_pos + data_size)
+        with mmap.mmap(f.fileno(), 0) as mm:
+            ids = starts[:-1]
+            cursors = [data_pos + n for n in byte_starts]
+            for word in words():
+                raw = word.encode("utf-8")
+                length = len(word)
+                offsets[ids[length]] = cursors[length] - data_pos
+                mm[cursors[length]:cursors[length] + len(raw)] = raw
+                ids[length] += 1
+                cursors[length] += len(raw)
+            if sys.byteorder != "little":
+                lengths.byteswap()
+                offsets.byteswap()
+            mm[:data_pos] = (HEADER.pack(MAGIC, VERSION, offset_size,
+                                         max_length, total, *stamp)
+                             + lengths.tobytes() + offsets.tobytes())
+    os.replace(tmp_path, path)
+
+
+def write_words(path: str,
+                words: Sequence[str],
+                stamp: Stamp = NO_STAMP) -> None:
+    _write(path, lambda: words, stamp)
+
+
+def convert(source: str,
+            dest: str,
+            stamp: Optional[Stamp] = None) -> None:
+    # build a compact dictionary from a text word list, one streaming pass
+    # to size the buckets and one to fill them, stamped like source unless
+    # a stamp is given
+    if stamp is None:
+        stat = os.stat(source)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+    _write(dest, lambda: iter_file_words(source), stamp)
+
+
+class CompactWordList(Sequence[str]):
+    """
+    Read only sequence of the words in a compact dictionary file.
+    Words are decoded one at a time when indexed, slicing returns a view
+    that shares the same memory map.
+    """
+    __slots__ = ("_mm", "_lengths", "_offsets", "_data", "_start", "_stop",
+                 "max_length", "stamp")
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(mm) < HEADER.size:
+            mm.close()
+            raise ValueError(f"{path} is not a compact dictionary")
+        (magic, version, offset_size, max_length, count,
+         mtime_ns, size) = HEADER.unpack_from(mm)
+        offset_type = "I" if offset_size == 4 else "Q"
+        length_size = array.array(LENGTH_TYPE).itemsize
+        data_pos = (HEADER.size + (max_length + 2) * length_size
+                    + (count + 1) * offset_size)
+        if magic != MAGIC or version != VERSION or \
+                offset_size not in (4, 8) or len(mm) < data_pos:
+            mm.close()
+            raise ValueError(f"{path} is not a compact dictionary")
+        pos = HEADER.size
+        self._mm = mm
+        self._lengths = _table(mm, pos, max_length + 2, LENGTH_TYPE)
+        pos += len(self._lengths) * length_size
+        self._offsets = _table(mm, pos, count + 1, offset_type)
+        self._data = memoryview(mm)[data_pos:]
+        self._start = 0
+        self._stop = count
+        self.max_length = max_length
+        self.stamp = (mtime_ns, size)
+        # a truncated or damaged file, its ids or offsets would point past
+        # the data
+        lengths = self._lengths
+        if lengths[0] != 0 or lengths[max_length + 1] != count or \
+                any(lengths[i] > lengths[i + 1]
+                    for i in range(max_length + 1)) or \
+                self._offsets[0] != 0 or \
+                self._offsets[count] != len(self._data):
+            self.close()
+            raise ValueError(f"{path} is not a compact dictionary")
+
+    def _view(self, start: int, stop: int) -> "CompactWordList":
+        view = object.__new__(CompactWordList)
+        view._mm = self._mm
+        view._lengths = self._lengths
+        view._offsets = self._offsets
+        view._data = self._data
+        view._start = start
+        view._stop = max(start, stop)
+        view.max_length = self.max_length
+        view.stamp = self.stamp
+        return view
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    @overload
+    def __getitem__(self, item: int) -> str: ...
+
+    @overload
+    def __getitem__(self, item: slice) -> "Sequence[str]": ...
+
+    def __getitem__(self,
+                    item: Union[int, slice]) -> Union[str, Sequence[str]]:
+        if isinstance(item, slice):
+            start, stop, step = item.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return self._view(self._start + start, self._start + stop)
+        item += self._start if item >= 0 else self._stop
+        if not self._start <= item < self._stop:
+            raise IndexError("word index out of range")
+        offsets = self._offsets
+        return str(self._data[offsets[item]:offsets[item + 1]], "utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        offsets = self._offsets
+        data = self._data
+        for i in range(self._start, self._stop):
+            yield str(data[offsets[i]:offsets[i + 1]], "utf-8")
+
+    def length_range(self,
+                     min_length: int,
+                     max_length: int) -> "CompactWordList":
+        # words with a length between min_length and max_length, no copying
+        min_length = max(min(min_length, self.max_length + 1), 0)
+        max_length = max(min(max_length, self.max_length), -1)
+        start = max(self._lengths[min_length], self._start)
+        stop = min(self._lengths[max_length + 1], self._stop)
+        return self._view(start, stop)
+
+    def close(self) -> None:
+        # release the buffers before the map, views made from this list
+        # can not be used after closing
+        if isinstance(self._lengths, memoryview):
+            self._lengths.release()
+            self._offsets.release()
+        self._data.release()
+        self._mm.close()
+
+    def __enter__(self) -> "CompactWordList":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m wordguess.compact",
+        description="Convert a text word list to a compact dictionary")
+    parser.add_argument("source", help="text word list, one word per line")
+    parser.add_argument("dest", help="compact dictionary file to write")
+    args = parser.parse_args(argv)
+    convert(args.source, args.dest)
+    with CompactWordList(args.dest) as words:
+        print(f"{len(words)} words written to {args.dest}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,118 @@
+# Named word lists.
+#
+# The game comes with one list, "english".  Other lists, for other
+# languages or themes, are added by putting a text file with one word per
+# line, or a compact dictionary made by python -m wordguess.compact, in
+# the dictionaries directory of the player's data directory:
+#
+#   ~/.local/share/wordguess/dictionaries/animals.txt  --dictionary animals
+#
+# Any other file can be played with --wordlist PATH.
+#
+# A list in another alphabet has a .alphabet file next to it with its
+# letters in the order they are shown, separated by spaces or new lines or
+# written together:
+#
+#   ~/.local/share/wordguess/dictionaries/svenska.txt
+#   ~/.local/share/wordguess/dictionaries/svenska.alphabet
+#
+# A list without one is played with the letters A to Z.
+import os
+import unicodedata
+
+from typing import List
+from typing import Optional
+from typing import Union
+
+from wordguess import compact
+from wordguess import engine
+from wordguess import history
+from wordguess import index
+
+DEFAULT = "english"
+DICTIONARIES_DIR = "dictionaries"
+SUFFIXES = (".txt", ".wgd")
+ALPHABET_SUFFIX = ".alphabet"
+
+
+def dictionaries_dir() -> str:
+    return os.path.join(history.data_dir(), DICTIONARIES_DIR)
+
+
+def available() -> List[str]:
+    # names of the bundled and installed dictionaries
+    names = {DEFAULT}
+    try:
+        files = os.listdir(dictionaries_dir())
+    except OSError:
+        files = []
+    for name in files:
+        base, suffix = os.path.splitext(name)
+        if suffix in SUFFIXES:
+            names.add(base)
+    return sorted(names)
+
+
+def find(name: str) -> Optional[str]:
+    """
+    The path of a dictionary by name, None for the bundled list.
+    Raises ValueError if there is no dictionary of that name.
+    """
+    if name == DEFAULT:
+        return None
+    for suffix in SUFFIXES:
+        path = os.path.join(dictionaries_dir(), name + suffix)
+        if os.path.isfile(path):
+            return path
+    raise ValueError(f"no dictionary named {name}, the dictionaries are "
+                     f"{', '.join(available())}")
+
+
+def alphabet_path(path: str) -> str:
+    return os.path.splitext(path)[0] + ALPHABET_SUFFIX
+
+
+def read_alphabet(path: str) -> engine.Alphabet:
+    """
+    The alphabet in an .alphabet file.
+    Raises ValueError if a letter is there twice or there are none.
+    """
+    with open(path, encoding="utf-8-sig") as f:
+        text = f.read()
+    # NFC first so a letter written with a combining accent is one letter
+    return engine.Alphabet(unicodedata.normalize("NFC", "".join(text.split())))
+
+
+def open_alphabet(path: str) -> engine.Alphabet:
+    # the alphabet of a word list file, A to Z when it has no .alphabet
+    try:
+        return read_alphabet(alphabet_path(path))
+    except FileNotFoundError:
+        return engine.ENGLISH
+
+
+def word_list_stamp(path: str) -> compact.Stamp:
+    # a text list and its .alphabet together, changing either one means
+    # the words have to be cleaned again
+    mtime_ns, size = index.source_stamp(path)
+    try:
+        stat = os.stat(alphabet_path(path))
+    except FileNotFoundError:
+        return mtime_ns, size
+    return max(mtime_ns, stat.st_mtime_ns), size + stat.st_size
+
+
+def index_path(path: str) -> str:
+    # where the index of a word list file is, a compact dictionary is its
+    # own index
+    if compact.is_compact(path):
+        return path
+    return index.source_index_path(path)
+
+
+def open_word_list(path: str) -> Union[compact.CompactWordList, List[str]]:
+    # every word of a text word list or compact dictionary, shortest first
+    if compact.is_compact(path):
+        return compact.CompactWordList(path)
+    return index.open_source(path, alphabet=open_alphabet(path),
+                             stamp=word_list_stamp(path))
@@ -0,0 +1,468 @@
+# Difficulty scores for every word of a list, kept in a sidecar file next
+# to the word index.
+#
+# Each word gets three metrics: its distinct letters, the rarity of those
+# letters (the mean of -log2 of the share of words containing each one)
+# and the wrong guesses the solver makes finding it.  The score is the
+# wrong guesses with rarity, and a little less the distinct letters, each
+# one more to find, breaking ties.  The words of each length are ranked by score and
+# cut into three tiers of the same size, so every length has easy, medium
+# and hard words however its scores compare with other lengths'.
+#
+# The sidecar holds the metrics in word id order and the word ids sorted
+# by length then tier, with a table of where each (length, tier) group
+# starts, so the words of a tier in a min/max range are a handful of
+# slices, one per length.  Layout, little endian:
+#
+#   header    magic, version, max length, word count, source mtime_ns,
+#             source size
+#   hashes    u64 per word, to find the words that changed
+#   rarity    f32 per word
+#   order     u32 per word, word ids by length, tier, id
+#   starts    u32 per (length, tier) group plus one, offset into order
+#   wrong     u8 per word, the solver's wrong guesses
+#   distinct  u8 per word
+#
+# Only the solver metric is slow.  When the word list changes its value is
+# kept for every word whose hash is in the old sidecar and only new words
+# are played, in parallel when there are many.  Adding words can change
+# the solver's guesses for other words of the same length slightly, --full
+# scores everything again.
+import argparse
+import array
+import bisect
+import concurrent.futures
+import hashlib
+import math
+import mmap
+import os
+import struct
+import sys
+import time
+
+from collections import Counter
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+from typing import overload
+
+from wordguess import compact
+from wordguess import engine
+from wordguess import solver
+
+MAGIC = b"WGDS"
+VERSION = 2
+HEADER = struct.Struct("<4sHHIqq4x")
+TIERS = ("easy", "medium", "hard")
+SCORES_SUFFIX = ".scores"
+RARITY_WEIGHT = 0.1
+DISTINCT_WEIGHT = 0.01
+CHUNK_SIZE = 500
+PARALLEL_MIN_WORDS = 5000
+
+Stamp = Tuple[int, int]
+
+
+def word_hash(word: str) -> int:
+    digest = hashlib.blake2b(word.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def letter_rarity(words: Iterable[str]) -> Dict[str, float]:
+    # -log2 of the share of words that contain each letter
+    counts: Counter = Counter()
+    total = 0
+    for word in words:
+        counts.update(set(word))
+        total += 1
+    return {x: -math.log2(n / total) for x, n in counts.items()}
+
+
+def wrong_guesses(word_solver: solver.Solver, word: str) -> int:
+    # wrong guesses the solver makes finding the word with no limit
+    alphabet = word_solver.alphabet
+    game = engine.GameState(word, len(alphabet) + 1, alphabet=alphabet)
+    candidates = word_solver.start(len(word))
+    while game.status == engine.Status.playing:
+        candidates = word_solver.narrow(candidates, game.blank_word,
+                                        game.missed)
+        try:
+            letter = word_solver.best_letter(candidates)
+        except ValueError:
+            break  # characters outside the alphabet can never be found
+        game.guess_letter(letter)
+    return game.wrong_guesses
+
+
+# set in each worker process by _init_worker
+_worker_solver: Optional[solver.Solver] = None
+
+
+def _init_worker(words: List[str],
+                 alphabet: engine.Alphabet = engine.ENGLISH) -> None:
+    global _worker_solver
+    _worker_solver = solver.Solver(words, alphabet=alphabet)
+
+
+def _score_chunk(chunk: List[str]) -> List[int]:
+    assert _worker_solver is not None
+    return [wrong_guesses(_worker_solver, x) for x in chunk]
+
+
+def score_wrong_guesses(words: Sequence[str],
+                        targets: Sequence[str],
+                        workers: int = 1,
+                        alphabet: engine.Alphabet = engine.ENGLISH
+                        ) -> List[int]:
+    """
+    The solver's wrong guesses for each target, playing against the whole
+    word list.  Large jobs are split into chunks of words of one length
+    and spread over worker processes.
+    """
+    if workers == 1 or len(targets) < PARALLEL_MIN_WORDS:
+        _init_worker(list(words), alphabet)
+        return _score_chunk(list(targets))
+    # chunks of one length so a worker only builds the tables it uses
+    by_length = sorted(range(len(targets)), key=lambda i: len(targets[i]))
+    chunks: List[List[int]] = []
+    for i in by_length:
+        if not chunks or len(chunks[-1]) == CHUNK_SIZE or \
+                len(targets[chunks[-1][0]]) != len(targets[i]):
+            chunks.append([])
+        chunks[-1].append(i)
+    result = [0] * len(targets)
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(list(words), alphabet)) as executor:
+        scored = executor.map(_score_chunk,
+                              [[targets[i] for i in x] for x in chunks])
+        for chunk, values in zip(chunks, scored):
+            for i, value in zip(chunk, values):
+                result[i] = value
+    return result
+
+
+def score(wrong: int, rarity: float, distinct: int) -> float:
+    # the difficulty of a word from its metrics, higher is harder
+    return wrong + RARITY_WEIGHT * rarity + DISTINCT_WEIGHT * distinct
+
+
+def tier_of(rank: int, count: int) -> int:
+    # the tier of the word ranked rank of count, by the middle of its rank
+    # so one word is medium and two are easy and hard
+    return (2 * rank + 1) * len(TIERS) // (2 * count)
+
+
+class TierWords(Sequence[str]):
+    """
+    The words of one tier in a length range, read through the sorted ids
+    of the scores without copying them.
+    """
+    def __init__(self,
+                 words: Sequence[str],
+                 order: Sequence[int],
+                 ranges: List[Tuple[int, int]]) -> None:
+        self.words = words
+        self.order = order
+        self.ranges = [x for x in ranges if x[1] > x[0]]
+        self.ends: List[int] = []
+        total = 0
+        for start, stop in self.ranges:
+            total += stop - start
+            self.ends.append(total)
+
+    def __len__(self) -> int:
+        return self.ends[-1] if self.ends else 0
+
+    @overload
+    def __getitem__(self, item: int) -> str: ...
+
+    @overload
+    def __getitem__(self, item: slice) -> Sequence[str]: ...
+
+    def __getitem__(self,
+                    item: Union[int, slice]) -> Union[str, Sequence[str]]:
+        if isinstance(item, slice):
+            return [self[i] for i in range(*item.indices(len(self)))]
+        if item < 0:
+            item += len(self)
+        if not 0 <= item < len(self):
+            raise IndexError("word index out of range")
+        group = bisect.bisect_right(self.ends, item)
+        start = self.ranges[group][0]
+        offset = item - (self.ends[group - 1] if group else 0)
+        return self.words[self.order[start + offset]]
+
+
+class Scores:
+    """
+    Difficulty metrics of a word list in word id order and the ids
+    grouped by length and tier.  Built with build() or read from a
+    sidecar with read_scores().
+    """
+    def __init__(self,
+                 hashes: Sequence[int],
+                 rarity: Sequence[float],
+                 order: Sequence[int],
+                 starts: Sequence[int],
+                 wrong: Sequence[int],
+                 distinct: Sequence[int],
+                 max_length: int,
+                 stamp: Stamp = compact.NO_STAMP,
+                 mm: Optional[mmap.mmap] = None) -> None:
+        self.hashes = hashes
+        self.rarity = rarity
+        self.order = order
+        self.starts = starts
+        self.wrong = wrong
+        self.distinct = distinct
+        self.max_length = max_length
+        self.stamp = stamp
+        self._mm = mm
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+    def score(self, i: int) -> float:
+        # what the tiers are ranked by, higher is harder
+        return score(self.wrong[i], self.rarity[i], self.distinct[i])
+
+    def ranges(self,
+               min_length: int,
+               max_length: int,
+               tiers: Sequence[str] = TIERS) -> List[Tuple[int, int]]:
+        # where the ids of the tiers with a length between min_length and
+        # max_length are in order, by length then tier
+        ranges = []
+        for length in range(max(min_length, 0),
+                            min(max_length, self.max_length) + 1):
+            for tier in tiers:
+                group = length * len(TIERS) + TIERS.index(tier)
+                ranges.append((self.starts[group], self.starts[group + 1]))
+        return ranges
+
+    def tier(self,
+             words: Sequence[str],
+             min_length: int,
+             max_length: int,
+             tier: str) -> TierWords:
+        # the words of a tier with a length between min_length and
+        # max_length, words is the list the scores were built from
+        return TierWords(words, self.order,
+                         self.ranges(min_length, max_length, [tier]))
+
+    def close(self) -> None:
+        if self._mm is not None:
+            for table in (self.hashes, self.rarity, self.order,
+                          self.starts, self.wrong, self.distinct):
+                if isinstance(table, memoryview):
+                    table.release()
+            self._mm.close()
+            self._mm = None
+
+
+def build(words: Sequence[str],
+          stamp: Stamp = compact.NO_STAMP,
+          previous: Optional[Scores] = None,
+          workers: int = 1,
+          alphabet: engine.Alphabet = engine.ENGLISH) -> Tuple[Scores, int]:
+    """
+    Score a word list, reusing the solver metric of words found in the
+    previous scores.  Returns the scores and the number of words played.
+    """
+    word_list = list(words)
+    count = len(word_list)
+    hashes = array.array("Q", (word_hash(x) for x in word_list))
+    known: Dict[int, int] = {}
+    if previous is not None:
+        known = dict(zip(previous.hashes, previous.wrong))
+    wrong = array.array("B", bytes(count))
+    targets = []
+    for i, h in enumerate(hashes):
+        value = known.get(h)
+        if value is None:
+            targets.append(i)
+        else:
+            wrong[i] = value
+    scored = score_wrong_guesses(word_list, [word_list[i] for i in targets],
+                                 workers, alphabet)
+    for i, value in zip(targets, scored):
+        wrong[i] = min(value, 255)
+
+    letters = letter_rarity(word_list)
+    distinct = array.array("B", (min(len(set(x)), 255) for x in word_list))
+    rarity = array.array("f", (
+        sum(letters[x] for x in set(word)) / len(set(word)) if word else 0
+        for word in word_list))
+
+    max_length = max((len(x) for x in word_list), default=0)
+    by_length: List[List[int]] = [[] for _ in range(max_length + 1)]
+    for i, word in enumerate(word_list):
+        by_length[len(word)].append(i)
+    # equal thirds by rank within each length, ties go to the lower word id
+    groups: List[List[int]] = []
+    for ids in by_length:
+        ids.sort(key=lambda i: score(wrong[i], rarity[i], distinct[i]))
+        tiers: List[List[int]] = [[] for _ in TIERS]
+        for rank, i in enumerate(ids):
+            tiers[tier_of(rank, len(ids))].append(i)
+        for group in tiers:
+            group.sort()
+            groups.append(group)
+    order = array.array("I")
+    starts = array.array("I", [0])
+    for group in groups:
+        order.extend(group)
+        starts.append(len(order))
+    scores = Scores(hashes, rarity, order, starts, wrong, distinct,
+                    max_length, stamp)
+    return scores, len(targets)
+
+
+def write_scores(path: str, scores: Scores) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, scores.max_length, len(scores),
+                            *scores.stamp))
+        for typecode, table in (("Q", scores.hashes), ("f", scores.rarity),
+                                ("I", scores.order), ("I", scores.starts),
+                                ("B", scores.wrong),
+                                ("B", scores.distinct)):
+            values = array.array(typecode, table)
+            if sys.byteorder != "little":
+                values.byteswap()
+            values.tofile(f)
+    os.replace(tmp_path, path)
+
+
+def read_scores(path: str) -> Scores:
+    # memory maps a sidecar, raises OSError or ValueError
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        (magic, version, max_length, count,
+         mtime_ns, size) = HEADER.unpack_from(mm)
+    except struct.error:
+        mm.close()
+        raise ValueError(f"{path} is not a difficulty sidecar")
+    groups = (max_length + 1) * len(TIERS) + 1
+    expected = HEADER.size + count * (8 + 4 + 4 + 1 + 1) + groups * 4
+    if magic != MAGIC or version != VERSION or len(mm) != expected:
+        mm.close()
+        raise ValueError(f"{path} is not a difficulty sidecar")
+    tables = []
+    pos = HEADER.size
+    for typecode, length in (("Q", count), ("f", count), ("I", count),
+                             ("I", groups), ("B", count), ("B", count)):
+        tables.append(compact._table(mm, pos, length, typecode))
+        pos += length * array.array(typecode).itemsize
+    return Scores(*tables, max_length=max_length, stamp=(mtime_ns, size),
+                  mm=mm)
+
+
+def scores_path(index_path: str) -> str:
+    return index_path + SCORES_SUFFIX
+
+
+def open_scores(words: Sequence[str],
+                path: str,
+                stamp: Stamp,
+                workers: Optional[int] = None,
+                full: bool = False,
+                alphabet: engine.Alphabet = engine.ENGLISH
+                ) -> Tuple[Scores, int]:
+    """
+    The scores of words from the sidecar at path, rebuilt and saved when
+    the sidecar is missing or stamped for another version of the list.
+    Returns the scores and the number of words played.
+    """
+    previous: Optional[Scores] = None
+    try:
+        previous = read_scores(path)
+    except (OSError, ValueError):
+        pass
+    if previous is not None and previous.stamp == stamp and \
+            len(previous) == len(words) and not full:
+        return previous, 0
+    scores, played = build(words, stamp, None if full else previous,
+                           workers or os.cpu_count() or 1, alphabet)
+    if previous is not None:
+        previous.close()
+    try:
+        write_scores(path, scores)
+    except OSError:
+        pass  # read-only cache, score again next time
+    return scores, played
+
+
+def open_word_scores(words: Sequence[str],
+                     index_path: str,
+                     alphabet: engine.Alphabet = engine.ENGLISH) -> Scores:
+    # the scores of every word of the list, a CompactWordList read from
+    # index_path keeps its scores in a sidecar next to it, any other list
+    # is scored in memory
+    if isinstance(words, compact.CompactWordList):
+        scores, _ = open_scores(words, scores_path(index_path), words.stamp,
+                                alphabet=alphabet)
+    else:
+        scores, _ = build(words, workers=os.cpu_count() or 1,
+                          alphabet=alphabet)
+    return scores
+
+
+def open_tier(words: Sequence[str],
+              index_path: str,
+              min_length: int,
+              max_length: int,
+              tier: str,
+              alphabet: engine.Alphabet = engine.ENGLISH) -> TierWords:
+    """
+    The words of a tier in a length range.  words is every word of the
+    list, see open_word_scores().
+    """
+    scores = open_word_scores(words, index_path, alphabet)
+    return scores.tier(words, min_length, max_length, tier)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    from wordguess import index
+    from wordguess import wordguess
+    parser = argparse.ArgumentParser(
+        prog="python -m wordguess.difficulty",
+        description="Score the words of the game for --difficulty")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="Number of worker processes default: "
+                             "one per core")
+    parser.add_argument("--full", action="store_true",
+                        help="Score every word again")
+    parser.add_argument("--wordlist", metavar="PATH",
+                        help="Score a word list file instead of the "
+                             "bundled list")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    words = wordguess.open_word_index(args.wordlist)
+    if not isinstance(words, compact.CompactWordList):
+        print(f"Error the word index can not be written to "
+              f"{index.cache_dir()}")
+        return 1
+    path = scores_path(wordguess.word_index_path(args.wordlist))
+    scores, played = open_scores(words, path, words.stamp, args.workers,
+                                 args.full,
+                                 wordguess.open_alphabet(args.wordlist))
+    elapsed = time.perf_counter() - start
+    sizes = [len(scores.tier(words, 0, scores.max_length, x))
+             for x in TIERS]
+    print(f"{len(scores)} words, {played} scored in {elapsed:.2f}s")
+    print(", ".join(f"{n} {x}" for x, n in zip(TIERS, sizes)))
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
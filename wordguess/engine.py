@@ -0,0 +1,227 @@
+# Game state for one word, independent of the terminal.
+import functools
+import unicodedata
+
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+# the letters of ALPHABET in order of how often they are used in English,
+# the guesses of the benchmarks and tests that play whole games
+FREQUENCY_ORDER = "ETAOINSRHLDCUMFPGWYBVKXJQZ"
+
+
+class Alphabet:
+    """
+    The letters of a word list in the order they are shown.
+    Everything a guess needs is built once: the bit of each letter in
+    GameState.guessed, its index, and a table from every case form of a
+    letter to the letter, so reading a guess is a dict lookup (a letter)
+    or one str.translate() (a word) and no Unicode normalization.
+    Letters are single characters (after NFC), there can be a few hundred
+    of them.
+    """
+    __slots__ = ("letters", "bits", "index", "letter_set", "upper", "_fold",
+                 "_single")
+
+    def __init__(self, letters: Iterable[str]) -> None:
+        letters = [unicodedata.normalize("NFC", x) for x in letters]
+        if not letters:
+            raise ValueError("an alphabet needs letters")
+        for x in letters:
+            if len(x) != 1 or x.isspace() or x == "_":
+                raise ValueError(f"{x!r} can not be a letter")
+        if len(set(letters)) != len(letters):
+            raise ValueError("an alphabet has each letter once")
+        self.letters = "".join(letters)
+        self.bits = {x: 1 << i for i, x in enumerate(letters)}
+        self.index = {x: i for i, x in enumerate(letters)}
+        self.letter_set = frozenset(letters)
+        fold: Dict[int, str] = {}
+        for x in letters:
+            for form in (x.lower(), x.upper(), x.title(), x.casefold()):
+                if len(form) == 1 and form not in self.bits:
+                    fold.setdefault(ord(form), x)
+        self._fold = fold
+        # str.upper() is much faster than translate() and does the same
+        # for alphabets of upper case letters like A to Z
+        self.upper = all(x.upper() == x for x in letters) and \
+            all(chr(x).upper() == y for x, y in fold.items())
+        # a guess is most often one letter, a dict lookup for all its forms
+        self._single = dict(zip(letters, letters))
+        self._single.update((chr(x), y) for x, y in fold.items())
+
+    def __len__(self) -> int:
+        return len(self.letters)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.letters)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Alphabet) and self.letters == other.letters
+
+    def __hash__(self) -> int:
+        return hash(self.letters)
+
+    def __repr__(self) -> str:
+        return f"Alphabet({self.letters!r})"
+
+    def __reduce__(self) -> Tuple[type, Tuple[str]]:
+        # sent to worker processes as just the letters
+        return Alphabet, (self.letters,)
+
+    def fold(self, text: str) -> str:
+        # text with every case form of a letter changed to the letter
+        if self.upper:
+            return text.upper()
+        return text.translate(self._fold)
+
+    def covers(self, text: str) -> bool:
+        return self.letter_set.issuperset(text)
+
+    def parse(self, text: str) -> Optional[str]:
+        # a guess in the letters of the alphabet, None if it is not one
+        letter = self._single.get(text)
+        if letter is not None:
+            return letter
+        guess = self.fold(text)
+        if guess and self.letter_set.issuperset(guess):
+            return guess
+        # accents typed as a separate mark and lower case forms that are
+        # no case form of a letter (ς of Σ), only when the fast path fails
+        guess = self.fold(unicodedata.normalize("NFC", text))
+        if guess and self.letter_set.issuperset(guess):
+            return guess
+        guess = self.fold(guess.upper())
+        if guess and self.letter_set.issuperset(guess):
+            return guess
+        return None
+
+
+ENGLISH = Alphabet(ALPHABET)
+LETTER_BITS = ENGLISH.bits
+
+
+class Status:
+    playing = "playing"
+    won = "won"
+    lost = "lost"
+
+
+class Result:
+    invalid = "invalid"
+    already_guessed = "already guessed"
+    hit = "hit"
+    miss = "miss"
+    word_correct = "word correct"
+    word_wrong = "word wrong"
+
+
+@functools.lru_cache(maxsize=4096)
+def letter_positions(word: str) -> Dict[str, Tuple[int, ...]]:
+    # where each letter of the word is, shared by every game of that word
+    positions: Dict[str, List[int]] = {}
+    for i, letter in enumerate(word):
+        positions.setdefault(letter, []).append(i)
+    return {letter: tuple(x) for letter, x in positions.items()}
+
+
+class GameState:
+    """
+    One game of word guess.
+    guess() takes the raw player input and returns a Result, the board is
+    available as letters (unguessed letters, guessed ones are spaces) and
+    blank_word (the word with _ for letters not found yet).
+    Guessed letters are kept as a bit mask and the letters still hidden as
+    a count so a guess only touches the positions of that letter.
+    """
+    __slots__ = ("word", "num_wrong_guesses", "guess_word", "blank_word",
+                 "guessed", "hidden", "wrong_guesses", "status",
+                 "alphabet", "_positions")
+
+    def __init__(self,
+                 word: str,
+                 num_wrong_guesses: int,
+                 guess_word: bool = True,
+                 alphabet: Alphabet = ENGLISH) -> None:
+        self.word = word
+        self.num_wrong_guesses = num_wrong_guesses
+        self.guess_word = guess_word
+        self.blank_word = ["_" for _ in word]
+        self.guessed = 0
+        self.hidden = len(word)
+        self.wrong_guesses = 0
+        self.status = Status.playing
+        self.alphabet = alphabet
+        self._positions = letter_positions(word)
+
+    @property
+    def letters(self) -> List[str]:
+        guessed = self.guessed
+        return [" " if guessed >> i & 1 else x
+                for i, x in enumerate(self.alphabet.letters)]
+
+    @property
+    def masked_word(self) -> str:
+        return "".join(self.blank_word)
+
+    @property
+    def missed(self) -> str:
+        # guessed letters that are not in the word
+        guessed = self.guessed
+        return "".join(x for i, x in enumerate(self.alphabet.letters)
+                       if guessed >> i & 1 and x not in self._positions)
+
+    def guess(self, user_input: str) -> str:
+        # a single letter or, when allowed, the whole word
+        if self.status != Status.playing:
+            raise ValueError("game is over")
+        guess = self.alphabet.parse(user_input)
+        if guess is None:
+            # letters from outside the alphabet are played as before, a
+            # letter changes nothing and a word can not be the answer
+            if not user_input.isalpha():
+                return Result.invalid
+            guess = user_input.upper()
+        if len(guess) > 1:
+            if not self.guess_word:
+                return Result.invalid
+            return self.guess_whole_word(guess)
+        return self.guess_letter(guess)
+
+    def guess_letter(self, letter: str) -> str:
+        bit = self.alphabet.bits.get(letter, 0)
+        if not bit or self.guessed & bit:
+            return Result.already_guessed
+        self.guessed |= bit
+
+        positions = self._positions.get(letter)
+        if positions is None:
+            self._wrong_guess()
+            return Result.miss
+
+        blank_word = self.blank_word
+        for i in positions:
+            blank_word[i] = letter
+        self.hidden -= len(positions)
+        if not self.hidden:
+            self.status = Status.won
+        return Result.hit
+
+    def guess_whole_word(self, word: str) -> str:
+        if word != self.word:
+            self._wrong_guess()
+            return Result.word_wrong
+        self.blank_word = [x for x in self.word]
+        self.hidden = 0
+        self.status = Status.won
+        return Result.word_correct
+
+    def _wrong_guess(self) -> None:
+        self.wrong_guesses += 1
+        if self.wrong_guesses >= self.num_wrong_guesses:
+            self.status = Status.lost
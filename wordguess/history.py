@@ -0,0 +1,287 @@
+# Append-only log of finished games.
+#
+# The log is a short file header followed by length-prefixed records,
+# little endian:
+#
+#   header   magic, version
+#   record   u32 size of the rest of the record
+#            started (unix time, f64), duration (seconds, f64), outcome,
+#            wrong guesses, wrong guesses allowed, word size, guesses size
+#            UTF-8 word, UTF-8 guesses joined by newlines
+#
+# Records are packed into a buffer and appended with one write per batch.
+# A record cut short by a crash can only be the last one, readers stop
+# there.
+import argparse
+import os
+import struct
+import sys
+
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import NamedTuple
+from typing import Tuple
+
+from wordguess import engine
+
+MAGIC = b"WGHL"
+VERSION = 1
+HEADER = struct.Struct("<4sH")
+SIZE = struct.Struct("<I")
+RECORD = struct.Struct("<ddBBBHH")
+# the most the u8 fields of a record hold, the game allows no more
+MAX_WRONG_GUESSES = 255
+# the u16 size fields
+MAX_FIELD_SIZE = 65535
+HISTORY_FILE = "history.log"
+DATA_DIR_ENV = "WORDGUESS_DATA_DIR"
+DEFAULT_BATCH_SIZE = 64
+READ_SIZE = 1 << 16
+
+QUIT = "quit"
+OUTCOMES = (engine.Status.won, engine.Status.lost, QUIT)
+
+
+class GameRecord(NamedTuple):
+    word: str
+    guesses: Tuple[str, ...]
+    wrong_guesses: int
+    num_wrong_guesses: int
+    outcome: str
+    started: float
+    duration: float
+
+
+def data_dir() -> str:
+    # directory for the player's data, WORDGUESS_DATA_DIR overrides
+    path = os.environ.get(DATA_DIR_ENV)
+    if path:
+        return path
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA", os.path.expanduser("~"))
+    else:
+        base = os.environ.get("XDG_DATA_HOME",
+                              os.path.join(os.path.expanduser("~"), ".local",
+                                           "share"))
+    return os.path.join(base, "wordguess")
+
+
+def history_path() -> str:
+    return os.path.join(data_dir(), HISTORY_FILE)
+
+
+def pack(record: GameRecord) -> bytes:
+    # raises ValueError for a game too big for the fields of a record,
+    # rather than log it wrong
+    word = record.word.encode("utf-8")
+    guesses = "\n".join(record.guesses).encode("utf-8")
+    if max(record.wrong_guesses, record.num_wrong_guesses) > \
+            MAX_WRONG_GUESSES or \
+            max(len(word), len(guesses)) > MAX_FIELD_SIZE:
+        raise ValueError("game too big for a history record")
+    body = RECORD.pack(record.started, record.duration,
+                       OUTCOMES.index(record.outcome),
+                       record.wrong_guesses, record.num_wrong_guesses,
+                       len(word), len(guesses))
+    size = SIZE.pack(len(body) + len(word) + len(guesses))
+    return b"".join((size, body, word, guesses))
+
+
+def unpack(data: bytes) -> GameRecord:
+    # data is one record without its size prefix
+    (started, duration, outcome, wrong_guesses, num_wrong_guesses,
+     word_size, guesses_size) = RECORD.unpack_from(data)
+    pos = RECORD.size
+    word = str(data[pos:pos + word_size], "utf-8")
+    pos += word_size
+    guesses = str(data[pos:pos + guesses_size], "utf-8")
+    return GameRecord(word, tuple(guesses.split("\n")) if guesses else (),
+                      wrong_guesses, num_wrong_guesses, OUTCOMES[outcome],
+                      started, duration)
+
+
+class HistoryWriter:
+    """
+    Buffers game records and appends them to the log batch_size at a time,
+    flush() or close() writes whatever is left.  Every batch is one write
+    to a file opened for appending, so several processes can share a log.
+    """
+    def __init__(self,
+                 path: str,
+                 batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+        self.path = path
+        self.batch_size = batch_size
+        self.buffer = bytearray()
+        self.pending = 0
+
+    def record(self, record: GameRecord) -> None:
+        try:
+            self.buffer += pack(record)
+        except ValueError:
+            return  # the history is best effort, never stop a game for it
+        self.pending += 1
+        if self.pending >= self.batch_size:
+            self.flush()
+
+    def record_game(self,
+                    game: engine.GameState,
+                    guesses: Iterable[str],
+                    outcome: str,
+                    started: float,
+                    duration: float) -> None:
+        self.record(GameRecord(game.word, tuple(guesses),
+                               game.wrong_guesses, game.num_wrong_guesses,
+                               outcome, started, duration))
+
+    def flush(self) -> None:
+        if not self.buffer:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, "ab", buffering=0) as f:
+                if f.tell() == 0:
+                    f.write(HEADER.pack(MAGIC, VERSION) + self.buffer)
+                else:
+                    f.write(self.buffer)
+        except OSError:
+            pass  # the history is best effort, never stop a game for it
+        self.buffer = bytearray()
+        self.pending = 0
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self) -> "HistoryWriter":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+
+def iter_blocks(path: str, size: int = READ_SIZE) -> Iterator[bytes]:
+    """
+    Stream the records of a log as blocks of about size bytes, each a run
+    of whole records with their size prefixes, see iter_block_records().
+    A missing log has no blocks, a file that is not a log raises
+    ValueError.
+    """
+    try:
+        f = open(path, "rb", buffering=0)
+    except FileNotFoundError:
+        return
+    with f:
+        header = f.read(HEADER.size)
+        if not header:
+            return
+        if len(header) < HEADER.size or \
+                HEADER.unpack(header) != (MAGIC, VERSION):
+            raise ValueError(f"{path} is not a game history log")
+        data = b""
+        while True:
+            chunk = f.read(size)
+            if not chunk:
+                return  # anything left over was cut short by a crash
+            data += chunk
+            pos = 0
+            end = len(data)
+            while pos + SIZE.size <= end:
+                record_size = SIZE.unpack_from(data, pos)[0]
+                if record_size < RECORD.size:
+                    if pos:
+                        yield data[:pos]
+                    return  # not a record, stop like at a cut
+                if pos + SIZE.size + record_size > end:
+                    break
+                pos += SIZE.size + record_size
+            if pos:
+                yield data[:pos]
+            data = data[pos:]
+
+
+def iter_block_records(data: bytes) -> Iterator[GameRecord]:
+    # the records of one block from iter_blocks()
+    pos = 0
+    end = len(data)
+    while pos < end:
+        record_size = SIZE.unpack_from(data, pos)[0]
+        pos += SIZE.size
+        try:
+            yield unpack(data[pos:pos + record_size])
+        except (struct.error, UnicodeDecodeError):
+            return
+        pos += record_size
+
+
+def iter_records(path: str) -> Iterator[GameRecord]:
+    """
+    Stream the records of a log one at a time.
+    A missing log has no records, a file that is not a log raises
+    ValueError.
+    """
+    for block in iter_blocks(path):
+        for record in iter_block_records(block):
+            yield record
+
+
+class Stats:
+    """
+    Totals over game records, built one record at a time so a log of any
+    size is read in constant memory.
+    """
+    def __init__(self) -> None:
+        self.games = 0
+        self.outcomes = {x: 0 for x in OUTCOMES}
+        self.wrong_guesses = 0
+        self.guesses = 0
+        self.duration = 0.0
+        # word length: [games, wins]
+        self.by_length: Dict[int, List[int]] = {}
+
+    def add(self, record: GameRecord) -> None:
+        self.games += 1
+        self.outcomes[record.outcome] += 1
+        self.wrong_guesses += record.wrong_guesses
+        self.guesses += len(record.guesses)
+        self.duration += record.duration
+        counts = self.by_length.setdefault(len(record.word), [0, 0])
+        counts[0] += 1
+        counts[1] += record.outcome == engine.Status.won
+
+    def report(self) -> List[str]:
+        if not self.games:
+            return ["No games recorded"]
+        won = self.outcomes[engine.Status.won]
+        lines = [
+            f"Games {self.games}: {won} won, "
+            f"{self.outcomes[engine.Status.lost]} lost, "
+            f"{self.outcomes[QUIT]} quit",
+            f"Win rate {won / self.games:.1%}",
+            f"Average wrong guesses {self.wrong_guesses / self.games:.2f}",
+            f"Average guesses {self.guesses / self.games:.2f}",
+            f"Average game time {self.duration / self.games:.1f}s",
+            "Word length  games  win rate",
+        ]
+        for length, (games, wins) in sorted(self.by_length.items()):
+            lines.append(f"{length:11}  {games:5}  {wins / games:8.1%}")
+        return lines
+
+
+def stats(records: Iterable[GameRecord]) -> Stats:
+    result = Stats()
+    for record in records:
+        result.add(record)
+    return result
+
+
+def run(args: argparse.Namespace) -> int:
+    path = args.history_file or history_path()
+    try:
+        result = stats(iter_records(path))
+    except ValueError as e:
+        print(f"Error {e}")
+        return 1
+    for line in result.report():
+        print(line)
+    return 0
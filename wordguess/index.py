@@ -0,0 +1,199 @@
+# Length-bucketed word index cached on disk.
+#
+# The index is a compact dictionary (see compact.py) stamped with the mtime
+# and size of the word list it was built from, words are grouped by length
+# so a min/max range is one slice of it.
+#
+# Every word list gets its own index in the cache directory, named after
+# the list's path.  Indexes are memory mapped, so processes using the same
+# list share one copy through the page cache.  Opening an index marks it
+# used (its mtime) and building one evicts the least recently used indexes
+# once the cache is over CACHE_SIZE bytes.
+import hashlib
+import os
+import sys
+
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from wordguess import compact
+from wordguess import engine
+
+INDEX_SUFFIX = ".idx"
+CACHE_DIR_ENV = "WORDGUESS_CACHE_DIR"
+CACHE_SIZE = 1 << 30
+
+Stamp = Tuple[int, int]
+
+
+def cache_dir() -> str:
+    # directory for generated word data, WORDGUESS_CACHE_DIR overrides
+    path = os.environ.get(CACHE_DIR_ENV)
+    if path:
+        return path
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA", os.path.expanduser("~"))
+    else:
+        base = os.environ.get("XDG_CACHE_HOME",
+                              os.path.join(os.path.expanduser("~"), ".cache"))
+    return os.path.join(base, "wordguess")
+
+
+def index_path(name: str) -> str:
+    return os.path.join(cache_dir(), name + INDEX_SUFFIX)
+
+
+def source_index_path(source: str) -> str:
+    # the index of a word list file, the name is unique to its full path
+    path = os.path.abspath(source)
+    digest = hashlib.blake2b(os.fsencode(path), digest_size=8).hexdigest()
+    return index_path(f"{os.path.basename(path)}-{digest}")
+
+
+def source_stamp(path: str) -> Stamp:
+    # an index is only valid for the exact source file it was built from
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def bucket_words(words: Iterable[str]) -> Dict[int, List[str]]:
+    buckets: Dict[int, List[str]] = {}
+    for word in words:
+        buckets.setdefault(len(word), []).append(word)
+    return buckets
+
+
+def select(buckets: Dict[int, List[str]],
+           min_length: int,
+           max_length: int) -> List[str]:
+    # concatenate the buckets in the range, shortest words first
+    words: List[str] = []
+    for length in range(min_length, max_length + 1):
+        words.extend(buckets.get(length, ()))
+    return words
+
+
+def write_index(path: str, buckets: Dict[int, List[str]], stamp: Stamp) -> None:
+    compact.write_words(path, select(buckets, 0, max(buckets, default=0)),
+                        stamp)
+
+
+def open_index(path: str,
+               stamp: Stamp) -> Optional[compact.CompactWordList]:
+    """
+    Open the index as a memory mapped word list.
+    Returns None if the index is missing, unreadable or built from a
+    different version of the source file.
+    """
+    try:
+        words = compact.CompactWordList(path)
+    except (OSError, ValueError):
+        return None
+    if words.stamp != stamp:
+        words.close()
+        return None
+    return words
+
+
+def read_range(path: str,
+               min_length: int,
+               max_length: int,
+               stamp: Stamp) -> Optional[List[str]]:
+    # the words with a length between min_length and max_length or None
+    words = open_index(path, stamp)
+    if words is None:
+        return None
+    with words:
+        return list(words.length_range(min_length, max_length))
+
+
+def touch(path: str) -> None:
+    # mark the index as used for evict()
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def evict(keep: str, max_size: int = CACHE_SIZE) -> List[str]:
+    """
+    Remove the least recently used indexes, and the files kept next to
+    them, until the cache directory is under max_size bytes.
+    The index at keep is never removed.  Returns the removed indexes.
+    """
+    directory = os.path.dirname(keep)
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return []
+    # index name: [last used, bytes of the index and its sidecars, files]
+    entries: Dict[str, List[Any]] = {}
+    for name in names:
+        end = name.rfind(INDEX_SUFFIX)
+        if end < 0 or name.endswith(".tmp"):
+            continue  # not ours, or being written by another process
+        index_name = name[:end + len(INDEX_SUFFIX)]
+        try:
+            stat = os.stat(os.path.join(directory, name))
+        except OSError:
+            continue
+        entry = entries.setdefault(index_name, [0.0, 0, []])
+        if name == index_name:
+            entry[0] = stat.st_mtime
+        entry[1] += stat.st_size
+        entry[2].append(name)
+    total = sum(x[1] for x in entries.values())
+    removed = []
+    for index_name, (_, size, files) in sorted(entries.items(),
+                                               key=lambda x: x[1][0]):
+        if total <= max_size:
+            break
+        if index_name == os.path.basename(keep):
+            continue
+        for name in files:
+            try:
+                # processes that have it mapped keep their copy
+                os.remove(os.path.join(directory, name))
+            except OSError:
+                pass
+        total -= size
+        removed.append(os.path.join(directory, index_name))
+    return removed
+
+
+def open_source(source: str,
+                max_size: int = CACHE_SIZE,
+                alphabet: engine.Alphabet = engine.ENGLISH,
+                stamp: Optional[Stamp] = None
+                ) -> Union[compact.CompactWordList, List[str]]:
+    """
+    Every word of a text word list, shortest first, from its index.
+    The index is built by streaming the list through ingest.clean() when
+    it is missing or out of date (stamp, the source's by default), if it
+    can not be written the words are returned as a list.
+    """
+    from wordguess import ingest
+    if stamp is None:
+        stamp = source_stamp(source)
+    path = source_index_path(source)
+    words = open_index(path, stamp)
+    if words is not None:
+        touch(path)
+        return words
+    try:
+        ingest.ingest(source, path, alphabet=alphabet, stamp=stamp)
+    except OSError:
+        words = None
+    else:
+        evict(path, max_size)
+        words = open_index(path, stamp)
+    if words is None:
+        buckets = bucket_words(ingest.clean(compact.iter_file_words(source),
+                                            alphabet=alphabet))
+        return select(buckets, 0, max(buckets, default=0))
+    return words
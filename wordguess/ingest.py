@@ -0,0 +1,284 @@
+# Cleans raw word lists for the game.
+#
+# A word list is streamed through a chain of generators, one word at a
+# time, so a list of any size is cleaned in bounded memory:
+#
+#   read       whitespace separated words of the file, a block at a time,
+#              words that are not UTF-8 rejected
+#   strip      byte order marks, at the start of the file or anywhere a
+#              file was concatenated onto another
+#   normalize  case forms to the letters of the alphabet, then Unicode
+#              NFKC and upper case for words that still do not fit,
+#              optionally accents folded away (CAFÉ -> CAFE)
+#   validate   drops words with letters outside the alphabet (DON'T) or
+#              longer than MAX_WORD_LENGTH
+#   unique     drops repeated words
+#
+# Repeats are found exactly with a set of words until it holds EXACT_LIMIT
+# words, the rest of a larger list is split into partition files by a hash
+# of the word and each partition has a set of its own, so memory stays
+# bounded and no word is ever taken for a repeat by mistake.
+#
+# python -m wordguess.ingest raw.txt words.wgd writes the cleaned list as
+# a compact dictionary.
+import argparse
+import os
+import tempfile
+import time
+import unicodedata
+import zlib
+
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+from typing import Sequence
+from typing import Set
+
+from wordguess import compact
+from wordguess import engine
+
+BOM = "\ufeff"
+MAX_WORD_LENGTH = 64
+EXACT_LIMIT = 1 << 20
+# a guess of the bytes per word of a list, to choose the partitions
+BYTES_PER_WORD = 8
+WRITE_BATCH = 1 << 14
+
+
+class Stats:
+    """
+    Counts kept by the stages of a pipeline.
+    """
+    def __init__(self) -> None:
+        self.read = 0
+        self.boms = 0
+        self.normalized = 0
+        self.rejected: Dict[str, int] = {}
+        self.duplicates = 0
+        self.written = 0
+
+    def reject(self, reason: str) -> None:
+        self.rejected[reason] = self.rejected.get(reason, 0) + 1
+
+    def report(self) -> str:
+        rejected = ", ".join(f"{n} {reason}" for reason, n
+                             in sorted(self.rejected.items()))
+        return (f"{self.read} read, {self.written} written, "
+                f"{self.duplicates} duplicates, "
+                f"{sum(self.rejected.values())} rejected"
+                f"{f' ({rejected})' if rejected else ''}, "
+                f"{self.boms} byte order marks, {self.normalized} normalized")
+
+
+def read(path: str, stats: Stats) -> Iterator[str]:
+    def undecodable(word: bytes) -> None:
+        stats.read += 1
+        stats.reject("not UTF-8")
+
+    for word in compact.iter_file_words(path, on_error=undecodable):
+        stats.read += 1
+        yield word
+
+
+def strip(words: Iterable[str], stats: Stats) -> Iterator[str]:
+    for word in words:
+        if BOM in word:
+            stats.boms += 1
+            word = word.replace(BOM, "")
+            if not word:
+                continue
+        yield word
+
+
+def _fold(word: str) -> str:
+    # accented letters to their base letters
+    decomposed = unicodedata.normalize("NFKD", word)
+    return unicodedata.normalize(
+        "NFC", "".join(x for x in decomposed if not unicodedata.combining(x)))
+
+
+def normalize(words: Iterable[str],
+              stats: Stats,
+              fold_accents: bool = False,
+              alphabet: engine.Alphabet = engine.ENGLISH) -> Iterator[str]:
+    letters = alphabet.letter_set
+    ascii_upper = alphabet.upper
+    fold = alphabet.fold
+    for word in words:
+        if ascii_upper and word.isascii():
+            # the common case, no Unicode tables needed
+            normal = word.upper()
+        else:
+            normal = fold(word)
+            if not letters.issuperset(normal):
+                normal = fold(unicodedata.normalize("NFKC", normal).upper())
+            if fold_accents and not letters.issuperset(normal):
+                # only letters the alphabet does not have, Å stays in an
+                # alphabet with Å and A
+                normal = fold("".join(
+                    x if x in letters else _fold(x) for x in normal))
+        if normal != word:
+            stats.normalized += 1
+        yield normal
+
+
+def validate(words: Iterable[str],
+             stats: Stats,
+             alphabet: engine.Alphabet = engine.ENGLISH) -> Iterator[str]:
+    letters = alphabet.letter_set
+    for word in words:
+        if len(word) > MAX_WORD_LENGTH:
+            stats.reject("too long")
+        elif not letters.issuperset(word):
+            stats.reject("not in the alphabet")
+        else:
+            yield word
+
+
+def unique(words: Iterable[str],
+           stats: Stats,
+           capacity: int = EXACT_LIMIT,
+           exact_limit: int = EXACT_LIMIT,
+           tmp_dir: Optional[str] = None) -> Iterator[str]:
+    """
+    Drops repeated words, the first of each comes out.
+    The first exact_limit different words are kept in a set and come out
+    in file order.  The words after them that are not in the set are
+    spilled to partition files by a hash of the word, enough partitions
+    for capacity words, and each partition is deduplicated with a set of
+    its own after the input ends.
+    """
+    seen: Set[str] = set()
+    words = iter(words)
+    for word in words:
+        if word in seen:
+            stats.duplicates += 1
+            continue
+        seen.add(word)
+        yield word
+        if len(seen) >= exact_limit:
+            break
+    else:
+        return
+    count = max(-(-capacity // exact_limit), 2)
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as tmp:
+        files = [open(os.path.join(tmp, str(i)), "w+", encoding="utf-8")
+                 for i in range(count)]
+        try:
+            for word in words:
+                if word in seen:
+                    stats.duplicates += 1
+                else:
+                    # a stable hash, the order must not change between runs
+                    files[zlib.crc32(word.encode("utf-8")) % count].write(
+                        word + "\n")
+            for f in files:
+                f.seek(0)
+                partition: Set[str] = set()
+                for line in f:
+                    word = line[:-1]
+                    if word in partition:
+                        stats.duplicates += 1
+                    else:
+                        partition.add(word)
+                        yield word
+        finally:
+            for f in files:
+                f.close()
+
+
+def clean(words: Iterable[str],
+          stats: Optional[Stats] = None,
+          capacity: int = EXACT_LIMIT,
+          fold_accents: bool = False,
+          alphabet: engine.Alphabet = engine.ENGLISH,
+          tmp_dir: Optional[str] = None) -> Iterator[str]:
+    # every stage after read, for words that are already split, capacity
+    # is about how many words there are
+    if stats is None:
+        stats = Stats()
+    pipeline = strip(words, stats)
+    pipeline = normalize(pipeline, stats, fold_accents, alphabet)
+    pipeline = validate(pipeline, stats, alphabet)
+    pipeline = unique(pipeline, stats, capacity, tmp_dir=tmp_dir)
+    for word in pipeline:
+        stats.written += 1
+        yield word
+
+
+def ingest(source: str,
+           dest: str,
+           stats: Optional[Stats] = None,
+           fold_accents: bool = False,
+           alphabet: engine.Alphabet = engine.ENGLISH,
+           stamp: Optional[compact.Stamp] = None) -> Stats:
+    """
+    Clean the word list at source and write it to dest as a compact
+    dictionary stamped like source, or with stamp, so it can be its index.
+    The cleaned words go through a temporary text file next to dest, the
+    pipeline runs once and the compact writer reads the clean words twice.
+    """
+    if stats is None:
+        stats = Stats()
+    stat = os.stat(source)
+    if stamp is None:
+        stamp = (stat.st_mtime_ns, stat.st_size)
+    capacity = stat.st_size // BYTES_PER_WORD
+    os.makedirs(os.path.dirname(dest) or ".", exist_ok=True)
+    words = clean(read(source, stats), stats, capacity, fold_accents,
+                  alphabet, os.path.dirname(dest) or ".")
+    tmp_path = f"{dest}.{os.getpid()}.words.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            batch = []
+            for word in words:
+                batch.append(word)
+                if len(batch) >= WRITE_BATCH:
+                    f.write("\n".join(batch) + "\n")
+                    batch = []
+            if batch:
+                f.write("\n".join(batch) + "\n")
+        compact.convert(tmp_path, dest, stamp)
+    finally:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+    return stats
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m wordguess.ingest",
+        description="Clean a raw word list and write a compact dictionary")
+    parser.add_argument("source", help="raw word list, one word per line")
+    parser.add_argument("dest", help="compact dictionary file to write")
+    parser.add_argument("--alphabet", metavar="PATH",
+                        help="The letters of the list, a file like a "
+                             "dictionary's .alphabet file default: A to Z")
+    parser.add_argument("--fold_accents", action="store_true",
+                        help="Play accented letters as their base letters "
+                             "instead of rejecting the word")
+    args = parser.parse_args(argv)
+
+    alphabet = engine.ENGLISH
+    if args.alphabet is not None:
+        from wordguess import dictionaries
+        try:
+            alphabet = dictionaries.read_alphabet(args.alphabet)
+        except (OSError, ValueError) as e:
+            print(f"Error {e}")
+            return 1
+    start = time.perf_counter()
+    stats = ingest(args.source, args.dest, fold_accents=args.fold_accents,
+                   alphabet=alphabet)
+    elapsed = time.perf_counter() - start
+    print(stats.report())
+    print(f"{args.dest} written in {elapsed:.2f}s, "
+          f"{stats.read / elapsed if elapsed else 0:,.0f} words/s")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
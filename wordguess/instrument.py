@@ -0,0 +1,198 @@
+# Timers and counters for the game loop.
+#
+# A Metrics registry counts events (games, guesses, invalid inputs) and
+# times the stages of a game (loading the words, drawing the board,
+# waiting for input, applying a guess).  Stages are timed by wrapping the
+# function that does the work, so play() only pays for instrumentation
+# when it is given a registry; without one nothing is wrapped.
+#
+# flush() hands a snapshot of the totals to a sink, a MemorySink that
+# keeps them or a JsonLinesSink that appends one JSON object per line.
+#
+# profile() runs a block under cProfile and tracemalloc for a closer look.
+import contextlib
+import sys
+import time
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import TextIO
+from typing import TypeVar
+
+PROFILE_LINES = 15
+TRACEMALLOC_FRAMES = 10
+TRACEMALLOC_SUFFIX = ".tracemalloc"
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class Timer:
+    """
+    Running totals for one timed stage, seconds.
+    """
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def as_dict(self) -> Dict[str, float]:
+        mean = self.total / self.count if self.count else 0.0
+        return {"count": self.count, "total": self.total, "mean": mean,
+                "max": self.max}
+
+
+class MemorySink:
+    """
+    Keeps every snapshot in a list, for tests and for reading the numbers
+    in the same process.
+    """
+    def __init__(self) -> None:
+        self.snapshots: List[Dict[str, Any]] = []
+
+    def write(self, snapshot: Dict[str, Any]) -> None:
+        self.snapshots.append(snapshot)
+
+    def close(self) -> None:
+        pass
+
+
+class JsonLinesSink:
+    """
+    Appends each snapshot to a file as one line of JSON.
+    """
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def write(self, snapshot: Dict[str, Any]) -> None:
+        import json
+        with open(self.path, "a") as f:
+            f.write(json.dumps(snapshot, sort_keys=True) + "\n")
+
+    def close(self) -> None:
+        pass
+
+
+class Metrics:
+    """
+    Registry of counters and timers.  snapshot() is the totals so far,
+    flush() sends it to the sink, if there is one.
+    """
+    def __init__(self, sink: Optional[Any] = None) -> None:
+        self.sink = sink
+        self.counters: Dict[str, int] = {}
+        self.timers: Dict[str, Timer] = {}
+        self.started = time.time()
+
+    def count(self, name: str, n: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def timer(self, name: str) -> Timer:
+        timer = self.timers.get(name)
+        if timer is None:
+            timer = self.timers[name] = Timer()
+        return timer
+
+    def timed(self, name: str, func: F) -> F:
+        # func wrapped to add the time of every call to the name timer,
+        # a plain closure since play() wraps its stages for every game
+        timer = self.timer(name)
+        perf_counter = time.perf_counter
+
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                timer.add(perf_counter() - start)
+        return wrapper  # type: ignore
+
+    @contextlib.contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        # times a block, for code that is not a single call
+        timer = self.timer(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            timer.add(time.perf_counter() - start)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "time": time.time(),
+            "elapsed": time.time() - self.started,
+            "counters": dict(self.counters),
+            "timers": {name: timer.as_dict()
+                       for name, timer in self.timers.items()},
+        }
+
+    def flush(self) -> None:
+        if self.sink is not None:
+            self.sink.write(self.snapshot())
+
+    def close(self) -> None:
+        self.flush()
+        if self.sink is not None:
+            self.sink.close()
+
+    def report(self) -> List[str]:
+        lines = [f"{name} {value}"
+                 for name, value in sorted(self.counters.items())]
+        if self.timers:
+            lines.append("stage              calls   total ms   mean ms  "
+                         " max ms")
+        for name, timer in sorted(self.timers.items()):
+            data = timer.as_dict()
+            lines.append(f"{name:16} {timer.count:7} "
+                         f"{data['total'] * 1e3:10.2f} "
+                         f"{data['mean'] * 1e3:9.3f} "
+                         f"{data['max'] * 1e3:8.2f}")
+        return lines
+
+
+@contextlib.contextmanager
+def profile(path: str, out: Optional[TextIO] = None) -> Iterator[None]:
+    """
+    Runs the block under cProfile and tracemalloc.
+    The profile is saved to path (read it with pstats or snakeviz), the
+    tracemalloc snapshot to path + ".tracemalloc" (tracemalloc.Snapshot.load)
+    and a summary of both is written to out, stderr by default.
+    """
+    import cProfile
+    import pstats
+    import tracemalloc
+
+    profiler = cProfile.Profile()
+    tracemalloc.start(TRACEMALLOC_FRAMES)
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        if out is None:
+            out = sys.stderr
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        profiler.dump_stats(path)
+        snapshot.dump(path + TRACEMALLOC_SUFFIX)
+
+        stats = pstats.Stats(path, stream=out)
+        stats.sort_stats("cumulative").print_stats(PROFILE_LINES)
+        print(f"Memory {current / 1024:.1f} KiB in use, "
+              f"{peak / 1024:.1f} KiB peak", file=out)
+        for stat in snapshot.statistics("lineno")[:PROFILE_LINES]:
+            print(stat, file=out)
+        print(f"Profile saved to {path} and {path}{TRACEMALLOC_SUFFIX}",
+              file=out)
@@ -0,0 +1,192 @@
+# Matches, several players racing through the same words.
+#
+# Every player of a match plays the same words in the same order, each on
+# their own engine.GameState, against one clock started when the match
+# starts.  When a player wins or loses a word their next word starts right
+# away, a player is finished after the last word, on quitting or when the
+# clock runs out.  Players are ranked by words won, then by how soon they
+# finished, then by wrong guesses.
+#
+# Guesses can come from many threads.  Each match has its own lock, held
+# only while one guess is applied, so guesses in different matches never
+# wait for each other.  The standings are a tuple that is replaced, not
+# changed, when a round ends, readers take it without the lock.
+import threading
+import time
+
+from typing import Callable
+from typing import Dict
+from typing import NamedTuple
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from wordguess import engine
+
+TIME_UP = "time up"
+
+
+class Standing(NamedTuple):
+    name: str
+    won: int
+    wrong_guesses: int
+    # seconds from the start to the end of the player's match, None while
+    # they are playing
+    finished: Optional[float]
+
+
+class Player:
+    """
+    One player of a match and the game of the word they are on.
+    """
+    __slots__ = ("name", "game", "round", "won", "wrong_guesses",
+                 "finished")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.game: Optional[engine.GameState] = None
+        self.round = 0
+        self.won = 0
+        self.wrong_guesses = 0
+        self.finished: Optional[float] = None
+
+
+def rank(players: Sequence[Player]) -> Tuple[Standing, ...]:
+    standings = [Standing(x.name, x.won, x.wrong_guesses, x.finished)
+                 for x in players]
+    standings.sort(key=lambda x: (-x.won, x.finished is None,
+                                  x.finished or 0.0, x.wrong_guesses))
+    return tuple(standings)
+
+
+class Match:
+    """
+    Players racing through words on one clock.
+    Players join() until start(), then guess() from any thread.  A guess
+    returns its result and the game it was made in, the player's game is
+    the next word when that one is over.
+    """
+    def __init__(self,
+                 words: Sequence[str],
+                 num_wrong_guesses: int,
+                 guess_word: bool = True,
+                 alphabet: engine.Alphabet = engine.ENGLISH,
+                 time_limit: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        if not words:
+            raise ValueError("a match needs at least one word")
+        self.words = tuple(words)
+        self.num_wrong_guesses = num_wrong_guesses
+        self.guess_word = guess_word
+        self.alphabet = alphabet
+        self.time_limit = time_limit
+        self.clock = clock
+        self.players: Dict[str, Player] = {}
+        self.started: Optional[float] = None
+        self.standings: Tuple[Standing, ...] = ()
+        self._finished = 0
+        self._lock = threading.Lock()
+
+    def join(self, name: str) -> Player:
+        with self._lock:
+            if self.started is not None:
+                raise ValueError("the match has started")
+            if name in self.players:
+                raise ValueError(f"{name} is already in the match")
+            player = Player(name)
+            self.players[name] = player
+            self.standings = rank(list(self.players.values()))
+            return player
+
+    def start(self) -> None:
+        with self._lock:
+            if self.started is not None:
+                return
+            self.started = self.clock()
+            for player in self.players.values():
+                player.game = self._new_game(0)
+
+    def elapsed(self) -> float:
+        if self.started is None:
+            return 0.0
+        return self.clock() - self.started
+
+    def remaining(self) -> Optional[float]:
+        # seconds left on the clock, None when there is no time limit
+        if self.time_limit is None:
+            return None
+        return max(self.time_limit - self.elapsed(), 0.0)
+
+    @property
+    def over(self) -> bool:
+        if self.started is None:
+            return False
+        return self._finished == len(self.players) or \
+            self.remaining() == 0.0
+
+    def guess(self,
+              player: Player,
+              user_input: str) -> Tuple[str, engine.GameState]:
+        with self._lock:
+            game = player.game
+            if game is None or player.finished is not None:
+                raise ValueError("the player is not playing")
+            elapsed = self.clock() - self.started
+            if self.time_limit is not None and elapsed >= self.time_limit:
+                self._finish(player, self.time_limit)
+                return TIME_UP, game
+            result = game.guess(user_input)
+            if game.status != engine.Status.playing:
+                player.round += 1
+                player.won += game.status == engine.Status.won
+                player.wrong_guesses += game.wrong_guesses
+                if player.round == len(self.words):
+                    self._finish(player, elapsed)
+                else:
+                    player.game = self._new_game(player.round)
+                    self.standings = rank(list(self.players.values()))
+            return result, game
+
+    def finish(self, player: Player) -> None:
+        # the player quit or their time is up, they keep the words they won
+        with self._lock:
+            if player.finished is None:
+                elapsed = self.elapsed()
+                if self.time_limit is not None:
+                    elapsed = min(elapsed, self.time_limit)
+                self._finish(player, elapsed)
+
+    def _finish(self, player: Player, elapsed: float) -> None:
+        player.finished = elapsed
+        self._finished += 1
+        self.standings = rank(list(self.players.values()))
+
+    def _new_game(self, word: int) -> engine.GameState:
+        return engine.GameState(self.words[word], self.num_wrong_guesses,
+                                self.guess_word, self.alphabet)
+
+
+class Lobby:
+    """
+    Puts players into matches of size players in the order they arrive,
+    a match starts as soon as it is full.  new_match() makes the match for
+    the next players.
+    """
+    def __init__(self, size: int, new_match: Callable[[], Match]) -> None:
+        self.size = size
+        self.new_match = new_match
+        self.matches = 0
+        self._open: Optional[Match] = None
+        self._lock = threading.Lock()
+
+    def join(self, name: str) -> Tuple[Match, Player]:
+        with self._lock:
+            match = self._open
+            if match is None:
+                match = self._open = self.new_match()
+                self.matches += 1
+            player = match.join(name)
+            if len(match.players) >= self.size:
+                self._open = None
+                match.start()
+            return match, player
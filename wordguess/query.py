@@ -0,0 +1,273 @@
+# Word pattern queries, for puzzle tools as well as the game.
+#
+# A pattern is a word with _ for any letter, _A__E finds the five letter
+# words with A second and E last, and letters can be excluded from the
+# whole word.  Queries are answered from a positional inverted index: for
+# every (length, position, letter) the sorted ids of the words with that
+# letter there, for every (length, letter) the ids of the words containing
+# the letter anywhere and for every length the ids of all its words.  A
+# query intersects the lists of its letters, shortest first, and takes
+# away the lists of the excluded letters.
+#
+# The index is built once from the word index and kept in a sidecar next
+# to it, stamped like it, memory mapped so a query only touches the lists
+# it needs.  Layout, little endian:
+#
+#   header  magic, version, key count, id count, source mtime_ns,
+#           source size
+#   keys    u64 per list, length << 40 | position << 21 | code point,
+#           sorted, position ANYWHERE for the lists of a whole length
+#   starts  u32 per list plus one, offset of the list in ids
+#   ids     u32 word ids, each list sorted
+import argparse
+import array
+import bisect
+import mmap
+import os
+import struct
+import sys
+import time
+
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from wordguess import compact
+from wordguess import engine
+
+MAGIC = b"WGDP"
+VERSION = 1
+HEADER = struct.Struct("<4sHxxIIqq")
+PATTERN_SUFFIX = ".pattern"
+WILDCARDS = "_."
+# position of the lists for a whole length, code point 0 for all its words
+ANYWHERE = (1 << 19) - 1
+ALL_WORDS = 0
+
+Stamp = Tuple[int, int]
+
+
+def key(length: int, position: int, letter: str) -> int:
+    return length << 40 | position << 21 | ord(letter)
+
+
+def intersect(first: Sequence[int], second: Sequence[int]) -> List[int]:
+    # the ids in both sorted lists, first is the shorter, each id of it is
+    # looked for in second from where the last one was found
+    result = []
+    lo = 0
+    end = len(second)
+    for x in first:
+        lo = bisect.bisect_left(second, x, lo, end)
+        if lo == end:
+            break
+        if second[lo] == x:
+            result.append(x)
+    return result
+
+
+def difference(ids: Sequence[int], other: Sequence[int]) -> List[int]:
+    # the ids not in the sorted list other
+    result = []
+    lo = 0
+    end = len(other)
+    for x in ids:
+        lo = bisect.bisect_left(other, x, lo, end)
+        if lo == end or other[lo] != x:
+            result.append(x)
+    return result
+
+
+class PatternIndex:
+    """
+    Sorted word id lists by (length, position, letter) of a word list.
+    Built with build() or read from a sidecar with read_index().
+    """
+    def __init__(self,
+                 keys: Sequence[int],
+                 starts: Sequence[int],
+                 ids: Sequence[int],
+                 stamp: Stamp = compact.NO_STAMP,
+                 mm: Optional[mmap.mmap] = None) -> None:
+        self.keys = keys
+        self.starts = starts
+        self.ids = ids
+        self.stamp = stamp
+        self._mm = mm
+
+    def postings(self, list_key: int) -> Sequence[int]:
+        # the ids of one list, empty when no word has it
+        i = bisect.bisect_left(self.keys, list_key)
+        if i == len(self.keys) or self.keys[i] != list_key:
+            return ()
+        return self.ids[self.starts[i]:self.starts[i + 1]]
+
+    def count(self, length: int) -> int:
+        return len(self.postings(key(length, ANYWHERE, chr(ALL_WORDS))))
+
+    def match(self, pattern: str, exclude: str = "") -> List[int]:
+        """
+        Ids of the words that fit pattern, letters at their positions and
+        any letter at a wildcard, without any of the letters in exclude.
+        """
+        length = len(pattern)
+        lists = [self.postings(key(length, i, x))
+                 for i, x in enumerate(pattern) if x not in WILDCARDS]
+        lists.sort(key=len)
+        if not lists:
+            lists.append(self.postings(key(length, ANYWHERE,
+                                           chr(ALL_WORDS))))
+        ids = list(lists[0])
+        for other in lists[1:]:
+            if not ids:
+                break
+            ids = intersect(ids, other)
+        for letter in set(exclude):
+            if not ids:
+                break
+            ids = difference(ids, self.postings(key(length, ANYWHERE,
+                                                    letter)))
+        return ids
+
+    def close(self) -> None:
+        if self._mm is not None:
+            for table in (self.keys, self.starts, self.ids):
+                if isinstance(table, memoryview):
+                    table.release()
+            self._mm.close()
+            self._mm = None
+
+
+def build(words: Iterable[str], stamp: Stamp = compact.NO_STAMP
+          ) -> PatternIndex:
+    lists: Dict[int, "array.array[int]"] = {}
+    for i, word in enumerate(words):
+        base = len(word) << 40
+        everywhere = base | ANYWHERE << 21
+        for list_key in {everywhere | ALL_WORDS}.union(
+                [base | p << 21 | ord(x) for p, x in enumerate(word)
+                 if p < ANYWHERE],
+                [everywhere | ord(x) for x in word]):
+            ids = lists.get(list_key)
+            if ids is None:
+                ids = lists[list_key] = array.array("I")
+            ids.append(i)
+    keys = array.array("Q", sorted(lists))
+    starts = array.array("I", [0])
+    all_ids = array.array("I")
+    for list_key in keys:
+        all_ids.extend(lists[list_key])
+        starts.append(len(all_ids))
+    return PatternIndex(keys, starts, all_ids, stamp)
+
+
+def write_index(path: str, index: PatternIndex) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(index.keys), len(index.ids),
+                            *index.stamp))
+        for typecode, table in (("Q", index.keys), ("I", index.starts),
+                                ("I", index.ids)):
+            values = array.array(typecode, table)
+            if sys.byteorder != "little":
+                values.byteswap()
+            values.tofile(f)
+    os.replace(tmp_path, path)
+
+
+def read_index(path: str) -> PatternIndex:
+    # memory maps a sidecar, raises OSError or ValueError
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        magic, version, keys, ids, mtime_ns, size = HEADER.unpack_from(mm)
+    except struct.error:
+        mm.close()
+        raise ValueError(f"{path} is not a pattern index")
+    expected = HEADER.size + keys * 8 + (keys + 1) * 4 + ids * 4
+    if magic != MAGIC or version != VERSION or len(mm) != expected:
+        mm.close()
+        raise ValueError(f"{path} is not a pattern index")
+    tables = []
+    pos = HEADER.size
+    for typecode, count in (("Q", keys), ("I", keys + 1), ("I", ids)):
+        tables.append(compact._table(mm, pos, count, typecode))
+        pos += count * array.array(typecode).itemsize
+    return PatternIndex(*tables, stamp=(mtime_ns, size), mm=mm)
+
+
+def index_path(word_index_path: str) -> str:
+    return word_index_path + PATTERN_SUFFIX
+
+
+def open_index(words: Sequence[str],
+               path: Optional[str] = None) -> PatternIndex:
+    """
+    The pattern index of words, read from the sidecar at path or built
+    and saved there when it is missing or stamped for another version of
+    the list.  Without a path, or for words that are not a compact list,
+    the index is built in memory.
+    """
+    if path is None or not isinstance(words, compact.CompactWordList):
+        return build(words)
+    try:
+        index = read_index(path)
+    except (OSError, ValueError):
+        pass
+    else:
+        if index.stamp == words.stamp:
+            return index
+        index.close()
+    index = build(words, words.stamp)
+    try:
+        write_index(path, index)
+    except OSError:
+        pass  # read-only cache, build again next time
+    return index
+
+
+def normalize_pattern(pattern: str,
+                      alphabet: engine.Alphabet = engine.ENGLISH) -> str:
+    # the letters of a pattern in the case of the alphabet, . is a _ too
+    return "".join(x if x in WILDCARDS else alphabet.fold(x)
+                   for x in pattern)
+
+
+def query(words: Sequence[str],
+          index: PatternIndex,
+          pattern: str,
+          exclude: str = "",
+          alphabet: engine.Alphabet = engine.ENGLISH) -> List[str]:
+    # the words that fit the pattern, in word list order
+    ids = index.match(normalize_pattern(pattern, alphabet),
+                      alphabet.fold(exclude))
+    return [words[i] for i in ids]
+
+
+def run(args: argparse.Namespace) -> int:
+    from wordguess import wordguess
+    alphabet = wordguess.open_alphabet(args.wordlist)
+    words = wordguess.open_word_index(args.wordlist)
+    start = time.perf_counter()
+    index = open_index(words, index_path(
+        wordguess.word_index_path(args.wordlist)))
+    loaded = time.perf_counter()
+    found = query(words, index, args.pattern, args.exclude, alphabet)
+    elapsed = time.perf_counter() - loaded
+    if args.count:
+        print(len(found))
+    else:
+        for word in found[:args.limit]:
+            print(word)
+        if args.limit is not None and len(found) > args.limit:
+            print(f"... {len(found) - args.limit} more")
+    print(f"{len(found)} words in {elapsed * 1000:.2f}ms, index opened in "
+          f"{(loaded - start) * 1000:.0f}ms", file=sys.stderr)
+    index.close()
+    if isinstance(words, compact.CompactWordList):
+        words.close()
+    return 0
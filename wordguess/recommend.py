@@ -0,0 +1,222 @@
+# Words picked to suit the player.
+#
+# Each player has a Profile: their recent win rate and the share of the
+# allowed wrong guesses they used, as moving averages over about the last
+# RECENT_GAMES games, a few numbers per player.  A player winning more
+# than GOAL_WIN_RATE of their games, or using fewer than GOAL_WRONG_RATE
+# of their wrong guesses, gets harder words and one doing worse gets
+# easier ones, until the words are as hard as the player can just manage.
+#
+# A Recommender ranks the words of the game by their difficulty score (see
+# difficulty.py, the solver's wrong guesses with letter rarity breaking
+# ties).  The profile gives a target rank, 0 the easiest word and 1 the
+# hardest, and the word is drawn uniformly from the words scored within
+# SPREAD of the word at that rank: two bisects into the sorted scores, so
+# a draw is O(log n) however long the list is.  At least MIN_CHOICES words
+# nearest the target are always in the draw so the same word doesn't come
+# up game after game.
+#
+# Profiles are kept in a ProfileCache, the least recently used go first
+# once it holds max_size players and a profile not used for ttl seconds is
+# dropped, so the memory is bounded however many players come and go.
+import array
+import bisect
+import collections
+import random
+import time
+
+from typing import Callable
+from typing import Iterable
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from wordguess import difficulty
+from wordguess import engine
+from wordguess import history
+
+RECENT_GAMES = 20
+GOAL_WIN_RATE = 0.7
+GOAL_WRONG_RATE = 0.5
+# how much a change in wrong guesses moves the target against wins
+WRONG_WEIGHT = 0.5
+# games the goal rates count as for a new player
+PRIOR_GAMES = 2
+SPREAD = 0.5
+MIN_CHOICES = 20
+DEFAULT_CACHE_SIZE = 100_000
+DEFAULT_TTL = 24 * 60 * 60
+
+
+class Profile:
+    """
+    Recent results of one player, record() each game won or lost.
+    target() is the difficulty rank of the words to give them next.
+    """
+    __slots__ = ("games", "win_rate", "wrong_rate", "last_used")
+
+    def __init__(self) -> None:
+        self.games = 0
+        self.win_rate = GOAL_WIN_RATE
+        self.wrong_rate = GOAL_WRONG_RATE
+        self.last_used = 0.0
+
+    def record(self,
+               won: bool,
+               wrong_guesses: int,
+               num_wrong_guesses: int) -> None:
+        # moving averages, the first games count for more until there are
+        # enough to average over
+        self.games += 1
+        weight = max(1 / (self.games + PRIOR_GAMES), 2 / (RECENT_GAMES + 1))
+        wrong_rate = min(wrong_guesses / max(num_wrong_guesses, 1), 1.0)
+        self.win_rate += weight * (won - self.win_rate)
+        self.wrong_rate += weight * (wrong_rate - self.wrong_rate)
+
+    def record_game(self, game: engine.GameState) -> None:
+        # a game quit before it was over says nothing of how hard the word
+        # was and isn't recorded
+        if game.status == engine.Status.playing:
+            return
+        self.record(game.status == engine.Status.won, game.wrong_guesses,
+                    game.num_wrong_guesses)
+
+    def target(self) -> float:
+        target = 0.5 + (self.win_rate - GOAL_WIN_RATE) - \
+            WRONG_WEIGHT * (self.wrong_rate - GOAL_WRONG_RATE)
+        return min(max(target, 0.0), 1.0)
+
+
+def read_profile(path: str) -> Profile:
+    # the profile of the player whose games are in the history log, the
+    # games they won or lost
+    profile = Profile()
+    for record in history.iter_records(path):
+        if record.outcome == history.QUIT:
+            continue
+        profile.record(record.outcome == engine.Status.won,
+                       record.wrong_guesses, record.num_wrong_guesses)
+    return profile
+
+
+class ProfileCache:
+    """
+    Profiles by player name, at most max_size of them.  get() makes a new
+    profile for a player not seen, or not seen for ttl seconds.
+    """
+    def __init__(self,
+                 max_size: int = DEFAULT_CACHE_SIZE,
+                 ttl: float = DEFAULT_TTL,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self._profiles: "collections.OrderedDict[str, Profile]" = \
+            collections.OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+    def __contains__(self, name: str) -> bool:
+        profile = self._profiles.get(name)
+        return profile is not None and \
+            self.clock() - profile.last_used <= self.ttl
+
+    def get(self, name: str) -> Profile:
+        now = self.clock()
+        profile = self._profiles.get(name)
+        if profile is None or now - profile.last_used > self.ttl:
+            profile = Profile()
+            self.put(name, profile)
+        else:
+            self._profiles.move_to_end(name)
+        profile.last_used = now
+        return profile
+
+    def put(self, name: str, profile: Profile) -> None:
+        now = self.clock()
+        profile.last_used = now
+        self._profiles[name] = profile
+        self._profiles.move_to_end(name)
+        # least recently used first, the expired ones are all at the front
+        profiles = self._profiles
+        while profiles and (
+                len(profiles) > self.max_size or
+                now - next(iter(profiles.values())).last_used > self.ttl):
+            profiles.popitem(last=False)
+
+
+class Recommender:
+    """
+    Draws words for players from words[id] for the given ids, ranked by
+    their scores.  draw() picks for a player by name from the profiles,
+    record() updates their profile from a finished game, pick() draws for
+    a profile kept elsewhere.
+    """
+    def __init__(self,
+                 words: Sequence[str],
+                 ids: Iterable[int],
+                 scores: difficulty.Scores,
+                 rng: Optional[random.Random] = None,
+                 profiles: Optional[ProfileCache] = None,
+                 spread: float = SPREAD,
+                 min_choices: int = MIN_CHOICES) -> None:
+        self.words = words
+        ids = list(ids)
+        values = [scores.score(i) for i in ids]
+        ranked = sorted(range(len(ids)), key=values.__getitem__)
+        self.ids = array.array("I", (ids[x] for x in ranked))
+        self.scores = array.array("d", (values[x] for x in ranked))
+        self.rng = random.Random() if rng is None else rng
+        self.profiles = ProfileCache() if profiles is None else profiles
+        self.spread = spread
+        self.min_choices = min_choices
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def window(self, target: float) -> Tuple[int, int]:
+        # the ranks to draw from for a target rank between 0 and 1
+        count = len(self.ids)
+        center = min(int(target * count), count - 1)
+        score = self.scores[center]
+        lo = bisect.bisect_left(self.scores, score - self.spread)
+        hi = bisect.bisect_right(self.scores, score + self.spread)
+        if hi - lo < self.min_choices:
+            lo = max(min(center - self.min_choices // 2,
+                         count - self.min_choices), 0)
+            hi = min(lo + self.min_choices, count)
+        return lo, hi
+
+    def pick(self, profile: Profile) -> str:
+        # a word for the player with this profile
+        if not self.ids:
+            raise IndexError("cannot draw from an empty word list")
+        lo, hi = self.window(profile.target())
+        return self.words[self.ids[self.rng.randrange(lo, hi)]]
+
+    def draw(self, name: str) -> str:
+        return self.pick(self.profiles.get(name))
+
+    def record(self, name: str, game: engine.GameState) -> None:
+        self.profiles.get(name).record_game(game)
+
+
+def open_recommender(min_length: int,
+                     max_length: int,
+                     tier: Optional[str] = None,
+                     wordlist: Optional[str] = None,
+                     rng: Optional[random.Random] = None) -> Recommender:
+    # the words open_words() would give, ranked for drawing
+    from wordguess import wordguess
+    words = wordguess.open_word_index(wordlist)
+    scores = difficulty.open_word_scores(
+        words, wordguess.word_index_path(wordlist),
+        wordguess.open_alphabet(wordlist))
+    tiers = difficulty.TIERS if tier is None else [tier]
+    ids = [scores.order[i]
+           for start, stop in scores.ranges(min_length, max_length, tiers)
+           for i in range(start, stop)]
+    recommender = Recommender(words, ids, scores, rng)
+    scores.close()
+    return recommender
@@ -0,0 +1,89 @@
+# Terminal board drawn in place with ANSI escape sequences.
+#
+# The first frame clears the screen and draws the whole board, later frames
+# move the cursor to the cells that changed since the last frame and
+# rewrite only those.  Each frame is one write to the stream.
+#
+#   row 1  title
+#   row 3  letters not guessed yet, "A B C ..."
+#   row 5  the word, "_ E _ _ E _"
+#   row 7  "Wrong Guesses 1 out of 6"
+#   row 9  messages and the input prompt, cleared every frame
+from typing import List
+from typing import Optional
+from typing import TextIO
+
+from wordguess import wordguess
+
+CLEAR_SCREEN = "\033[H\033[2J"
+CLEAR_LINE = "\033[K"
+CLEAR_BELOW = "\033[J"
+
+TITLE_ROW = 1
+LETTERS_ROW = 3
+WORD_ROW = 5
+COUNTER_ROW = 7
+MESSAGE_ROW = 9
+
+
+def move(row: int, column: int) -> str:
+    # rows and columns start at 1
+    return f"\033[{row};{column}H"
+
+
+def diff_row(row: int, old: List[str], new: List[str]) -> List[str]:
+    # escape sequences that turn the old cells into the new ones, the
+    # cells are printed one space apart like print(*cells)
+    parts = []
+    for i, (x, y) in enumerate(zip(old, new)):
+        if x != y:
+            parts.append(move(row, 2 * i + 1))
+            parts.append(y)
+    return parts
+
+
+class Renderer:
+    """
+    Draws the board like wordguess.display() without clearing the screen.
+    Called with the same arguments as display(), so play() can use either.
+    """
+    def __init__(self, stream: TextIO) -> None:
+        self.stream = stream
+        self.letters: Optional[List[str]] = None
+        self.blank_word: List[str] = []
+        self.counter = ""
+
+    def reset(self) -> None:
+        # draw the whole board on the next frame
+        self.letters = None
+
+    def __call__(self,
+                 letters: List[str],
+                 blank_word: List[str],
+                 guess_num: int,
+                 num_wrong_guesses: int,
+                 color: bool) -> None:
+        counter = f"Wrong Guesses {guess_num} out of {num_wrong_guesses}"
+        if self.letters is None or len(blank_word) != len(self.blank_word):
+            if color:
+                title = f"{wordguess.Color.white}Word Guess" \
+                        f"{wordguess.Color.reset}"
+            else:
+                title = "Word Guess"
+            parts = [CLEAR_SCREEN,
+                     move(TITLE_ROW, 1), title,
+                     move(LETTERS_ROW, 1), " ".join(letters),
+                     move(WORD_ROW, 1), " ".join(blank_word),
+                     move(COUNTER_ROW, 1), counter]
+        else:
+            parts = diff_row(LETTERS_ROW, self.letters, letters)
+            parts += diff_row(WORD_ROW, self.blank_word, blank_word)
+            if counter != self.counter:
+                parts += [move(COUNTER_ROW, 1), counter, CLEAR_LINE]
+        # the last frame's messages and prompt go, input starts below
+        parts += [move(MESSAGE_ROW, 1), CLEAR_BELOW]
+        self.stream.write("".join(parts))
+        self.stream.flush()
+        self.letters = list(letters)
+        self.blank_word = list(blank_word)
+        self.counter = counter
@@ -0,0 +1,143 @@
+# Replays recorded games against the game engine.
+#
+# Every game in a history log is played again from its word and guesses
+# through engine.GameState, the logic behind play(), with no screen, no
+# input and no pauses.  A game whose guesses are not all accepted, or that
+# ends with a different outcome or number of wrong guesses than recorded,
+# is a mismatch.  The games per second make a performance check too.
+#
+# The log is read in blocks of whole records that are replayed in worker
+# processes, only a few blocks are in flight at a time so a log of any
+# size is replayed in constant memory.
+import argparse
+import concurrent.futures
+import time
+
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+
+from wordguess import engine
+from wordguess import history
+from wordguess import wordguess
+
+BLOCK_SIZE = 1 << 20
+BLOCKS_PER_WORKER = 2
+MAX_EXAMPLES = 10
+
+REJECTED = (engine.Result.invalid, engine.Result.already_guessed)
+
+
+class Totals(NamedTuple):
+    games: int = 0
+    guesses: int = 0
+    mismatches: int = 0
+    # descriptions of the first few mismatches
+    examples: Tuple[str, ...] = ()
+
+
+def combine(results: Iterable[Totals]) -> Totals:
+    games = guesses = mismatches = 0
+    examples: List[str] = []
+    for x in results:
+        games += x.games
+        guesses += x.guesses
+        mismatches += x.mismatches
+        examples.extend(x.examples[:MAX_EXAMPLES - len(examples)])
+    return Totals(games, guesses, mismatches, tuple(examples))
+
+
+def check(record: history.GameRecord,
+          alphabet: engine.Alphabet = engine.ENGLISH) -> Optional[str]:
+    # replay one game, None if it played out as recorded
+    game = engine.GameState(record.word, record.num_wrong_guesses,
+                            alphabet=alphabet)
+    guess = game.guess
+    for i, user_input in enumerate(record.guesses):
+        if game.status != engine.Status.playing:
+            return f"game over after {i} of {len(record.guesses)} guesses"
+        result = guess(user_input)
+        if result in REJECTED:
+            return f"guess {i + 1} {user_input!r} was {result}"
+    status = history.QUIT if game.status == engine.Status.playing \
+        else game.status
+    if status != record.outcome:
+        return f"{status}, recorded {record.outcome}"
+    if game.wrong_guesses != record.wrong_guesses:
+        return (f"{game.wrong_guesses} wrong guesses, recorded "
+                f"{record.wrong_guesses}")
+    return None
+
+
+def replay(records: Iterable[history.GameRecord],
+           alphabet: engine.Alphabet = engine.ENGLISH) -> Totals:
+    games = guesses = mismatches = 0
+    examples: List[str] = []
+    for record in records:
+        games += 1
+        guesses += len(record.guesses)
+        problem = check(record, alphabet)
+        if problem is not None:
+            mismatches += 1
+            if len(examples) < MAX_EXAMPLES:
+                examples.append(f"{record.word} "
+                                f"{' '.join(record.guesses)}: {problem}")
+    return Totals(games, guesses, mismatches, tuple(examples))
+
+
+def _replay_block(data: bytes,
+                  alphabet: engine.Alphabet = engine.ENGLISH) -> Totals:
+    return replay(history.iter_block_records(data), alphabet)
+
+
+def replay_blocks(blocks: Iterator[bytes],
+                  workers: int,
+                  alphabet: engine.Alphabet = engine.ENGLISH) -> Totals:
+    # replay blocks of records from history.iter_blocks() in worker
+    # processes, keeping workers * BLOCKS_PER_WORKER blocks in flight
+    if workers == 1:
+        return combine(_replay_block(x, alphabet) for x in blocks)
+    results: List[Totals] = []
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers) as executor:
+        pending = set()
+        for block in blocks:
+            if len(pending) >= workers * BLOCKS_PER_WORKER:
+                done, pending = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                results.extend(x.result() for x in done)
+            pending.add(executor.submit(_replay_block, block, alphabet))
+        results.extend(x.result() for x in pending)
+    return combine(results)
+
+
+def run(args: argparse.Namespace) -> int:
+    paths = args.logs or [history.history_path()]
+    alphabet = wordguess.open_alphabet(args.wordlist)
+    start = time.perf_counter()
+    totals = Totals()
+    try:
+        for path in paths:
+            totals = combine([totals, replay_blocks(
+                history.iter_blocks(path, BLOCK_SIZE), args.workers,
+                alphabet)])
+    except ValueError as e:
+        print(f"Error {e}")
+        return 1
+    elapsed = time.perf_counter() - start
+    rate = totals.games / elapsed if elapsed else 0.0
+    print(f"Replayed {totals.games} games, {totals.guesses} guesses "
+          f"in {elapsed:.2f}s")
+    print(f"{rate:.0f} games per second")
+    if totals.mismatches:
+        print(f"{totals.mismatches} games did not play out as recorded")
+        for example in totals.examples:
+            print(f"  {example}")
+        return 1
+    if args.min_rate is not None and totals.games and rate < args.min_rate:
+        print(f"Slower than {args.min_rate:.0f} games per second")
+        return 1
+    return 0
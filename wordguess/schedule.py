@@ -0,0 +1,107 @@
+# Picks the word for each game.
+#
+# A ShuffleBag hands out the words of a list in a shuffled order and only
+# starts a new order once every word has been drawn, so a long session
+# never sees a repeat before the list is used up.  The order comes from a
+# keyed permutation of the word ids that is computed one id at a time, so
+# nothing the size of the list is built: drawing from a memory mapped
+# CompactWordList decodes just the drawn word.
+#
+# The permutation is a small Feistel network over the smallest even
+# number of bits that covers the ids, ids that land outside the list are
+# put through it again (cycle walking) until they land inside.  It is not
+# a uniform pick from every possible order, but a fresh key per round
+# makes each order different and a seed makes them reproducible.
+import random
+
+from typing import Iterator
+from typing import Optional
+from typing import Sequence
+
+ROUNDS = 4
+MULTIPLIER = 0x45D9F3B
+WORD_MASK = 0xFFFFFFFF
+
+
+class Permutation:
+    """
+    A permutation of range(size) chosen by key, permutation[i] is the id
+    at position i.  Constant memory, a lookup costs a few integer
+    operations.
+    """
+    __slots__ = ("size", "half_bits", "half_mask", "keys")
+
+    def __init__(self, size: int, key: int) -> None:
+        self.size = size
+        bits = max((size - 1).bit_length(), 2)
+        self.half_bits = (bits + 1) // 2
+        self.half_mask = (1 << self.half_bits) - 1
+        self.keys = [(key >> (32 * i)) & WORD_MASK for i in range(ROUNDS)]
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _encrypt(self, x: int) -> int:
+        half_bits = self.half_bits
+        mask = self.half_mask
+        left = x >> half_bits
+        right = x & mask
+        for key in self.keys:
+            h = ((right ^ key) * MULTIPLIER) & WORD_MASK
+            h ^= h >> 16
+            left, right = right, left ^ (h & mask)
+        return left << half_bits | right
+
+    def __getitem__(self, i: int) -> int:
+        if not 0 <= i < self.size:
+            raise IndexError("permutation index out of range")
+        x = self._encrypt(i)
+        while x >= self.size:
+            x = self._encrypt(x)
+        return x
+
+    def __iter__(self) -> Iterator[int]:
+        for i in range(self.size):
+            yield self[i]
+
+
+class ShuffleBag:
+    """
+    Draws words from a list in shuffled rounds, every word once per round.
+    The rounds come from rng, pass random.Random(seed) for a repeatable
+    session.
+    """
+    def __init__(self,
+                 words: Sequence[str],
+                 rng: Optional[random.Random] = None) -> None:
+        self.words = words
+        self.rng = random.Random() if rng is None else rng
+        self.rounds = 0
+        self.position = 0
+        self.order = Permutation(0, 0)
+
+    def _new_round(self) -> None:
+        if not self.words:
+            raise IndexError("cannot draw from an empty word list")
+        self.order = Permutation(len(self.words),
+                                 self.rng.getrandbits(32 * ROUNDS))
+        self.position = 0
+        self.rounds += 1
+
+    def draw(self) -> str:
+        if self.position >= len(self.order):
+            self._new_round()
+        word = self.words[self.order[self.position]]
+        self.position += 1
+        return word
+
+    def __iter__(self) -> Iterator[str]:
+        # the rest of the current round, a full round on a new bag
+        if self.position >= len(self.order):
+            self._new_round()
+        while self.position < len(self.order):
+            yield self.draw()
+
+    def remaining(self) -> int:
+        # words left before the next round starts
+        return len(self.order) - self.position
@@ -0,0 +1,272 @@
+# Game server, many independent games on one asyncio event loop.
+#
+# The protocol is line based.  The client sends a letter, a whole word or
+# "quit", the server answers every line with one JSON object:
+#
+#   {"result": "hit", "board": "_E__E_", "wrong_guesses": 0,
+#    "num_wrong_guesses": 6, "status": "playing"}
+#
+# A game that is over also has "word", then the next game starts right
+# away with a {"result": "new game", ...} message.
+#
+# With --match PLAYERS connections are put into matches of that many
+# players as they arrive (see matches.py).  A player gets
+# {"result": "waiting", ...} until the match is full, then races the
+# others through the same --rounds words, the messages also have
+# "rounds_played" and "rounds".  A player who is finished, has quit or is
+# out of --time_limit gets {"result": "match over", "rankings": [...]}
+# once every player of the match is finished or the time is up, and the
+# connection is closed.
+import argparse
+import asyncio
+import json
+import random
+import sys
+
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from wordguess import engine
+from wordguess import matches
+from wordguess import schedule
+from wordguess import wordguess
+
+MAX_LINE = 1024
+
+
+def raise_open_file_limit() -> None:
+    # every session is a socket, let the process use as many as it may
+    if sys.platform == "win32":
+        return
+    import resource
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft != hard:
+        try:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+        except (ValueError, OSError):
+            pass
+
+
+def message(result: str, game: engine.GameState) -> Dict[str, Any]:
+    msg: Dict[str, Any] = {
+        "result": result,
+        "board": game.masked_word,
+        "wrong_guesses": game.wrong_guesses,
+        "num_wrong_guesses": game.num_wrong_guesses,
+        "status": game.status,
+    }
+    if game.status != engine.Status.playing:
+        msg["word"] = game.word
+    return msg
+
+
+def match_message(result: str,
+                  game: engine.GameState,
+                  match: matches.Match,
+                  player: matches.Player) -> Dict[str, Any]:
+    msg = message(result, game)
+    msg["rounds_played"] = player.round
+    msg["rounds"] = len(match.words)
+    return msg
+
+
+class GameServer:
+    """
+    Serves games over TCP.  Every connection gets its own GameState and
+    its own ShuffleBag, the word list is loaded once and shared by all of
+    them.  The pause after a
+    message (the game's SLEEP_TIME) is an asyncio.sleep so a waiting
+    session never holds up the others.
+    With match_size, connections play matches of that many players on
+    rounds words drawn from one ShuffleBag instead.
+    """
+    def __init__(self,
+                 words: Sequence[str],
+                 num_wrong_guesses: int,
+                 guess_word: bool = True,
+                 delay: float = 0,
+                 seed: Optional[int] = None,
+                 alphabet: engine.Alphabet = engine.ENGLISH,
+                 match_size: int = 0,
+                 rounds: int = 1,
+                 time_limit: Optional[float] = None) -> None:
+        self.words = words
+        self.alphabet = alphabet
+        self.num_wrong_guesses = num_wrong_guesses
+        self.guess_word = guess_word
+        self.delay = delay
+        self.rng = random.Random(seed)
+        self.sessions = 0
+        self.games = 0
+        self.rounds = rounds
+        self.time_limit = time_limit
+        self.players = 0
+        self.lobby: Optional[matches.Lobby] = None
+        # set when a match starts and when it is over, until it is over
+        self._events: Dict[matches.Match,
+                           Tuple[asyncio.Event, asyncio.Event]] = {}
+        if match_size:
+            self.lobby = matches.Lobby(match_size, self.new_match)
+            self._match_words = schedule.ShuffleBag(
+                words, random.Random(self.rng.getrandbits(64)))
+
+    def new_game(self, words: schedule.ShuffleBag) -> engine.GameState:
+        self.games += 1
+        return engine.GameState(words.draw(), self.num_wrong_guesses,
+                                self.guess_word, self.alphabet)
+
+    def new_match(self) -> matches.Match:
+        return matches.Match([self._match_words.draw()
+                              for _ in range(self.rounds)],
+                             self.num_wrong_guesses, self.guess_word,
+                             self.alphabet, self.time_limit)
+
+    async def send(self,
+                   writer: asyncio.StreamWriter,
+                   msg: Dict[str, Any]) -> None:
+        writer.write(json.dumps(msg).encode() + b"\n")
+        await writer.drain()
+
+    async def handle(self,
+                     reader: asyncio.StreamReader,
+                     writer: asyncio.StreamWriter) -> None:
+        self.sessions += 1
+        words = schedule.ShuffleBag(self.words,
+                                    random.Random(self.rng.getrandbits(64)))
+        try:
+            game = self.new_game(words)
+            await self.send(writer, message("new game", game))
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                # case is left to the game's alphabet
+                user_input = line.decode("utf-8", "replace").strip()
+                if user_input.upper() == "QUIT":
+                    break
+                result = game.guess(user_input)
+                # pause where play() would, everything but a found letter
+                if self.delay and (result != engine.Result.hit or
+                                   game.status != engine.Status.playing):
+                    await asyncio.sleep(self.delay)
+                await self.send(writer, message(result, game))
+                if game.status != engine.Status.playing:
+                    game = self.new_game(words)
+                    await self.send(writer, message("new game", game))
+        except (ConnectionError, ValueError):
+            pass  # client went away or sent a line longer than MAX_LINE
+        finally:
+            self.sessions -= 1
+            writer.close()
+
+    async def handle_match(self,
+                           reader: asyncio.StreamReader,
+                           writer: asyncio.StreamWriter) -> None:
+        assert self.lobby is not None
+        self.sessions += 1
+        self.players += 1
+        match, player = self.lobby.join(f"player{self.players}")
+        started, over = self._events.setdefault(
+            match, (asyncio.Event(), asyncio.Event()))
+        try:
+            if match.started is None:
+                # a player who leaves now still has their place
+                await self.send(writer, {
+                    "result": "waiting", "player": player.name,
+                    "players": len(match.players),
+                    "match_size": self.lobby.size,
+                })
+                await started.wait()
+            else:
+                started.set()
+            assert player.game is not None
+            self.games += 1
+            await self.send(writer, match_message("new game", player.game,
+                                                  match, player))
+            while player.finished is None:
+                try:
+                    line = await asyncio.wait_for(reader.readline(),
+                                                  match.remaining())
+                except asyncio.TimeoutError:
+                    match.finish(player)
+                    await self.send(writer, match_message(
+                        matches.TIME_UP, player.game, match, player))
+                    break
+                if not line:
+                    break
+                user_input = line.decode("utf-8", "replace").strip()
+                if user_input.upper() == "QUIT":
+                    break
+                result, game = match.guess(player, user_input)
+                if self.delay and (result != engine.Result.hit or
+                                   game.status != engine.Status.playing):
+                    await asyncio.sleep(self.delay)
+                await self.send(writer,
+                                match_message(result, game, match, player))
+                if player.finished is None and game is not player.game:
+                    self.games += 1
+                    await self.send(writer, match_message(
+                        "new game", player.game, match, player))
+            match.finish(player)
+            if match.over:
+                over.set()
+            try:
+                await asyncio.wait_for(over.wait(), match.remaining())
+            except asyncio.TimeoutError:
+                pass  # the others are told by their own timeouts
+            await self.send(writer, {
+                "result": "match over", "player": player.name,
+                "rankings": [x._asdict() for x in match.standings],
+            })
+        except (ConnectionError, ValueError):
+            pass  # client went away or sent a line longer than MAX_LINE
+        finally:
+            match.finish(player)
+            if match.over:
+                over.set()
+                self._events.pop(match, None)
+            self.sessions -= 1
+            writer.close()
+
+    async def start(self, host: str, port: int) -> asyncio.AbstractServer:
+        handle = self.handle if self.lobby is None else self.handle_match
+        return await asyncio.start_server(handle, host, port,
+                                          limit=MAX_LINE, backlog=4096)
+
+
+def new_server(args: argparse.Namespace, words: Sequence[str]) -> GameServer:
+    # the server the command line asks for, --seed makes its sessions and
+    # matches repeatable
+    return GameServer(words, args.num_wrong_guesses, args.guess_word,
+                      args.delay, seed=args.seed,
+                      alphabet=wordguess.open_alphabet(args.wordlist),
+                      match_size=args.match, rounds=args.rounds,
+                      time_limit=args.time_limit or None)
+
+
+async def serve(args: argparse.Namespace, words: Sequence[str]) -> None:
+    game_server = new_server(args, words)
+    server = await game_server.start(args.host, args.port)
+    for sock in server.sockets:
+        print(f"Serving word guess on {sock.getsockname()}")
+    if args.match:
+        print(f"Matches of {args.match} players, {args.rounds} words each")
+    async with server:
+        await server.serve_forever()
+
+
+def run(args: argparse.Namespace) -> int:
+    words = wordguess.open_words(args.min, args.max, args.difficulty,
+                                 args.wordlist)
+    if not words:
+        print(wordguess.no_words_error(args))
+        return 1
+    raise_open_file_limit()
+    try:
+        asyncio.run(serve(args, words))
+    except KeyboardInterrupt:
+        pass
+    return 0
@@ -0,0 +1,248 @@
+# Self-play simulator used to tune the game options.
+import argparse
+import concurrent.futures
+import math
+import random
+import time
+
+from collections import Counter
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Sequence
+from typing import Type
+
+from wordguess import engine
+from wordguess import solver
+from wordguess import wordguess
+
+
+class Strategy:
+    # picks the next letter to guess, start() is called for each new game
+    def __init__(self,
+                 words: Sequence[str],
+                 alphabet: engine.Alphabet = engine.ENGLISH) -> None:
+        self.alphabet = alphabet
+
+    def start(self, game: engine.GameState) -> None:
+        pass
+
+    def next_letter(self,
+                    game: engine.GameState,
+                    rng: random.Random) -> str:
+        raise NotImplementedError
+
+
+class FrequencyStrategy(Strategy):
+    # letters in order of how many words of the list contain them
+    def __init__(self,
+                 words: Sequence[str],
+                 alphabet: engine.Alphabet = engine.ENGLISH) -> None:
+        super().__init__(words, alphabet)
+        counts: Counter = Counter()
+        for word in words:
+            counts.update(set(word))
+        self.order = sorted(alphabet.letters, key=lambda x: -counts[x])
+
+    def next_letter(self,
+                    game: engine.GameState,
+                    rng: random.Random) -> str:
+        bits = self.alphabet.bits
+        for letter in self.order:
+            if not game.guessed & bits[letter]:
+                return letter
+        raise ValueError("no letters left to guess")
+
+
+class RandomStrategy(Strategy):
+    # any letter not guessed yet
+    def next_letter(self,
+                    game: engine.GameState,
+                    rng: random.Random) -> str:
+        bits = self.alphabet.bits
+        letters = [x for x in self.alphabet.letters
+                   if not game.guessed & bits[x]]
+        return rng.choice(letters)
+
+
+class EntropyStrategy(Strategy):
+    """
+    Keeps the words that still fit the board and guesses the letter that
+    splits them into the most even groups of revealed positions.
+    """
+    def __init__(self,
+                 words: Sequence[str],
+                 alphabet: engine.Alphabet = engine.ENGLISH) -> None:
+        super().__init__(words, alphabet)
+        self.by_length: Dict[int, List[str]] = {}
+        for word in words:
+            self.by_length.setdefault(len(word), []).append(word)
+        self.candidates: List[str] = []
+
+    def start(self, game: engine.GameState) -> None:
+        self.candidates = self.by_length.get(len(game.word), [game.word])
+
+    def next_letter(self,
+                    game: engine.GameState,
+                    rng: random.Random) -> str:
+        guessed = game.guessed
+        board = game.blank_word
+        bits = self.alphabet.bits
+        self.candidates = [
+            w for w in self.candidates
+            if all(b == x if b != "_"
+                   else not guessed & bits.get(x, 0)
+                   for b, x in zip(board, w))
+        ]
+        best_letter = ""
+        best_score = (-1.0, 0)
+        total = len(self.candidates)
+        for letter in self.alphabet.letters:
+            if guessed & bits[letter]:
+                continue
+            groups: Counter = Counter(
+                tuple(i for i, x in enumerate(w) if x == letter)
+                for w in self.candidates)
+            entropy = -sum(n / total * math.log2(n / total)
+                           for n in groups.values())
+            # ties, like a single word left, go to the letter most likely
+            # to be in the word
+            score = (entropy, total - groups[()])
+            if score > best_score:
+                best_letter = letter
+                best_score = score
+        return best_letter
+
+
+class SolverStrategy(Strategy):
+    # the letter in the most candidate words, see solver.Solver
+    def __init__(self,
+                 words: Sequence[str],
+                 alphabet: engine.Alphabet = engine.ENGLISH,
+                 backend: Optional[str] = None) -> None:
+        super().__init__(words, alphabet)
+        self.solver = solver.Solver(words, backend=backend, alphabet=alphabet)
+        self.candidates = self.solver.start(0)
+
+    def start(self, game: engine.GameState) -> None:
+        self.candidates = self.solver.start(len(game.word))
+
+    def next_letter(self,
+                    game: engine.GameState,
+                    rng: random.Random) -> str:
+        self.candidates = self.solver.narrow(self.candidates,
+                                             game.blank_word, game.missed)
+        return self.solver.best_letter(self.candidates)
+
+
+STRATEGIES: Dict[str, Type[Strategy]] = {
+    "frequency": FrequencyStrategy,
+    "random": RandomStrategy,
+    "entropy": EntropyStrategy,
+    "solver": SolverStrategy,
+}
+
+
+class Totals(NamedTuple):
+    games: int = 0
+    wins: int = 0
+    wrong_guesses: int = 0
+    guesses: int = 0
+
+
+def combine(results: Iterable[Totals]) -> Totals:
+    return Totals(*(sum(x) for x in zip(*results)))
+
+
+def play_games(words: Sequence[str],
+               strategy: Strategy,
+               num_wrong_guesses: int,
+               count: int,
+               seed: Optional[int]) -> Totals:
+    # play count games on random words from the list
+    rng = random.Random(seed)
+    wins = wrong_guesses = guesses = 0
+    for _ in range(count):
+        game = engine.GameState(rng.choice(words), num_wrong_guesses,
+                                alphabet=strategy.alphabet)
+        strategy.start(game)
+        while game.status == engine.Status.playing:
+            game.guess_letter(strategy.next_letter(game, rng))
+            guesses += 1
+        wins += game.status == engine.Status.won
+        wrong_guesses += game.wrong_guesses
+    return Totals(count, wins, wrong_guesses, guesses)
+
+
+# set in each worker process by _init_worker
+_worker_words: List[str] = []
+_worker_strategy = Strategy([])
+
+
+def _init_worker(words: List[str],
+                 strategy: str,
+                 wordlist: Optional[str] = None,
+                 backend: Optional[str] = None) -> None:
+    global _worker_words, _worker_strategy
+    _worker_words = words
+    alphabet = wordguess.open_alphabet(wordlist)
+    if strategy == "solver":
+        _worker_strategy = SolverStrategy(words, alphabet, backend)
+    else:
+        _worker_strategy = STRATEGIES[strategy](words, alphabet)
+
+
+def _play_chunk(num_wrong_guesses: int, count: int, seed: int) -> Totals:
+    return play_games(_worker_words, _worker_strategy,
+                      num_wrong_guesses, count, seed)
+
+
+def simulate(args: argparse.Namespace,
+             words: Optional[List[str]] = None) -> Totals:
+    # split the games into chunks and spread them over worker processes,
+    # the words are loaded once here, not scored again by every worker
+    if words is None:
+        words = wordguess.load_words(args.min, args.max, args.difficulty,
+                                     args.wordlist)
+    rng = random.Random(args.seed)
+    counts = [args.chunk_size] * (args.games // args.chunk_size)
+    if args.games % args.chunk_size:
+        counts.append(args.games % args.chunk_size)
+    seeds = [rng.getrandbits(64) for _ in counts]
+    if args.workers == 1:
+        _init_worker(words, args.strategy, args.wordlist,
+                     args.solver_backend)
+        results = map(_play_chunk, [args.num_wrong_guesses] * len(counts),
+                      counts, seeds)
+        return combine(results)
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers=args.workers,
+            initializer=_init_worker,
+            initargs=(words, args.strategy, args.wordlist,
+                      args.solver_backend)) as executor:
+        results = executor.map(_play_chunk,
+                               [args.num_wrong_guesses] * len(counts),
+                               counts, seeds)
+        return combine(results)
+
+
+def run(args: argparse.Namespace) -> int:
+    words = wordguess.load_words(args.min, args.max, args.difficulty,
+                                 args.wordlist)
+    if not words:
+        print(wordguess.no_words_error(args))
+        return 1
+    start = time.perf_counter()
+    totals = simulate(args, words)
+    elapsed = time.perf_counter() - start
+    difficulty = f", {args.difficulty} words" if args.difficulty else ""
+    print(f"Strategy {args.strategy}: {totals.games} games, "
+          f"{args.num_wrong_guesses} wrong guesses allowed, "
+          f"word length {args.min} to {args.max}{difficulty}")
+    print(f"Win rate {totals.wins / totals.games:.1%}")
+    print(f"Average wrong guesses "
+          f"{totals.wrong_guesses / totals.games:.2f}")
+    print(f"{totals.games / elapsed:.0f} games per second")
+    return 0
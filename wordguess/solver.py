@@ -0,0 +1,344 @@
+# Suggests the next letter to guess from the words that fit the board.
+#
+# Candidates are kept per word length in one of two tables:
+#
+# BitTable     pure Python, for every (position, letter) an int used as a
+#              bit set of word ids, narrowing is a few big int ANDs and
+#              counting a letter is an AND and a popcount.
+# ArrayTable   NumPy, the words packed into a 2-D uint8 array with a length
+#              column and a letter mask column, narrowing and counting are
+#              vectorized over the array of candidate ids.
+#
+# BitTable is the default, it builds slower but answers a first guess on a
+# large length faster (see benchmarks/bench_solver.py).  NumPy is optional,
+# asking for the numpy backend without it, or for an alphabet with more
+# letters than fit a mask column, falls back to BitTable.
+import collections
+
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from wordguess import engine
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+DEFAULT_CACHE_SIZE = 4096
+BACKENDS = ("python", "numpy")
+# letters of an alphabet that fit the uint64 mask column of PackedWords
+MAX_ARRAY_LETTERS = 63
+
+Board = Tuple[str, str]
+
+if hasattr(int, "bit_count"):
+    def popcount(bits: int) -> int:
+        return bits.bit_count()
+else:  # pragma: no cover (python < 3.10)
+    def popcount(bits: int) -> int:
+        return bin(bits).count("1")
+
+
+class Candidates(NamedTuple):
+    # the words that fit a board, ids is a bit set (python backend) or an
+    # array (numpy backend) of word ids for that length
+    pattern: str
+    wrong: str
+    ids: Any
+
+
+class BitTable:
+    # word id bit sets for all the words of one length
+    __slots__ = ("words", "all_ids", "positions", "contains")
+
+    def __init__(self,
+                 words: List[str],
+                 length: int,
+                 letters: str = engine.ALPHABET) -> None:
+        self.words = words
+        self.all_ids = (1 << len(words)) - 1
+        size = (len(words) + 7) // 8
+        maps = [{x: bytearray(size) for x in letters}
+                for _ in range(length)]
+        for i, word in enumerate(words):
+            byte = i >> 3
+            bit = 1 << (i & 7)
+            for position, letter in enumerate(word):
+                bitmap = maps[position].get(letter)
+                if bitmap is not None:
+                    bitmap[byte] |= bit
+        self.positions = [
+            {x: int.from_bytes(bitmap, "little") for x, bitmap in m.items()}
+            for m in maps
+        ]
+        self.contains = {}
+        for letter in letters:
+            bits = 0
+            for position in self.positions:
+                bits |= position[letter]
+            self.contains[letter] = bits
+
+    def count(self, ids: int) -> int:
+        return popcount(ids)
+
+    def exclude(self, ids: int, letter: str) -> int:
+        return ids & ~self.contains.get(letter, 0)
+
+    def reveal(self, ids: int, letter: str, pattern: str) -> int:
+        # the letter is at exactly the positions it shows in the pattern
+        for position, x in enumerate(pattern):
+            if x == letter:
+                ids &= self.positions[position].get(letter, 0)
+            elif x == "_":
+                ids &= ~self.positions[position].get(letter, 0)
+        return ids
+
+    def letter_counts(self, ids: int, letters: str) -> Dict[str, int]:
+        return {x: popcount(ids & self.contains[x]) for x in letters}
+
+    def position_counts(self, ids: int) -> List[Dict[str, int]]:
+        return [{x: popcount(ids & bits) for x, bits in position.items()}
+                for position in self.positions]
+
+    def select(self, ids: int) -> List[str]:
+        result = []
+        while ids:
+            low = ids & -ids
+            result.append(self.words[low.bit_length() - 1])
+            ids ^= low
+        return result
+
+
+class PackedWords:
+    """
+    Every word of a list in a 2-D uint8 array, one row per word padded
+    with zeros to the longest word (DEFAULT_MAX_LENGTH for the game's
+    lists), with a column of lengths and a column of letter bit masks.
+    A letter is stored as its index in the alphabet plus one, any other
+    character can never match a guess and is stored as len(alphabet) + 1.
+    """
+    __slots__ = ("words", "alphabet", "letters", "lengths", "masks")
+
+    def __init__(self,
+                 words: Sequence[str],
+                 alphabet: engine.Alphabet = engine.ENGLISH) -> None:
+        if len(alphabet) > MAX_ARRAY_LETTERS:
+            raise ValueError(f"more than {MAX_ARRAY_LETTERS} letters")
+        self.words = words
+        self.alphabet = alphabet
+        size = len(alphabet)
+        width = max((len(w) for w in words), default=1)
+        # characters that could be taken for a letter code are moved out
+        # of the way, translate() does not apply its own output again
+        codes = {x: size + 1 for x in range(1, size + 1)}
+        codes.update((ord(x), i + 1) for i, x in enumerate(alphabet.letters))
+        data = "".join(w.ljust(width, "\0") for w in words).translate(codes)
+        self.letters = numpy.frombuffer(
+            data.encode("utf-32-le"), dtype=numpy.uint32,
+        ).clip(0, size + 1).astype(numpy.uint8).reshape(len(words), width)
+        self.lengths = numpy.fromiter((len(w) for w in words),
+                                      dtype=numpy.uint8, count=len(words))
+        shifts = self.letters.astype(numpy.uint64)
+        is_letter = (shifts >= 1) & (shifts <= size)
+        bits = numpy.where(is_letter,
+                           numpy.left_shift(numpy.uint64(1),
+                                            shifts - numpy.uint64(1)),
+                           numpy.uint64(0))
+        self.masks = numpy.bitwise_or.reduce(bits, axis=1).astype(
+            numpy.uint64)
+
+
+class ArrayTable:
+    """
+    Candidate ids for one length.  The rows of that length are copied out
+    of PackedWords once, with each letter position stored as its own
+    contiguous column, and ids index into those rows.
+    """
+    __slots__ = ("packed", "rows", "columns", "masks", "all_ids")
+
+    def __init__(self, packed: PackedWords, length: int) -> None:
+        self.packed = packed
+        self.rows = numpy.flatnonzero(packed.lengths == length)
+        letters = packed.letters[self.rows]
+        self.columns = [numpy.ascontiguousarray(letters[:, i])
+                        if i < letters.shape[1]
+                        else numpy.zeros(len(self.rows), dtype=numpy.uint8)
+                        for i in range(length)]
+        self.masks = packed.masks[self.rows]
+        self.all_ids = numpy.arange(len(self.rows))
+
+    def _gather(self, array: Any, ids: Any) -> Any:
+        # skip the copy while every word of the length is a candidate,
+        # take() is much faster than fancy indexing
+        return array if len(ids) == len(array) else array.take(ids)
+
+    def count(self, ids: Any) -> int:
+        return len(ids)
+
+    def exclude(self, ids: Any, letter: str) -> Any:
+        bit = self.packed.alphabet.bits.get(letter, 0)
+        # compress() is much faster than indexing with a boolean array
+        return ids.compress((self._gather(self.masks, ids) & bit) == 0)
+
+    def reveal(self, ids: Any, letter: str, pattern: str) -> Any:
+        # the letter is at exactly the positions it shows in the pattern
+        alphabet = self.packed.alphabet
+        bit = alphabet.bits.get(letter, 0)
+        ids = ids.compress((self._gather(self.masks, ids) & bit) != 0)
+        code = alphabet.index[letter] + 1 if bit else 0
+        keep = numpy.ones(len(ids), dtype=bool)
+        for position, x in enumerate(pattern):
+            if x == letter:
+                keep &= self._gather(self.columns[position], ids) == code
+            elif x == "_":
+                keep &= self._gather(self.columns[position], ids) != code
+        return ids.compress(keep)
+
+    def letter_counts(self, ids: Any, letters: str) -> Dict[str, int]:
+        masks = self._gather(self.masks, ids)
+        bits = self.packed.alphabet.bits
+        return {x: int(numpy.count_nonzero(masks & bits[x]))
+                for x in letters}
+
+    def position_counts(self, ids: Any) -> List[Dict[str, int]]:
+        letters = self.packed.alphabet.letters
+        result = []
+        for column in self.columns:
+            histogram = numpy.bincount(self._gather(column, ids),
+                                       minlength=len(letters) + 2)
+            result.append({x: int(histogram[i + 1])
+                           for i, x in enumerate(letters)})
+        return result
+
+    def select(self, ids: Any) -> List[str]:
+        words = self.packed.words
+        return [words[i] for i in self.rows.take(ids).tolist()]
+
+
+class Solver:
+    """
+    Picks the letter found in the most words that still fit the board.
+    start() gives the candidates for a new game and narrow() updates them
+    from the previous candidates after each guess.  Letter counts are
+    cached by (pattern, wrong letters) so boards seen before cost a dict
+    lookup.
+    """
+    def __init__(self,
+                 words: Iterable[str],
+                 cache_size: int = DEFAULT_CACHE_SIZE,
+                 backend: Optional[str] = None,
+                 alphabet: engine.Alphabet = engine.ENGLISH) -> None:
+        if backend is None or backend == "numpy" and (
+                numpy is None or len(alphabet) > MAX_ARRAY_LETTERS):
+            backend = "python"
+        if backend not in BACKENDS:
+            raise ValueError(f"unknown solver backend {backend}")
+        self.backend = backend
+        self.alphabet = alphabet
+        self.words = list(words)
+        self.cache_size = cache_size
+        self._packed: Optional[PackedWords] = None
+        self._by_length: Optional[Dict[int, List[str]]] = None
+        self._tables: Dict[int, Any] = {}
+        self._counts: "collections.OrderedDict[Board, Dict[str, int]]" = \
+            collections.OrderedDict()
+
+    def table(self, length: int) -> Any:
+        # tables are built the first time a length is played
+        table = self._tables.get(length)
+        if table is None:
+            if self.backend == "numpy":
+                if self._packed is None:
+                    self._packed = PackedWords(self.words, self.alphabet)
+                table = ArrayTable(self._packed, length)
+            else:
+                if self._by_length is None:
+                    self._by_length = {}
+                    for word in self.words:
+                        self._by_length.setdefault(len(word), []).append(word)
+                table = BitTable(self._by_length.get(length, []), length,
+                                 self.alphabet.letters)
+            self._tables[length] = table
+        return table
+
+    def start(self, length: int) -> Candidates:
+        return Candidates("_" * length, "", self.table(length).all_ids)
+
+    def narrow(self,
+               candidates: Candidates,
+               blank_word: Sequence[str],
+               wrong_letters: Iterable[str]) -> Candidates:
+        # apply only what changed on the board since the candidates were made
+        pattern = "".join(blank_word)
+        wrong = "".join(sorted(set(wrong_letters)))
+        if len(pattern) != len(candidates.pattern):
+            candidates = self.start(len(pattern))
+        table = self.table(len(pattern))
+        ids = candidates.ids
+        for letter in wrong:
+            if letter not in candidates.wrong:
+                ids = table.exclude(ids, letter)
+        new_letters = {x for x, old in zip(pattern, candidates.pattern)
+                       if x != old}
+        for letter in sorted(new_letters):
+            ids = table.reveal(ids, letter, pattern)
+        return Candidates(pattern, wrong, ids)
+
+    def candidates(self,
+                   blank_word: Sequence[str],
+                   wrong_letters: Iterable[str]) -> Candidates:
+        return self.narrow(self.start(len(blank_word)), blank_word,
+                           wrong_letters)
+
+    def count(self, candidates: Candidates) -> int:
+        return self.table(len(candidates.pattern)).count(candidates.ids)
+
+    def select(self, candidates: Candidates) -> List[str]:
+        # the candidate words, in word list order
+        return self.table(len(candidates.pattern)).select(candidates.ids)
+
+    def letter_counts(self, candidates: Candidates) -> Dict[str, int]:
+        # number of candidate words containing each letter not guessed yet
+        key = (candidates.pattern, candidates.wrong)
+        counts = self._counts.get(key)
+        if counts is not None:
+            self._counts.move_to_end(key)
+            return counts
+        letters = "".join(x for x in self.alphabet.letters
+                          if x not in candidates.wrong and
+                          x not in candidates.pattern)
+        table = self.table(len(candidates.pattern))
+        counts = table.letter_counts(candidates.ids, letters)
+        self._counts[key] = counts
+        if len(self._counts) > self.cache_size:
+            self._counts.popitem(last=False)
+        return counts
+
+    def position_counts(self, candidates: Candidates) -> List[Dict[str, int]]:
+        # for each position, how many candidates have each letter there
+        table = self.table(len(candidates.pattern))
+        return table.position_counts(candidates.ids)
+
+    def best_letter(self, candidates: Candidates) -> str:
+        counts = self.letter_counts(candidates)
+        if not counts:
+            raise ValueError("no letters left to guess")
+        if not self.count(candidates):
+            # the word is not in the list, fall back to the most common
+            # letters for words of this length
+            table = self.table(len(candidates.pattern))
+            counts = table.letter_counts(table.all_ids, "".join(counts))
+        return max(counts, key=counts.__getitem__)
+
+    def suggest(self,
+                blank_word: Sequence[str],
+                wrong_letters: Iterable[str]) -> str:
+        # best letter for a board without keeping candidates between guesses
+        return self.best_letter(self.candidates(blank_word, wrong_letters))
@@ -0,0 +1,103 @@
+# Pauses between game messages.
+#
+# A pause gives the player time to read a message before the board is
+# redrawn.  It ends early when a key is pressed, and it is skipped in fast
+# mode, when input or output is not a terminal (scripts, pipes and tests)
+# and nobody is there to read it.
+import os
+import select
+import sys
+import time
+
+from typing import Optional
+from typing import TextIO
+
+try:
+    import termios
+except ImportError:  # pragma: no cover (windows)
+    termios = None
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+POLL_INTERVAL = 0.05
+
+
+def fast_mode() -> bool:
+    # True when the session is not a person at a terminal
+    try:
+        return not (sys.stdin.isatty() and sys.stdout.isatty())
+    except (AttributeError, ValueError):
+        return True  # replaced or closed streams
+
+
+def wait_for_key(seconds: float, stdin: TextIO) -> bool:
+    """
+    Waits up to seconds for a key press on the terminal stdin.
+    Returns True if a key ended the wait, the key is discarded so it is
+    not read as the next guess.
+    """
+    if termios is not None:
+        fd = stdin.fileno()
+        old = termios.tcgetattr(fd)
+        new = termios.tcgetattr(fd)
+        # no line buffering or echo, a single key makes stdin readable
+        new[3] &= ~(termios.ICANON | termios.ECHO)
+        new[6][termios.VMIN] = 1
+        new[6][termios.VTIME] = 0
+        termios.tcsetattr(fd, termios.TCSANOW, new)
+        try:
+            ready, _, _ = select.select([fd], [], [], seconds)
+            if ready:
+                os.read(fd, 1024)
+            return bool(ready)
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, old)
+    if msvcrt is not None:  # pragma: no cover (windows)
+        end = time.monotonic() + seconds
+        while time.monotonic() < end:
+            if msvcrt.kbhit():
+                while msvcrt.kbhit():
+                    msvcrt.getwch()
+                return True
+            time.sleep(POLL_INTERVAL)
+        return False
+    time.sleep(seconds)  # pragma: no cover
+    return False
+
+
+class Pause:
+    """
+    Called after a message to wait delay seconds, or until a key is
+    pressed.  fast=None decides with fast_mode() at each pause.
+    count, skipped and total (seconds waited) are kept for the session.
+    """
+    def __init__(self,
+                 delay: float,
+                 fast: Optional[bool] = None,
+                 stdin: Optional[TextIO] = None) -> None:
+        self.delay = delay
+        self.fast = fast
+        self.stdin = stdin
+        self.count = 0
+        self.skipped = 0
+        self.total = 0.0
+
+    def __call__(self) -> None:
+        self.count += 1
+        fast = fast_mode() if self.fast is None else self.fast
+        if fast or self.delay <= 0:
+            return
+        stdin = sys.stdin if self.stdin is None else self.stdin
+        start = time.perf_counter()
+        try:
+            interactive = stdin.isatty()
+        except (AttributeError, ValueError):
+            interactive = False
+        if interactive:
+            self.skipped += wait_for_key(self.delay, stdin)
+        else:
+            time.sleep(self.delay)
+        self.total += time.perf_counter() - start
@@ -1,28 +1,65 @@
 # Word guessing game by selecting letters one at a time.
+#
+# Startup is kept short: modules only some commands need (the solver and
+# NumPy, the simulator, the server, the package metadata) are imported
+# when they are used.
 import argparse
-import importlib.resources
+import functools
+import importlib
 import os
 import random
 import sys
 import time
 
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
 from typing import List
 from typing import Optional
 from typing import Sequence
 from typing import Tuple
+from typing import Union
 
-if sys.version_info >= (3, 8):
-    import importlib.metadata as importlib_metadata
-else:
-    import importlib_metadata
+from wordguess import compact
+from wordguess import engine
+from wordguess import history
+from wordguess import index
+from wordguess import schedule
+from wordguess import timing
 
-version = importlib_metadata.version("wordguess")
+if TYPE_CHECKING:  # pragma: no cover
+    from wordguess import instrument
+    from wordguess import recommend
+    from wordguess import solver
 
 WORD_LIST_FILE = "words.txt"
 DEFAULT_NUM_WRONG_GUESSES = 6
 DEFAULT_MAX_LENGTH = 15
 DEFAULT_MIN_LENGTH = 4
 SLEEP_TIME = 3
+DEFAULT_NUM_GAMES = 1000
+DEFAULT_CHUNK_SIZE = 250
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 7070
+
+Display = Callable[[List[str], List[str], int, int, bool], None]
+
+
+@functools.lru_cache(maxsize=None)
+def get_version() -> str:
+    # reading the package metadata is slow, only --version needs it
+    if sys.version_info >= (3, 8):
+        import importlib.metadata as importlib_metadata
+    else:
+        import importlib_metadata
+    return importlib_metadata.version("wordguess")
+
+
+def __getattr__(name: str) -> Any:
+    # wordguess.version is looked up on first use
+    if name == "version":
+        return get_version()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def clear_screen() -> None:
@@ -40,17 +77,81 @@ class Color:
     reset = "\033[m"
 
 
-def load_words(min_length: int, max_length: int) -> List[str]:
-    # load words from file return list of capitalized words
-    words = []
-    data = importlib.resources.read_text("wordguess", WORD_LIST_FILE)
-    for w in data.split():
-        if min_length <= len(w) <= max_length:
-            words.append(w)
-
+def open_word_index(wordlist: Optional[str] = None
+                    ) -> Union[compact.CompactWordList, List[str]]:
+    # every word, shortest first, memory mapped from the index when possible,
+    # from the wordlist file if given or the bundled list
+    if wordlist is not None:
+        from wordguess import dictionaries
+        return dictionaries.open_word_list(wordlist)
+    source = os.path.join(os.path.dirname(__file__), WORD_LIST_FILE)
+    stamp = index.source_stamp(source)
+    path = index.index_path(WORD_LIST_FILE)
+    words = index.open_index(path, stamp)
+    if words is None:
+        # only needed to build the index, the first run after an install
+        import importlib.resources
+        from wordguess import ingest
+        data = importlib.resources.read_text("wordguess", WORD_LIST_FILE)
+        buckets = index.bucket_words(ingest.clean(data.split()))
+        try:
+            index.write_index(path, buckets, stamp)
+        except OSError:
+            pass  # read-only cache, use the in memory buckets this time
+        words = index.open_index(path, stamp)
+        if words is None:
+            return index.select(buckets, 0, max(buckets, default=0))
     return words
 
 
+def open_alphabet(wordlist: Optional[str] = None) -> engine.Alphabet:
+    # the letters of the wordlist file if given or of the bundled list
+    if wordlist is not None:
+        from wordguess import dictionaries
+        return dictionaries.open_alphabet(wordlist)
+    return engine.ENGLISH
+
+
+def word_index_path(wordlist: Optional[str] = None) -> str:
+    # the index file open_word_index() reads
+    if wordlist is not None:
+        from wordguess import dictionaries
+        return dictionaries.index_path(wordlist)
+    return index.index_path(WORD_LIST_FILE)
+
+
+def open_words(min_length: int,
+               max_length: int,
+               tier: Optional[str] = None,
+               wordlist: Optional[str] = None) -> Sequence[str]:
+    # words in the length range, only the words of a difficulty tier
+    # (easy, medium or hard) when tier is given
+    words = open_word_index(wordlist)
+    if tier is not None:
+        from wordguess import difficulty
+        return difficulty.open_tier(words, word_index_path(wordlist),
+                                    min_length, max_length, tier,
+                                    open_alphabet(wordlist))
+    if isinstance(words, list):
+        return [x for x in words if min_length <= len(x) <= max_length]
+    return words.length_range(min_length, max_length)
+
+
+def load_words(min_length: int,
+               max_length: int,
+               tier: Optional[str] = None,
+               wordlist: Optional[str] = None) -> List[str]:
+    # load words from the length index return list of capitalized words
+    return list(open_words(min_length, max_length, tier, wordlist))
+
+
+def no_words_error(args: argparse.Namespace) -> str:
+    # the error for a word list with no words to play
+    difficulty = "" if args.difficulty is None else f"{args.difficulty} "
+    return (f"Error no {difficulty}words between {args.min} and "
+            f"{args.max} letters")
+
+
 def setup_word(word: str) -> Tuple[List[str], List[str]]:
     # split word into letters, make a blank word using _ for the letter
     split_word = [x for x in word]
@@ -79,95 +180,131 @@ def display(letters: List[str],
 def play(word: str,
          num_wrong_guesses: int,
          color: bool,
-         guess_word: bool) -> int:
-    split_word, blank_word = setup_word(word)
-    letters = [x for x in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"]
-    num_of_guesses = 0
-    while num_of_guesses < num_wrong_guesses:
-        display(letters, blank_word, num_of_guesses, num_wrong_guesses, color)
-        user_input = input("Enter a letter or 'quit' to quit: ").upper()
-
-        if user_input == "QUIT":
+         guess_word: bool,
+         hints: Optional["solver.Solver"] = None,
+         show: Display = display,
+         pause: Optional[timing.Pause] = None,
+         history_log: Optional[history.HistoryWriter] = None,
+         metrics: Optional["instrument.Metrics"] = None,
+         alphabet: engine.Alphabet = engine.ENGLISH,
+         profile: Optional["recommend.Profile"] = None) -> int:
+    # show draws the board, display() or a render.Renderer, the finished
+    # game is recorded in history_log and counted and timed in metrics, and
+    # recorded in profile if it was won or lost
+    if pause is None:
+        pause = timing.Pause(SLEEP_TIME)
+    game = engine.GameState(word, num_wrong_guesses, guess_word, alphabet)
+    read = input
+    guess = game.guess
+    if metrics is not None:
+        metrics.count("games")
+        show = metrics.timed("display", show)
+        read = metrics.timed("input", read)
+        guess = metrics.timed("guess", guess)
+    guesses: List[str] = []
+    started = time.time()
+    if hints is None:
+        prompt = "Enter a letter or 'quit' to quit: "
+    else:
+        prompt = "Enter a letter, '?' for a hint or 'quit' to quit: "
+        candidates = hints.start(len(word))
+    while game.status == engine.Status.playing:
+        show(game.letters, game.blank_word,
+             game.wrong_guesses, num_wrong_guesses, color)
+        raw_input = read(prompt)
+        # in the letters of the alphabet, upper() would turn ß into SS
+        user_input = alphabet.parse(raw_input)
+        if user_input is None:
+            user_input = raw_input.upper()
+
+        if user_input.upper() == "QUIT":
+            if history_log is not None:
+                history_log.record_game(game, guesses, history.QUIT,
+                                        started, time.time() - started)
+            if metrics is not None:
+                metrics.count(history.QUIT)
             print("Quitting")
             return -1
 
-        elif not user_input.isalpha():
+        if hints is not None and user_input == "?":
+            if metrics is not None:
+                metrics.count("hints")
+            candidates = hints.narrow(candidates, game.blank_word,
+                                      game.missed)
+            letter = hints.best_letter(candidates)
             if color:
-                print(f"{Color.red}Invalid input please try again{Color.reset}")
+                print(f"{Color.green}Hint: try the letter "
+                      f"{letter}{Color.reset}")
             else:
-                print("Invalid input please try again")
-            time.sleep(SLEEP_TIME)
+                print(f"Hint: try the letter {letter}")
+            pause()
             continue
 
-        elif len(user_input) > 1:
-            if guess_word and user_input == word:
-                display(letters, split_word,
-                        num_of_guesses, num_wrong_guesses, color)
-                msg = "You Won! You guessed the word"
-                if color:
-                    print(f"{Color.green}{msg}{Color.reset}")
-                else:
-                    print(msg)
-                time.sleep(SLEEP_TIME)
-                return 0
-            elif guess_word and user_input != word:
-                print(f"{Color.yellow}{user_input} is not the correct "
-                      f"word{Color.reset}")
-                time.sleep(SLEEP_TIME)
-                num_of_guesses += 1
+        result = guess(user_input)
+        if result != engine.Result.invalid and \
+                result != engine.Result.already_guessed:
+            guesses.append(user_input)
+        if metrics is not None:
+            if result == engine.Result.invalid:
+                metrics.count("invalid_inputs")
+            elif result == engine.Result.already_guessed:
+                metrics.count("repeated_guesses")
             else:
-                if color:
-                    print(
-                        f"{Color.red}Invalid input please try "
-                        f"again{Color.reset}")
-                else:
-                    print("Invalid input please try again")
-                time.sleep(SLEEP_TIME)
-                continue
+                metrics.count("guesses")
+            if game.status != engine.Status.playing:
+                metrics.count(game.status)
+        if game.status != engine.Status.playing:
+            if history_log is not None:
+                history_log.record_game(game, guesses, game.status,
+                                        started, time.time() - started)
+            if profile is not None:
+                profile.record_game(game)
+
+        if result == engine.Result.invalid:
+            if color:
+                print(f"{Color.red}Invalid input please try again{Color.reset}")
+            else:
+                print("Invalid input please try again")
 
-        elif user_input not in letters:  # already been guessed
+        elif result == engine.Result.already_guessed:
             print(f"{Color.yellow}Letter already been picked try "
                   f"again{Color.reset}")
-            time.sleep(SLEEP_TIME)
+
+        elif result == engine.Result.word_wrong:
+            print(f"{Color.yellow}{user_input} is not the correct "
+                  f"word{Color.reset}")
+
+        elif result == engine.Result.miss:
+            print(f"{Color.yellow}Letter {user_input} not in the "
+                  f"word{Color.reset}")
+
+        elif game.status == engine.Status.won:
+            show(game.letters, game.blank_word,
+                 game.wrong_guesses, num_wrong_guesses, color)
+            if result == engine.Result.word_correct:
+                msg = "You Won! You guessed the word"
+            else:
+                msg = "You Won! You got the word"
+            if color:
+                print(f"{Color.green}{msg}{Color.reset}")
+            else:
+                print(msg)
+            pause()
+            return 0
+
+        else:  # letter found, keep going
             continue
 
-        else:
-            # replace letter with space
-            for i, letter in enumerate(letters):
-                if letter == user_input:
-                    letters[i] = " "
-                    break
+        pause()
 
-            if user_input in split_word:
-                # replace blank with letter
-                for i, letter in enumerate(split_word):
-                    if letter == user_input:
-                        blank_word[i] = letter
-
-                if blank_word == split_word:
-                    display(letters, blank_word,
-                            num_of_guesses, num_wrong_guesses, color)
-                    msg = "You Won! You got the word"
-                    if color:
-                        print(f"{Color.green}{msg}{Color.reset}")
-                    else:
-                        print(msg)
-                    time.sleep(SLEEP_TIME)
-                    return 0
-
-            else:  # not in word
-                print(f"{Color.yellow}Letter {user_input} not in the "
-                      f"word{Color.reset}")
-                time.sleep(SLEEP_TIME)
-                num_of_guesses += 1
-
-    display(letters, blank_word, num_of_guesses, num_wrong_guesses, color)
+    show(game.letters, game.blank_word,
+         game.wrong_guesses, num_wrong_guesses, color)
     if color:
         print(f"{Color.red}Out of guesses{Color.reset}")
     else:
         print("Out of guesses")
     print(f"The word was  {word}")
-    time.sleep(SLEEP_TIME)
+    pause()
     return 0
 
 
@@ -187,6 +324,40 @@ def positive_int(value: str) -> int:
     return int_value
 
 
+def wrong_guesses_int(value: str) -> int:
+    """
+    Used by argparse.
+    Checks to see if the value is a number of wrong guesses the history
+    log can record, 1 to 255.
+    """
+    msg = (f"{value} is an invalid number of wrong guesses between 1 and "
+           f"{history.MAX_WRONG_GUESSES}")
+    try:
+        int_value = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(msg)
+    else:
+        if not 1 <= int_value <= history.MAX_WRONG_GUESSES:
+            raise argparse.ArgumentTypeError(msg)
+    return int_value
+
+
+def non_negative_float(value: str) -> float:
+    """
+    Used by argparse.
+    Checks to see if the value is a number zero or larger.
+    """
+    msg = f"{value} is an invalid non-negative number"
+    try:
+        float_value = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(msg)
+    else:
+        if not float_value >= 0 or float_value == float("inf"):
+            raise argparse.ArgumentTypeError(msg)
+    return float_value
+
+
 def int_between_4_and_15(value: str) -> int:
     """
     Used by argparse. Checks to see if the value is between 4 and 15
@@ -201,31 +372,195 @@ def int_between_4_and_15(value: str) -> int:
         raise argparse.ArgumentTypeError(msg)
 
 
+class VersionAction(argparse.Action):
+    """
+    Used by argparse.
+    Prints the version and exits, like action="version" but the version
+    is only looked up when the option is given.
+    """
+    def __init__(self,
+                 option_strings: Sequence[str],
+                 dest: str = argparse.SUPPRESS,
+                 default: str = argparse.SUPPRESS,
+                 help: str = "show program's version number and exit"
+                 ) -> None:
+        super().__init__(option_strings=option_strings, dest=dest,
+                         default=default, nargs=0, help=help)
+
+    def __call__(self,
+                 parser: argparse.ArgumentParser,
+                 namespace: argparse.Namespace,
+                 values: Any,
+                 option_string: Optional[str] = None) -> None:
+        print(get_version())
+        parser.exit()
+
+
+def game_options(suppress: bool = False) -> argparse.ArgumentParser:
+    # the options of a game, the parent of the game and of the commands
+    # that play games.  With suppress the options have no defaults, so
+    # given after the command they override the ones before it but left
+    # out they don't overwrite them.
+    def default(value: Any) -> Any:
+        return argparse.SUPPRESS if suppress else value
+
+    options = argparse.ArgumentParser(add_help=False)
+    options.add_argument("-W", dest="num_wrong_guesses",
+                         type=wrong_guesses_int,
+                         default=default(DEFAULT_NUM_WRONG_GUESSES),
+                         help="Number of wrong guess, at most "
+                              f"{history.MAX_WRONG_GUESSES} default: "
+                              f"{DEFAULT_NUM_WRONG_GUESSES}")
+    options.add_argument("--max", type=int_between_4_and_15,
+                         default=default(DEFAULT_MAX_LENGTH),
+                         help="Max word length between 4 and 15")
+    options.add_argument("--min", type=int_between_4_and_15,
+                         default=default(DEFAULT_MIN_LENGTH),
+                         help="Min word length between 4 and 15")
+    options.add_argument("--difficulty", default=default(None),
+                         choices=["easy", "medium", "hard"],
+                         help="Only words of this difficulty")
+    source = options.add_mutually_exclusive_group()
+    source.add_argument("--wordlist", metavar="PATH", default=default(None),
+                        help="Play with the words of a text file, one per "
+                             "line, or a compact dictionary")
+    source.add_argument("--dictionary", metavar="NAME", default=default(None),
+                        help="Play with an installed dictionary default: "
+                             "english")
+    return options
+
+
 def argument_parser(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     # word_length = argparse_custom_types.int_range(4, 16)
-    parser = argparse.ArgumentParser()
-    parser.add_argument("-W", dest="num_wrong_guesses",
-                        type=positive_int,
-                        default=DEFAULT_NUM_WRONG_GUESSES,
-                        help="Number of wrong guess default: %(default)s")
+    command_options = game_options(suppress=True)
+    parser = argparse.ArgumentParser(parents=[game_options()])
     parser.add_argument("-s", dest="single_play", action="store_true",
                         help="single play then exit")
     parser.add_argument("-a", dest="auto_play", action="store_true",
                         help="continues game play until 'quit' is entered")
-    parser.add_argument("--max", type=int_between_4_and_15,
-                        default=DEFAULT_MAX_LENGTH,
-                        help="Max word length between 4 and 15")
-    parser.add_argument("--min", type=int_between_4_and_15,
-                        default=DEFAULT_MIN_LENGTH,
-                        help="Min word length between 4 and 15")
     parser.add_argument("-n", "--no_guess_word", dest="guess_word",
                         action="store_false",
                         help="Do not allow guessing of the whole word")
     parser.add_argument("--no_color", action="store_false",
                         help="No color mode")
-    parser.add_argument("--version", action="version", version=version)
-
-    return parser.parse_args(argv)
+    parser.add_argument("--hints", action="store_true",
+                        help="Allow '?' to show a suggested letter")
+    parser.add_argument("--solver_backend", default="python",
+                        choices=["python", "numpy"],
+                        help="Solver for the hints, numpy needs NumPy "
+                             "default: %(default)s")
+    parser.add_argument("--adaptive", action="store_true",
+                        help="Pick words as hard as the player's recent "
+                             "games show they can manage")
+    parser.add_argument("--seed", type=int,
+                        help="Random seed for a repeatable order of words")
+    parser.add_argument("--no_history", dest="history", action="store_false",
+                        help="Do not record games in the history log")
+    parser.add_argument("--delay", type=non_negative_float,
+                        help="Seconds to show a message, a key press skips "
+                             f"it default: {SLEEP_TIME}, 0 for serve")
+    parser.add_argument("--metrics", metavar="FILE",
+                        help="Append the game counters and stage timings "
+                             "of the session to FILE as a JSON line")
+    parser.add_argument("--batch", nargs="?", const="-", metavar="FILE",
+                        help="Play the word and guesses on each line of FILE "
+                             "or stdin, write a JSON line for each game")
+    parser.add_argument("--profile", metavar="FILE",
+                        help="Run under cProfile and tracemalloc, save the "
+                             "results to FILE and print a summary")
+    parser.add_argument("--version", action=VersionAction)
+
+    commands = parser.add_subparsers(dest="command")
+    simulate_parser = commands.add_parser(
+        "simulate", parents=[command_options],
+        help="play games automatically and report the results")
+    simulate_parser.add_argument("-g", "--games", type=positive_int,
+                                 default=DEFAULT_NUM_GAMES,
+                                 help="Number of games default: "
+                                      "%(default)s")
+    simulate_parser.add_argument("--strategy", default="frequency",
+                                 choices=["frequency", "random", "entropy",
+                                          "solver"],
+                                 help="Guessing strategy default: "
+                                      "%(default)s")
+    simulate_parser.add_argument("-j", "--workers", type=positive_int,
+                                 default=os.cpu_count() or 1,
+                                 help="Number of worker processes default: "
+                                      "%(default)s")
+    simulate_parser.add_argument("--chunk_size", type=positive_int,
+                                 default=DEFAULT_CHUNK_SIZE,
+                                 help="Games per work unit default: "
+                                      "%(default)s")
+    simulate_parser.add_argument("--solver_backend",
+                                 default=argparse.SUPPRESS,
+                                 choices=["python", "numpy"],
+                                 help="Solver for the solver strategy "
+                                      "default: python")
+    simulate_parser.add_argument("--seed", type=int,
+                                 default=argparse.SUPPRESS,
+                                 help="Random seed for repeatable runs")
+
+    serve_parser = commands.add_parser(
+        "serve", parents=[command_options],
+        help="serve games to many players over TCP")
+    serve_parser.add_argument("--host", default=DEFAULT_HOST,
+                              help="Address to listen on default: "
+                                   "%(default)s")
+    serve_parser.add_argument("--port", type=int, default=DEFAULT_PORT,
+                              help="Port to listen on default: %(default)s")
+    serve_parser.add_argument("--delay", type=non_negative_float,
+                              default=argparse.SUPPRESS,
+                              help="Seconds to pause after a message "
+                                   "default: 0")
+    serve_parser.add_argument("--seed", type=int, default=argparse.SUPPRESS,
+                              help="Random seed for repeatable sessions "
+                                   "and matches")
+    serve_parser.add_argument("--match", type=positive_int, metavar="PLAYERS",
+                              help="Race players in matches of this many "
+                                   "on the same words")
+    serve_parser.add_argument("--rounds", type=positive_int, default=1,
+                              help="Words in a match default: %(default)s")
+    serve_parser.add_argument("--time_limit", type=non_negative_float,
+                              default=0,
+                              help="Seconds a match lasts, 0 for no limit "
+                                   "default: %(default)s")
+
+    stats_parser = commands.add_parser(
+        "stats", help="show totals for the games in the history log")
+    stats_parser.add_argument("--log", dest="history_file",
+                              help="History log to read default: "
+                                   "the player's log")
+
+    replay_parser = commands.add_parser(
+        "replay", help="play recorded games again and check the outcomes")
+    replay_parser.add_argument("logs", nargs="*", metavar="LOG",
+                               help="History logs to replay default: "
+                                    "the player's log")
+    replay_parser.add_argument("-j", "--workers", type=positive_int,
+                               default=os.cpu_count() or 1,
+                               help="Number of worker processes default: "
+                                    "%(default)s")
+    replay_parser.add_argument("--min_rate", type=non_negative_float,
+                               help="Fail if fewer games per second are "
+                                    "replayed")
+
+    query_parser = commands.add_parser(
+        "query", help="list the words that fit a pattern like _A__E")
+    query_parser.add_argument("pattern", metavar="PATTERN",
+                              help="Letters and _ for any letter")
+    query_parser.add_argument("-x", "--exclude", default="",
+                              metavar="LETTERS",
+                              help="Letters the words must not contain")
+    query_parser.add_argument("--limit", type=positive_int,
+                              help="Show at most this many words")
+    query_parser.add_argument("--count", action="store_true",
+                              help="Only show the number of words")
+
+    args = parser.parse_args(argv)
+    if args.delay is None:
+        # the server doesn't pause unless asked to
+        args.delay = 0 if args.command == "serve" else SLEEP_TIME
+    return args
 
 
 def main(argv: Optional[Sequence[str]] = None) -> int:
@@ -233,24 +568,135 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     if args.min > args.max:
         print("Error min can't be larger than max")
         return 1
-    word_list = load_words(args.min, args.max)
-    while True:
-        rand_word = random.choice(word_list)
-        return_value = play(rand_word,
-                            args.num_wrong_guesses,
-                            args.no_color,
-                            args.guess_word)
-        if args.single_play or args.auto_play and return_value == -1:
-            break
-        elif args.auto_play:
-            continue
-        else:
-            print()
-            user_input = input("Would you like to play again? (Yes or no): ")
-            if user_input.upper() in ["YES", "Y"]:
-                continue
+    if args.dictionary is not None:
+        from wordguess import dictionaries
+        try:
+            args.wordlist = dictionaries.find(args.dictionary)
+        except ValueError as e:
+            print(f"Error {e}")
+            return 1
+    if args.wordlist is not None:
+        if not os.path.isfile(args.wordlist):
+            print(f"Error no word list {args.wordlist}")
+            return 1
+        try:
+            open_alphabet(args.wordlist)
+        except (OSError, ValueError) as e:
+            print(f"Error bad alphabet for {args.wordlist}: {e}")
+            return 1
+        try:
+            words = open_word_index(args.wordlist)
+        except (OSError, UnicodeDecodeError, ValueError) as e:
+            print(f"Error can't read word list {args.wordlist}: {e}")
+            return 1
+        if isinstance(words, compact.CompactWordList):
+            words.close()  # opened again by the command or game
+    if args.profile:
+        from wordguess import instrument
+        with instrument.profile(args.profile):
+            return run(args)
+    return run(args)
+
+
+def run(args: argparse.Namespace) -> int:
+    # the command or game session chosen by the arguments
+    if args.command == "simulate":
+        from wordguess import simulate
+        return simulate.run(args)
+    elif args.command == "serve":
+        from wordguess import server
+        return server.run(args)
+    elif args.command == "stats":
+        return history.run(args)
+    elif args.command == "replay":
+        from wordguess import replay
+        return replay.run(args)
+    elif args.command == "query":
+        from wordguess import query
+        return query.run(args)
+    elif args.batch is not None:
+        from wordguess import batch
+        return batch.run(args)
+    metrics = None
+    if args.metrics or args.profile:
+        from wordguess import instrument
+        sink = None
+        if args.metrics:
+            sink = instrument.JsonLinesSink(args.metrics)
+        metrics = instrument.Metrics(sink)
+        word_list = metrics.timed("load_words", open_words)(
+            args.min, args.max, args.difficulty, args.wordlist)
+    else:
+        word_list = open_words(args.min, args.max, args.difficulty,
+                               args.wordlist)
+    if not word_list:
+        print(no_words_error(args))
+        return 1
+    alphabet = open_alphabet(args.wordlist)
+    hints = None
+    if args.hints:
+        from wordguess import solver
+        hints = solver.Solver(word_list, backend=args.solver_backend,
+                              alphabet=alphabet)
+    show: Display = display
+    if sys.stdout.isatty() and sys.platform != "win32":
+        # redraw in place instead of clearing the screen every guess
+        from wordguess import render
+        show = render.Renderer(sys.stdout)
+    pause = timing.Pause(args.delay)
+    # every word once before any repeats
+    words = schedule.ShuffleBag(word_list, random.Random(args.seed))
+    recommender = None
+    profile = None
+    if args.adaptive:
+        from wordguess import recommend
+        recommender = recommend.open_recommender(
+            args.min, args.max, args.difficulty, args.wordlist,
+            random.Random(args.seed))
+        try:
+            profile = recommend.read_profile(history.history_path())
+        except (OSError, ValueError):
+            profile = recommend.Profile()  # no log to start from
+    history_log = None
+    if args.history:
+        history_log = history.HistoryWriter(history.history_path())
+    try:
+        while True:
+            if recommender is not None and profile is not None:
+                word = recommender.pick(profile)
             else:
+                word = words.draw()
+            return_value = play(word,
+                                args.num_wrong_guesses,
+                                args.no_color,
+                                args.guess_word,
+                                hints,
+                                show,
+                                pause,
+                                history_log,
+                                metrics,
+                                alphabet,
+                                profile)
+            if args.single_play or args.auto_play and return_value == -1:
                 break
+            elif args.auto_play:
+                continue
+            else:
+                print()
+                user_input = input("Would you like to play again? "
+                                   "(Yes or no): ")
+                if user_input.upper() in ["YES", "Y"]:
+                    continue
+                else:
+                    break
+    finally:
+        if history_log is not None:
+            history_log.close()
+        if metrics is not None:
+            metrics.close()
+            if args.profile:
+                for line in metrics.report():
+                    print(line, file=sys.stderr)
     return 0
 
 